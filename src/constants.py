@@ -55,6 +55,13 @@ ADVANCED_SETTINGS = {
     # 배치 처리 설정
     "scan_batch_size": 100,
     "process_batch_size": 10,
+    # 스캔 설정
+    "scan_threads": 8,  # 폴더 목록을 동시에 조회할 스레드 수
+    "scan_index": True,  # 바뀌지 않은 폴더는 스캔 색인 사용
+    "scan_exclude_patterns": [".git", "node_modules", "__pycache__"],  # 제외할 폴더
+    "scan_prune_destinations": True,  # 규칙 대상 폴더는 검색하지 않음
+    "scan_max_depth": 0,  # 하위 폴더 검색 단계 (0 = 제한 없음)
+    "scan_filter_strategy": "metadata_first",  # 'metadata_first' or 'name_first'
     # 검증 설정
     "verify_copy": True,
     "verify_method": "quick",  # 'quick' or 'full'
@@ -64,7 +71,8 @@ ADVANCED_SETTINGS = {
     "network_optimize": True,
     "network_chunk_size": 50 * 1024 * 1024,  # 50MB
     "network_timeout": 120,
-    # 청크 크기 (파일 크기별)
+    # 청크 크기 (파일 크기별, 대상 장치에서 측정한 값이 없을 때 시작 값)
+    "adaptive_chunk_size": True,  # 복사하면서 처리량을 재서 장치별 청크 크기 조절
     "chunk_sizes": {
         "tiny": 512 * 1024,  # < 10MB
         "small": 1024 * 1024,  # < 100MB
@@ -1,6 +1,8 @@
 # core 패키지 초기화
+from .compiled_rules import CompiledRuleSet
 from .file_matcher import FileMatcher
+from .file_scanner import DirectoryScanner, ScanRecord
 from .file_processor import FileProcessor
 from .rule_manager import RuleManager
 
-__all__ = ['FileMatcher', 'FileProcessor', 'RuleManager']
\ No newline at end of file
+__all__ = ['CompiledRuleSet', 'FileMatcher', 'DirectoryScanner', 'ScanRecord', 'FileProcessor', 'RuleManager']
\ No newline at end of file
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+컴파일된 규칙 집합 (파일명 한 번 평가로 첫 매칭 규칙 찾기)
+"""
+
+import hashlib
+import json
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.core.rule_index import AhoCorasickIndex, KeywordTrie, RegexIndex
+
+
+class CompiledRuleSet:
+    """컴파일된 규칙 집합
+
+    활성 규칙 딕셔너리를 한 번만 분석해서 키워드 소문자화, 매칭 모드 분류를
+    미리 해 둔다. 규칙 딕셔너리의 순서가 곧 우선순위이며, match()는
+    FileMatcher.match_file을 규칙 순서대로 돌리는 기존 방식과 같은 결과를 낸다.
+    """
+
+    def __init__(
+        self,
+        rules: Dict,
+        log_callback: Optional[Callable] = None,
+        combine_regex: bool = True,
+    ):
+        """초기화
+
+        Args:
+            rules: 규칙 딕셔너리 {키워드: {"dest", "match_mode", ...}}
+            log_callback: 잘못된 정규식 규칙을 알릴 로그 콜백
+            combine_regex: 정규식 규칙을 하나의 alternation으로 합칠지 여부
+        """
+        # 우선순위(=딕셔너리 순서) 순서의 (키워드, 대상폴더, 매칭모드)
+        self.rules: List[Tuple[str, str, str]] = []
+        self._signature = None
+
+        # "포함" 규칙은 Aho-Corasick 오토마톤으로 한 번에 검색
+        self._contains = AhoCorasickIndex()
+
+        # "시작"은 접두사 트라이, "끝"은 (확장자 제외 파일명의) 접미사 트라이
+        self._starts = KeywordTrie()
+        self._ends = KeywordTrie(reverse=True)
+
+        # "정확히"는 소문자 키워드 -> 가장 높은 우선순위 딕셔너리 (한 번 조회)
+        # match_file과 같은 결과를 내도록 casefold() 대신 lower()로 정규화
+        self._exact: Dict[str, int] = {}
+
+        # "정규식"은 한 번만 컴파일 (가능하면 하나의 alternation으로 합침)
+        self._regex = RegexIndex(combine=combine_regex)
+
+        indexes = {
+            "포함": self._contains,
+            "시작": self._starts,
+            "끝": self._ends,
+        }
+
+        for keyword, rule_data in rules.items():
+            if not isinstance(rule_data, dict):
+                continue
+
+            dest = rule_data.get("dest", "")
+            match_mode = rule_data.get("match_mode", "포함")
+            priority = len(self.rules)
+            self.rules.append((keyword, dest, match_mode))
+
+            if match_mode in indexes:
+                indexes[match_mode].add(keyword.lower(), priority)
+            elif match_mode == "정확히":
+                self._exact.setdefault(keyword.lower(), priority)
+            elif match_mode == "정규식":
+                self._regex.add(keyword, priority)
+            # 알 수 없는 매칭 모드는 기존과 같이 절대 매칭되지 않음
+
+        self._contains.build()
+        self._regex.build()
+
+        # 잘못된 정규식은 파일마다가 아니라 컴파일할 때 한 번만 알림
+        if log_callback:
+            for keyword, error in self.invalid_rules:
+                log_callback(f"⚠️ 잘못된 정규식 규칙은 무시됩니다: {keyword} ({error})")
+
+    @property
+    def invalid_rules(self) -> List[Tuple[str, str]]:
+        """컴파일에 실패한 정규식 규칙 [(키워드, 오류 메시지)]"""
+        return [(pattern, error) for _, pattern, error in self._regex.invalid]
+
+    @property
+    def signature(self) -> str:
+        """규칙 내용과 순서의 서명 (저장된 매칭 결과가 유효한지 확인용)"""
+        if self._signature is None:
+            data = json.dumps(self.rules, ensure_ascii=False)
+            self._signature = hashlib.sha1(data.encode("utf-8")).hexdigest()
+        return self._signature
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def first_match_index(self, filename: str) -> int:
+        """첫 매칭 규칙의 우선순위 반환
+
+        Args:
+            filename: 파일명 (전체 경로 가능)
+
+        Returns:
+            매칭된 규칙의 인덱스 (없으면 -1)
+        """
+        base_filename = os.path.basename(filename)
+        lower_name = base_filename.lower()
+        name_without_ext = os.path.splitext(base_filename)[0].lower()
+
+        # 지금까지 찾은 가장 높은 우선순위. 이보다 뒤의 규칙은 볼 필요가 없음
+        best = self._exact.get(name_without_ext, len(self.rules))
+
+        if len(self._contains):
+            priority = self._contains.first_match(lower_name)
+            if 0 <= priority < best:
+                best = priority
+
+        if len(self._starts):
+            priority = self._starts.first_match(lower_name)
+            if 0 <= priority < best:
+                best = priority
+
+        if len(self._ends):
+            priority = self._ends.first_match(name_without_ext)
+            if 0 <= priority < best:
+                best = priority
+
+        if len(self._regex):
+            priority = self._regex.first_match(base_filename, best)
+            if priority >= 0:
+                best = priority
+
+        return best if best < len(self.rules) else -1
+
+    def match(self, filename: str) -> Optional[Tuple[str, str, str]]:
+        """첫 매칭 규칙 반환
+
+        Args:
+            filename: 파일명 (전체 경로 가능)
+
+        Returns:
+            (키워드, 대상폴더, 매칭모드) 튜플 (없으면 None)
+        """
+        index = self.first_match_index(filename)
+        if index < 0:
+            return None
+        return self.rules[index]
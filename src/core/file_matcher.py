@@ -7,13 +7,27 @@
 
 import os
 import re
-from typing import Generator, Tuple, Dict
-from src.constants import FILE_ATTRIBUTE_HIDDEN, FILE_ATTRIBUTE_SYSTEM
+from typing import Callable, Dict, Generator, List, Optional, Tuple
+from src.constants import (
+    ADVANCED_SETTINGS,
+    FILE_ATTRIBUTE_HIDDEN,
+    FILE_ATTRIBUTE_SYSTEM,
+)
+from src.core.compiled_rules import CompiledRuleSet
+from src.core.file_scanner import DirectoryScanner, ScanRecord
+from src.utils.device_profile import get_device_profile
 
 
 class FileMatcher:
     """파일 매칭 클래스"""
 
+    # 파일 필터링 순서
+    # - 메타데이터 우선: 파일 종류/숨김 여부를 먼저 확인하고 규칙 매칭
+    # - 파일명 우선: 규칙 매칭을 먼저 하고 매칭된 파일만 종류/숨김 여부 확인
+    METADATA_FIRST = "metadata_first"
+    NAME_FIRST = "name_first"
+    FILTER_STRATEGIES = (METADATA_FIRST, NAME_FIRST)
+
     @staticmethod
     def match_file(filename: str, keyword: str, match_mode: str) -> bool:
         """파일명과 키워드 매칭
@@ -82,17 +96,61 @@ class FileMatcher:
         return False
 
     def find_matching_files_generator(
-        self, source: str, rules: Dict, include_subfolders: bool = True
+        self, source: str, rules: Dict, include_subfolders: bool = True, **scan_options
     ) -> Generator[Tuple[str, str, str, str], None, None]:
         """매칭되는 파일을 찾아 제너레이터로 반환
 
         Args:
             source: 검색할 소스 디렉토리
-            rules: 활성화된 규칙 딕셔너리
+            rules: 활성화된 규칙 딕셔너리 (또는 CompiledRuleSet)
             include_subfolders: 하위 폴더 포함 여부
+            **scan_options: find_matching_records의 스캔 옵션
+                (exclude_patterns, max_depth, prune_destinations 등)
 
         Yields:
             (파일경로, 대상폴더, 키워드, 매칭모드) 튜플
+            (하위 폴더 포함 시 폴더 조회가 끝나는 순서대로 반환)
+        """
+        for record in self.find_matching_records(
+            source, rules, include_subfolders, **scan_options
+        ):
+            yield record[:4]
+
+    def find_matching_records(
+        self,
+        source: str,
+        rules: Dict,
+        include_subfolders: bool = True,
+        progress_callback: Optional[Callable] = None,
+        scan_index=None,
+        exclude_patterns: Optional[List[str]] = None,
+        max_depth: Optional[int] = None,
+        prune_destinations: bool = False,
+        filter_strategy: str = METADATA_FIRST,
+    ) -> Generator[ScanRecord, None, None]:
+        """매칭되는 파일을 크기/수정시간/inode와 함께 반환
+
+        stat 정보는 스캔 중 DirEntry에서 가져오므로 이후 단계에서
+        파일마다 다시 stat할 필요가 없다.
+
+        Args:
+            source: 검색할 소스 디렉토리
+            rules: 활성화된 규칙 딕셔너리 (또는 CompiledRuleSet)
+            include_subfolders: 하위 폴더 포함 여부
+            progress_callback: 스캔 진행 콜백
+                (찾은 파일 수, 완료한 폴더 수, 발견한 폴더 수).
+                색인 없이 NAME_FIRST면 찾은 파일 수는 이름이 매칭된 파일 수
+            scan_index: 스캔 색인 (ScanIndex). 있으면 수정시간이 그대로인 폴더는
+                다시 조회하지 않고, 규칙도 그대로면 저장된 매칭 결과를 사용
+            exclude_patterns: 내려가지 않을 폴더의 glob 패턴
+            max_depth: 내려갈 하위 폴더 단계 수 (None 또는 0이면 제한 없음)
+            prune_destinations: 규칙의 대상 폴더로 내려가지 않을지 여부
+                (이미 정리된 파일을 다시 찾지 않도록)
+            filter_strategy: 파일 필터링 순서 (METADATA_FIRST 또는 NAME_FIRST).
+                색인을 쓰면 전체 파일 목록이 필요하므로 항상 메타데이터 우선
+
+        Yields:
+            ScanRecord
         """
 
         if not source or not os.path.exists(source):
@@ -101,47 +159,123 @@ class FileMatcher:
         if not rules:
             return
 
-        if include_subfolders:
-            # 하위 폴더 포함해서 검색
-            for root, dirs, files in os.walk(source):
-                for file in files:
-                    file_path = os.path.join(root, file)
+        if filter_strategy not in self.FILTER_STRATEGIES:
+            raise ValueError(f"알 수 없는 필터링 순서: {filter_strategy}")
 
-                    # 시스템 파일은 건너뛰기
-                    if self.is_system_file(file_path):
-                        continue
+        # 규칙은 스캔마다 한 번만 컴파일
+        compiled = (
+            rules if isinstance(rules, CompiledRuleSet) else CompiledRuleSet(rules)
+        )
 
-                    # 규칙과 매칭 확인
-                    for keyword, rule_data in rules.items():
-                        dest = rule_data.get("dest", "")
-                        match_mode = rule_data.get("match_mode", "포함")
+        # 동시 조회 수는 설정값 이하에서 소스 장치에 맞춤 (회전식 디스크는 줄임)
+        scan_workers = get_device_profile(source).scan_workers(
+            ADVANCED_SETTINGS.get("scan_threads", 8)
+        )
 
-                        if self.match_file(file_path, keyword, match_mode):
-                            yield (file_path, dest, keyword, match_mode)
-                            break
+        scanner = DirectoryScanner(
+            max_workers=scan_workers,
+            progress_callback=progress_callback,
+            exclude_patterns=exclude_patterns,
+            prune_paths=(
+                [dest for _, dest, _ in compiled.rules] if prune_destinations else None
+            ),
+            max_depth=max_depth,
+            # 매칭과 매칭된 파일의 lstat은 폴더 조회 스레드에서
+            # (컴파일된 규칙은 읽기만 하므로 여러 스레드에서 호출해도 안전)
+            matcher=compiled.match,
+            name_first=filter_strategy == self.NAME_FIRST,
+        )
 
-        else:
-            # 현재 폴더만 검색
-            try:
-                for file in os.listdir(source):
-                    file_path = os.path.join(source, file)
+        if scan_index is not None:
+            yield from self._find_matching_records_indexed(
+                scanner, source, compiled, include_subfolders, scan_index
+            )
+            return
 
-                    # 파일이 아니면 건너뛰기
-                    if not os.path.isfile(file_path):
-                        continue
+        # 폴더 목록 조회/매칭/stat은 병렬로, 파일 종류/숨김 여부는 DirEntry 정보로 확인
+        for listing in scanner.scan_directories(source, include_subfolders):
+            yield from listing.records
+
+    def _find_matching_records_indexed(
+        self, scanner, source, compiled, include_subfolders, scan_index
+    ) -> Generator[ScanRecord, None, None]:
+        """스캔 색인을 사용한 증분 검색 (색인은 이 제너레이터의 스레드에서만 사용)"""
+        signature = compiled.signature
 
-                    # 시스템 파일 건너뛰기
-                    if self.is_system_file(file_path):
+        for listing in scanner.scan_directories(
+            source, include_subfolders, scan_index.lookup
+        ):
+            if listing.mtime_ns < 0:
+                # 접근할 수 없는 폴더
+                continue
+
+            if listing.files is not None:
+                # 바뀐 폴더: 조회 스레드에서 매칭한 결과로 색인 교체
+                records = {record.path: record for record in listing.records}
+                entries = []
+                for entry in listing.files:
+                    record = records.get(entry.path)
+                    if record:
+                        entries.append(
+                            (entry.name,)
+                            + tuple(record[4:])
+                            + (record.keyword, record.dest, record.match_mode)
+                        )
+                    else:
+                        entries.append((entry.name, None, None, None, None, None, None))
+                yield from listing.records
+
+                # 수정시간을 믿을 수 없는 폴더는 -1로 저장해서 다음에 다시 조회
+                scan_index.store_directory(
+                    listing.path,
+                    -1 if listing.racy else listing.mtime_ns,
+                    listing.subdirs,
+                    entries,
+                    signature,
+                )
+
+            elif scan_index.get_signature(listing.path) == signature:
+                # 폴더와 규칙 모두 그대로: 저장된 매칭 결과 사용
+                for name, size, mtime, inode, keyword, dest, match_mode in (
+                    scan_index.get_matches(listing.path)
+                ):
+                    yield ScanRecord(
+                        os.path.join(listing.path, name),
+                        dest,
+                        keyword,
+                        match_mode,
+                        size,
+                        mtime,
+                        inode,
+                    )
+
+            else:
+                # 규칙만 바뀜: 저장된 파일명으로 다시 매칭 (새로 매칭된 파일만 stat)
+                entries = []
+                records = []
+                for name, size, mtime, inode, *_ in scan_index.get_entries(
+                    listing.path
+                ):
+                    matched = compiled.match(name)
+                    if not matched:
+                        entries.append((name, size, mtime, inode, None, None, None))
                         continue
 
-                    # 규칙과 매칭 확인
-                    for keyword, rule_data in rules.items():
-                        dest = rule_data.get("dest", "")
-                        match_mode = rule_data.get("match_mode", "포함")
+                    file_path = os.path.join(listing.path, name)
+                    if size is None:
+                        try:
+                            st = os.stat(file_path, follow_symlinks=False)
+                        except OSError:
+                            continue
+                        size, mtime, inode = st.st_size, st.st_mtime, st.st_ino
 
-                        if self.match_file(file_path, keyword, match_mode):
-                            yield (file_path, dest, keyword, match_mode)
-                            break
+                    keyword, dest, match_mode = matched
+                    entries.append((name, size, mtime, inode) + matched)
+                    records.append(
+                        ScanRecord(
+                            file_path, dest, keyword, match_mode, size, mtime, inode
+                        )
+                    )
 
-            except PermissionError:
-                pass
+                scan_index.update_matches(listing.path, entries, signature)
+                yield from records
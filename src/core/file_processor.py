@@ -186,6 +186,8 @@ class FileProcessor:
                 # 설정 가져오기
                 use_verification = self.get_config("verify_copy", True)
                 use_multithread = self.get_config("multithread_copy", True)
+                adaptive_chunk = self.get_config("adaptive_chunk_size", True)
+                verify_method = self.get_config("verify_method", "quick")
 
                 # 진행률 콜백
                 def progress_callback(copied, total, percent, detail=""):
@@ -204,6 +206,8 @@ class FileProcessor:
                     and file_size > 100 * 1024 * 1024,  # 100MB 이상만 검증
                     use_multithread=use_multithread
                     and file_size > 1024 * 1024 * 1024,  # 1GB 이상
+                    adaptive_chunk=adaptive_chunk,
+                    verify_method=verify_method,
                 )
 
                 if not success:
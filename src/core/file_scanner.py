@@ -0,0 +1,405 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+병렬 디렉토리 스캐너 (os.scandir + 스레드 풀)
+"""
+
+import fnmatch
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+    Callable,
+    Generator,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Tuple,
+)
+
+from src.constants import (
+    ADVANCED_SETTINGS,
+    FILE_ATTRIBUTE_HIDDEN,
+    FILE_ATTRIBUTE_SYSTEM,
+)
+
+
+class ScanRecord(NamedTuple):
+    """스캔 결과 레코드 (앞의 4개 항목은 기존 매칭 튜플과 동일)"""
+
+    path: str
+    dest: str
+    keyword: str
+    match_mode: str
+    size: int
+    mtime: float
+    inode: int
+
+    @classmethod
+    def from_entry(
+        cls, entry: os.DirEntry, dest: str, keyword: str, match_mode: str
+    ) -> "ScanRecord":
+        """DirEntry의 stat 정보로 레코드 생성
+
+        Windows에서는 목록 조회 때 받은 정보를 쓰므로 syscall이 없고,
+        그 외에는 매칭된 파일에 한해 lstat 한 번만 한다.
+
+        Args:
+            entry: 디렉토리 항목
+            dest: 대상 폴더
+            keyword: 매칭된 키워드
+            match_mode: 매칭 모드
+
+        Returns:
+            스캔 결과 레코드 (stat 실패 시 크기/시간/inode는 0)
+        """
+        try:
+            st = entry.stat(follow_symlinks=False)
+            size, mtime, inode = st.st_size, st.st_mtime, st.st_ino
+        except OSError:
+            size, mtime, inode = 0, 0, 0
+        return cls(entry.path, dest, keyword, match_mode, size, mtime, inode)
+
+
+class DirectoryListing(NamedTuple):
+    """폴더 하나의 조회 결과"""
+
+    path: str
+    mtime_ns: int  # 조회 직전의 폴더 수정시간 (확인하지 않았거나 실패 시 -1)
+    files: Optional[List[os.DirEntry]]  # 색인과 같아서 조회를 생략했으면 None
+    subdirs: List[str]
+    file_count: int
+    records: List[ScanRecord] = []  # matcher에 매칭된 파일 (조회 스레드에서 lstat)
+    racy: bool = False  # 수정시간이 조회 시점과 너무 가까워서 다음에 다시 조회해야 함
+
+
+class DirectoryScanner:
+    """병렬 디렉토리 스캐너
+
+    하위 폴더 목록 조회를 스레드 풀에서 동시에 실행한다. NAS처럼 폴더마다
+    응답 지연이 큰 경우 여러 폴더의 목록 조회가 겹쳐서 진행된다.
+    DirEntry가 이미 가진 파일 종류 정보를 쓰므로 파일마다 stat을 다시 하지 않는다.
+    """
+
+    # 폴더 수정시간의 최대 단위 (FAT/exFAT 2초, SMB/NAS는 보통 1초)
+    MTIME_GRANULARITY_NS = 2 * 10**9
+
+    def __init__(
+        self,
+        max_workers: int = None,
+        progress_callback: Optional[Callable] = None,
+        exclude_patterns: Optional[Iterable[str]] = None,
+        prune_paths: Optional[Iterable[str]] = None,
+        max_depth: Optional[int] = None,
+        matcher: Optional[Callable[[str], Optional[Tuple[str, str, str]]]] = None,
+        name_first: bool = False,
+    ):
+        """초기화
+
+        Args:
+            max_workers: 동시에 목록을 조회할 스레드 수
+            progress_callback: 폴더 하나의 조회가 끝날 때마다 호출될 콜백
+                (찾은 파일 수, 완료한 폴더 수, 발견한 폴더 수)
+            exclude_patterns: 내려가지 않을 폴더의 glob 패턴
+                ("/"가 없으면 폴더 이름, 있으면 소스 기준 상대 경로와 비교)
+            prune_paths: 내려가지 않을 폴더 경로 (규칙 대상 폴더 등)
+            max_depth: 내려갈 하위 폴더 단계 수 (None 또는 0이면 제한 없음)
+            matcher: 파일명 -> (키워드, 대상폴더, 매칭모드) (없으면 None).
+                있으면 조회 스레드에서 매칭하고 매칭된 파일만 lstat해서
+                DirectoryListing.records로 돌려준다 (CompiledRuleSet.match 등)
+            name_first: 파일명 우선 여부. True면 matcher에 매칭된 파일만 종류/숨김
+                확인을 하고 파일 목록에 넣는다 (색인 사용 시에는 무시)
+        """
+        self.max_workers = max(
+            1, max_workers or ADVANCED_SETTINGS.get("scan_threads", 8)
+        )
+
+        # 동시에 진행 중인 폴더 조회 수 (소비가 느릴 때 결과가 쌓이지 않도록 제한)
+        self.max_in_flight = self.max_workers * 2
+
+        # 가지치기 설정 (목록 조회 전에 적용해서 제외된 폴더는 아예 열지 않음)
+        patterns = [p.strip() for p in exclude_patterns or () if p and p.strip()]
+        self._exclude_names = self._compile_globs(
+            [p for p in patterns if "/" not in p]
+        )
+        self._exclude_paths = self._compile_globs(
+            [p.strip("/") for p in patterns if "/" in p]
+        )
+        self.prune_paths = {self._normalize(p) for p in prune_paths or () if p}
+        self.max_depth = max_depth if max_depth and max_depth > 0 else None
+        self.matcher = matcher
+        self.name_first = name_first and matcher is not None
+        self._source = None
+
+        # 진행 상황 (scan()을 돌리는 스레드에서만 갱신)
+        self.progress_callback = progress_callback
+        self.files_found = 0
+        self.dirs_completed = 0
+        self.dirs_discovered = 0
+
+    @staticmethod
+    def _compile_globs(patterns: List[str]) -> Optional[Pattern]:
+        """glob 패턴들을 하나의 정규식으로 컴파일"""
+        if not patterns:
+            return None
+        flags = re.IGNORECASE if os.name == "nt" else 0
+        return re.compile(
+            "|".join(f"(?:{fnmatch.translate(p)})" for p in patterns), flags
+        )
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        """경로 비교용 정규화"""
+        return os.path.normcase(os.path.abspath(path))
+
+    def should_descend(self, path: str, depth: int) -> bool:
+        """하위 폴더로 내려갈지 여부
+
+        Args:
+            path: 하위 폴더 경로
+            depth: 소스 폴더 기준 단계 (소스 바로 아래가 1)
+
+        Returns:
+            내려갈지 여부
+        """
+        if self.max_depth is not None and depth > self.max_depth:
+            return False
+
+        if self._exclude_names and self._exclude_names.match(os.path.basename(path)):
+            return False
+
+        if self._exclude_paths and self._source:
+            relative = os.path.relpath(path, self._source).replace(os.sep, "/")
+            if self._exclude_paths.match(relative):
+                return False
+
+        if self.prune_paths and self._normalize(path) in self.prune_paths:
+            return False
+
+        return True
+
+    def _report_progress(self, file_count: int, subdir_count: int):
+        """폴더 하나의 조회 결과를 진행 상황에 반영"""
+        self.files_found += file_count
+        self.dirs_completed += 1
+        self.dirs_discovered += subdir_count
+
+        if self.progress_callback:
+            self.progress_callback(
+                self.files_found, self.dirs_completed, self.dirs_discovered
+            )
+
+    @staticmethod
+    def is_hidden_entry(entry: os.DirEntry) -> bool:
+        """시스템/숨김 파일 여부 확인 (FileMatcher.is_system_file과 같은 기준)
+
+        Args:
+            entry: 디렉토리 항목
+
+        Returns:
+            시스템/숨김 파일 여부
+        """
+        if os.name == "nt":
+            # Windows에서는 목록 조회 때 받은 속성을 그대로 사용 (추가 syscall 없음)
+            try:
+                attrs = entry.stat(follow_symlinks=False).st_file_attributes
+                return bool(attrs & (FILE_ATTRIBUTE_HIDDEN | FILE_ATTRIBUTE_SYSTEM))
+            except (OSError, AttributeError):
+                return False
+
+        # macOS/Linux 숨김 파일 확인 (. 으로 시작)
+        return entry.name.startswith(".")
+
+    def list_directory(
+        self,
+        path: str,
+        matcher: Optional[Callable[[str], Optional[Tuple[str, str, str]]]] = None,
+        name_first: bool = False,
+    ) -> Tuple[List[os.DirEntry], List[str], List[ScanRecord]]:
+        """폴더 하나의 파일과 하위 폴더 목록 조회
+
+        심볼릭 링크는 파일이든 폴더든 건너뛴다 (os.walk 기본 동작과 동일).
+        scan_directories에서는 스레드 풀에서 실행되므로, 매칭된 파일의 lstat도
+        폴더 조회와 함께 병렬로 진행된다.
+
+        Args:
+            path: 폴더 경로
+            matcher: 파일명 -> (키워드, 대상폴더, 매칭모드) (없으면 None)
+            name_first: matcher에 매칭된 파일만 종류/숨김 확인 (파일 항목
+                리스트에도 매칭된 파일만 들어감). 파일마다 매칭은 한 번만 한다
+
+        Returns:
+            (파일 항목 리스트, 하위 폴더 경로 리스트, 매칭된 파일 레코드 리스트)
+        """
+        files = []
+        subdirs = []
+        records = []
+
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        # follow_symlinks=False이면 심볼릭 링크는 폴더/파일 모두 False
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                            continue
+
+                        # 파일명 우선: 이름이 매칭되지 않으면 메타데이터를 보지 않음
+                        matched = None
+                        if name_first:
+                            matched = matcher(entry.name)
+                            if not matched:
+                                continue
+
+                        if entry.is_file(follow_symlinks=False):
+                            if not self.is_hidden_entry(entry):
+                                files.append(entry)
+
+                                if matcher and not name_first:
+                                    matched = matcher(entry.name)
+                                if matched:
+                                    keyword, dest, match_mode = matched
+                                    records.append(
+                                        ScanRecord.from_entry(
+                                            entry, dest, keyword, match_mode
+                                        )
+                                    )
+                    except OSError:
+                        continue
+        except OSError:
+            # 접근할 수 없는 폴더는 건너뛰기
+            pass
+
+        return files, subdirs, records
+
+    def read_directory(
+        self, path: str, cached: Optional[Tuple] = None, check_mtime: bool = False
+    ) -> DirectoryListing:
+        """폴더 하나 조회 (색인과 수정시간이 같으면 목록 조회 생략)
+
+        Args:
+            path: 폴더 경로
+            cached: 색인에 저장된 (수정시간 ns, 하위 폴더 경로 리스트, 파일 수)
+            check_mtime: 폴더 수정시간 확인 여부
+
+        Returns:
+            폴더 조회 결과
+        """
+        mtime_ns = -1
+        racy = False
+        if check_mtime or cached:
+            started_ns = time.time_ns()
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                # 접근할 수 없는 폴더는 건너뛰기
+                return DirectoryListing(path, -1, [], [], 0)
+
+            if cached and cached[0] == mtime_ns:
+                return DirectoryListing(path, mtime_ns, None, cached[1], cached[2])
+
+            # 조회 직전에 바뀐 폴더는 같은 시간 단위 안에 또 바뀌어도 수정시간이
+            # 그대로일 수 있으므로 (git의 racily clean과 같은 문제) 믿지 않음
+            racy = mtime_ns >= started_ns - self.MTIME_GRANULARITY_NS
+
+        # 색인에 저장할 때는 전체 파일 목록이 필요하므로 파일명 우선을 쓰지 않음
+        if check_mtime or cached:
+            files, subdirs, records = self.list_directory(path, self.matcher)
+        else:
+            files, subdirs, records = self.list_directory(
+                path, self.matcher, self.name_first
+            )
+        return DirectoryListing(
+            path, mtime_ns, files, subdirs, len(files), records, racy
+        )
+
+    def scan_directories(
+        self,
+        source: str,
+        include_subfolders: bool = True,
+        lookup: Optional[Callable[[str], Optional[Tuple]]] = None,
+    ) -> Generator[DirectoryListing, None, None]:
+        """폴더 단위 조회 결과를 완료되는 순서대로 반환
+
+        lookup이 있으면 폴더마다 수정시간을 확인해서, 색인에 저장된 값과 같으면
+        목록 조회를 생략하고 저장된 하위 폴더로 계속 내려간다.
+        lookup은 이 제너레이터를 돌리는 스레드에서만 호출된다.
+
+        Args:
+            source: 검색할 소스 디렉토리
+            include_subfolders: 하위 폴더 포함 여부
+            lookup: 폴더 경로 -> 색인에 저장된 (수정시간 ns, 하위 폴더 경로
+                리스트, 파일 수) (없으면 None)
+
+        Yields:
+            폴더 조회 결과
+        """
+        self.files_found = 0
+        self.dirs_completed = 0
+        self.dirs_discovered = 1
+        self._source = source
+        check_mtime = lookup is not None
+
+        def submit_args(path):
+            return path, (lookup(path) if lookup else None), check_mtime
+
+        if not include_subfolders:
+            listing = self.read_directory(*submit_args(source))
+            # 하위 폴더는 내려가지 않으므로 진행 상황에서도 제외
+            self._report_progress(listing.file_count, 0)
+            yield listing
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="DirectoryScanner"
+        )
+        pending = deque([(source, 0)])
+        running = {}  # future -> 폴더 단계
+
+        try:
+            while pending or running:
+                while pending and len(running) < self.max_in_flight:
+                    path, depth = pending.popleft()
+                    future = executor.submit(self.read_directory, *submit_args(path))
+                    running[future] = depth
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    depth = running.pop(future)
+                    listing = future.result()
+
+                    # 가지치기한 폴더는 목록을 조회하지 않음
+                    subdirs = [
+                        subdir
+                        for subdir in listing.subdirs
+                        if self.should_descend(subdir, depth + 1)
+                    ]
+                    pending.extend((subdir, depth + 1) for subdir in subdirs)
+                    self._report_progress(listing.file_count, len(subdirs))
+                    yield listing
+        finally:
+            # 제너레이터가 중간에 닫혀도 남은 조회는 취소
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def scan(
+        self, source: str, include_subfolders: bool = True
+    ) -> Generator[os.DirEntry, None, None]:
+        """파일 항목을 찾는 대로 반환
+
+        하위 폴더를 포함하면 폴더 단위로 완료되는 순서대로 반환하므로
+        os.walk와 순서가 다를 수 있다.
+
+        Args:
+            source: 검색할 소스 디렉토리
+            include_subfolders: 하위 폴더 포함 여부
+
+        Yields:
+            파일 DirEntry
+        """
+        for listing in self.scan_directories(source, include_subfolders):
+            yield from listing.files
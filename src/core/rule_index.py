@@ -0,0 +1,420 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+규칙 매칭용 인덱스 자료구조
+"""
+
+import re
+from collections import deque
+from typing import Dict, List, Pattern, Tuple
+
+try:
+    import ahocorasick  # pyahocorasick (선택사항)
+
+    HAS_AHOCORASICK = True
+except ImportError:
+    ahocorasick = None
+    HAS_AHOCORASICK = False
+
+# 매칭 없음을 나타내는 우선순위 (어떤 규칙 인덱스보다 큼)
+NO_MATCH = float("inf")
+
+
+class AhoCorasickIndex:
+    """여러 키워드를 한 번에 찾는 Aho-Corasick 오토마톤
+
+    키워드마다 우선순위(규칙 순서)를 저장하고, 텍스트를 한 번만 훑어서
+    포함된 키워드 중 가장 높은 우선순위를 찾는다. pyahocorasick이 설치되어
+    있으면 그것을 사용하고, 없으면 순수 파이썬 구현을 사용한다.
+    """
+
+    def __init__(self, use_accelerated: bool = True):
+        """초기화
+
+        Args:
+            use_accelerated: pyahocorasick 사용 여부 (설치된 경우)
+        """
+        self.use_accelerated = use_accelerated and HAS_AHOCORASICK
+        self._keywords: Dict[str, int] = {}  # 키워드: 가장 높은 우선순위
+        self._automaton = None
+        self._built = False
+
+        # 순수 파이썬 오토마톤 (노드 번호 기반)
+        self._goto: List[Dict[str, int]] = []
+        self._fail: List[int] = []
+        self._own: List[float] = []  # 노드에서 끝나는 키워드의 우선순위
+        self._best: List[float] = []  # 실패 링크를 따라간 출력 중 최소 우선순위
+        self._out_link: List[int] = []  # 출력이 있는 가장 가까운 실패 링크 노드
+
+    @property
+    def backend(self) -> str:
+        """사용 중인 구현 이름"""
+        return "pyahocorasick" if self.use_accelerated else "python"
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def add(self, keyword: str, priority: int):
+        """키워드 추가
+
+        Args:
+            keyword: 검색할 키워드 (이미 소문자화된 값)
+            priority: 규칙 우선순위 (작을수록 먼저)
+        """
+        if keyword not in self._keywords or priority < self._keywords[keyword]:
+            self._keywords[keyword] = priority
+        self._built = False
+
+    def build(self):
+        """오토마톤 생성 (키워드 추가가 끝난 뒤 한 번 호출)"""
+        if self.use_accelerated:
+            self._automaton = ahocorasick.Automaton()
+            for keyword, priority in self._keywords.items():
+                if keyword:  # 빈 키워드는 pyahocorasick이 지원하지 않음
+                    self._automaton.add_word(keyword, priority)
+            if len(self._automaton):
+                self._automaton.make_automaton()
+            else:
+                self._automaton = None
+        else:
+            self._build_python()
+        self._built = True
+
+    def _build_python(self):
+        """순수 파이썬 오토마톤 생성"""
+        goto = [{}]
+        own = [NO_MATCH]
+
+        # 1. 트라이 구성
+        for keyword, priority in self._keywords.items():
+            node = 0
+            for ch in keyword:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    own.append(NO_MATCH)
+                node = nxt
+            if priority < own[node]:
+                own[node] = priority
+
+        # 2. BFS로 실패 링크와 출력 정보 계산
+        fail = [0] * len(goto)
+        best = list(own)
+        out_link = [-1] * len(goto)
+        queue = deque(goto[0].values())
+
+        while queue:
+            node = queue.popleft()
+            parent_fail = fail[node]
+
+            # 실패 링크 노드는 항상 먼저 처리되므로 best/out_link를 이어받을 수 있음
+            if best[parent_fail] < best[node]:
+                best[node] = best[parent_fail]
+            out_link[node] = (
+                parent_fail if own[parent_fail] != NO_MATCH else out_link[parent_fail]
+            )
+
+            for ch, child in goto[node].items():
+                state = parent_fail
+                while ch not in goto[state] and state != 0:
+                    state = fail[state]
+                target = goto[state].get(ch, 0)
+                fail[child] = target if target != child else 0
+                queue.append(child)
+
+        self._goto = goto
+        self._fail = fail
+        self._own = own
+        self._best = best
+        self._out_link = out_link
+
+    def first_match(self, text: str) -> int:
+        """텍스트에 포함된 키워드 중 가장 높은 우선순위 반환
+
+        Args:
+            text: 검색 대상 (이미 소문자화된 값)
+
+        Returns:
+            우선순위 (없으면 -1)
+        """
+        if not self._built:
+            self.build()
+
+        best = self._keywords.get("", NO_MATCH)
+
+        if self.use_accelerated:
+            if self._automaton is not None:
+                for _, priority in self._automaton.iter(text):
+                    if priority < best:
+                        best = priority
+        else:
+            goto = self._goto
+            fail = self._fail
+            node_best = self._best
+            state = 0
+            for ch in text:
+                nxt = goto[state].get(ch)
+                while nxt is None and state:
+                    state = fail[state]
+                    nxt = goto[state].get(ch)
+                state = nxt or 0
+                if node_best[state] < best:
+                    best = node_best[state]
+
+        return -1 if best == NO_MATCH else best
+
+    def find_all(self, text: str) -> List[int]:
+        """텍스트에 포함된 모든 키워드의 우선순위 반환
+
+        Args:
+            text: 검색 대상 (이미 소문자화된 값)
+
+        Returns:
+            우선순위 오름차순 리스트 (중복 제거)
+        """
+        if not self._built:
+            self.build()
+
+        found = set()
+        if "" in self._keywords:
+            found.add(self._keywords[""])
+
+        if self.use_accelerated:
+            if self._automaton is not None:
+                found.update(priority for _, priority in self._automaton.iter(text))
+        else:
+            goto = self._goto
+            fail = self._fail
+            own = self._own
+            out_link = self._out_link
+            state = 0
+            for ch in text:
+                nxt = goto[state].get(ch)
+                while nxt is None and state:
+                    state = fail[state]
+                    nxt = goto[state].get(ch)
+                state = nxt or 0
+
+                node = state if own[state] != NO_MATCH else out_link[state]
+                while node > 0:
+                    found.add(own[node])
+                    node = out_link[node]
+
+        return sorted(found)
+
+
+class KeywordTrie:
+    """접두사/접미사 키워드 트라이
+
+    reverse=False면 "시작" 규칙용 접두사 트라이, reverse=True면 키워드를
+    뒤집어 저장해서 "끝" 규칙용 접미사 트라이로 동작한다. 조회는 텍스트를
+    한 번만 따라 내려가므로 규칙 수가 아닌 파일명 길이에 비례한다.
+    """
+
+    def __init__(self, reverse: bool = False):
+        """초기화
+
+        Args:
+            reverse: 접미사 트라이 여부
+        """
+        self.reverse = reverse
+        self._children: List[Dict[str, int]] = [{}]
+        self._own: List[float] = [NO_MATCH]  # 노드에서 끝나는 키워드의 우선순위
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, keyword: str, priority: int):
+        """키워드 추가
+
+        Args:
+            keyword: 키워드 (이미 소문자화된 값)
+            priority: 규칙 우선순위 (작을수록 먼저)
+        """
+        node = 0
+        for ch in reversed(keyword) if self.reverse else keyword:
+            nxt = self._children[node].get(ch)
+            if nxt is None:
+                nxt = len(self._children)
+                self._children[node][ch] = nxt
+                self._children.append({})
+                self._own.append(NO_MATCH)
+            node = nxt
+
+        if self._own[node] == NO_MATCH:
+            self._count += 1
+        if priority < self._own[node]:
+            self._own[node] = priority
+
+    def matches(self, text: str) -> List[int]:
+        """텍스트의 접두사(접미사)인 모든 키워드의 우선순위 반환
+
+        Args:
+            text: 검색 대상 (이미 소문자화된 값)
+
+        Returns:
+            우선순위 오름차순 리스트
+        """
+        children = self._children
+        own = self._own
+        found = [own[0]] if own[0] != NO_MATCH else []
+
+        node = 0
+        for ch in reversed(text) if self.reverse else text:
+            node = children[node].get(ch)
+            if node is None:
+                break
+            if own[node] != NO_MATCH:
+                found.append(own[node])
+
+        return sorted(found)
+
+    def first_match(self, text: str) -> int:
+        """텍스트의 접두사(접미사)인 키워드 중 가장 높은 우선순위 반환
+
+        Args:
+            text: 검색 대상 (이미 소문자화된 값)
+
+        Returns:
+            우선순위 (없으면 -1)
+        """
+        children = self._children
+        own = self._own
+        best = own[0]
+
+        node = 0
+        for ch in reversed(text) if self.reverse else text:
+            node = children[node].get(ch)
+            if node is None:
+                break
+            if own[node] < best:
+                best = own[node]
+
+        return -1 if best == NO_MATCH else best
+
+
+class RegexIndex:
+    """정규식 규칙 인덱스
+
+    패턴은 규칙 집합을 만들 때 한 번만 컴파일한다(re 모듈 내부 캐시에
+    의존하지 않음). combine=True면 패턴들을 하나의 alternation으로 합쳐
+    사전 필터로 사용하므로, 아무 패턴에도 매칭되지 않는 대부분의 파일은
+    search 한 번으로 끝난다.
+
+    이름 있는 그룹으로 합치면 re가 분기들의 공통 접두사를 최적화하지 못해
+    규칙별 검색보다 훨씬 느려지므로, 조합 패턴은 비캡처 그룹으로 만들고
+    매칭된 파일만 규칙 순서대로 개별 패턴을 확인한다.
+    """
+
+    def __init__(self, combine: bool = True):
+        """초기화
+
+        Args:
+            combine: 패턴을 하나의 alternation 사전 필터로 합칠지 여부
+        """
+        self.combine = combine
+        self.invalid: List[Tuple[int, str, str]] = []  # (우선순위, 패턴, 오류)
+        self._patterns: List[Tuple[int, str, Pattern]] = []
+        self._combined = None
+        self._combined_patterns: List[Tuple[int, Pattern]] = []
+        self._separate_patterns: List[Tuple[int, Pattern]] = []
+        self._built = False
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def add(self, pattern: str, priority: int) -> bool:
+        """패턴 추가
+
+        Args:
+            pattern: 정규식 패턴
+            priority: 규칙 우선순위 (작을수록 먼저)
+
+        Returns:
+            컴파일 성공 여부 (실패한 패턴은 invalid에 기록되고 매칭되지 않음)
+        """
+        try:
+            compiled = re.compile(pattern, re.IGNORECASE)
+        except re.error as e:
+            self.invalid.append((priority, pattern, str(e)))
+            return False
+
+        self._patterns.append((priority, pattern, compiled))
+        self._built = False
+        return True
+
+    def build(self):
+        """조합 패턴 생성 (패턴 추가가 끝난 뒤 한 번 호출)"""
+        self._patterns.sort(key=lambda item: item[0])
+        self._combined = None
+        self._combined_patterns = []
+        self._separate_patterns = []
+
+        parts = []
+        for priority, pattern, compiled in self._patterns:
+            # 캡처 그룹이 있으면(합치면 역참조 번호가 바뀜) 또는 (?i) 같은 전역
+            # 플래그처럼 감싸면 깨지는 패턴은 항상 개별 검색
+            if self.combine and compiled.groups == 0 and self._can_wrap(pattern):
+                parts.append(f"(?:{pattern})")
+                self._combined_patterns.append((priority, compiled))
+            else:
+                self._separate_patterns.append((priority, compiled))
+
+        if len(parts) > 1:
+            try:
+                self._combined = re.compile("|".join(parts), re.IGNORECASE)
+            except (re.error, RecursionError):
+                self._combined = None
+
+        if self._combined is None:
+            # 합칠 패턴이 하나뿐이거나 조합에 실패하면 모두 개별 검색
+            self._combined_patterns = []
+            self._separate_patterns = [(p, c) for p, _, c in self._patterns]
+
+        self._built = True
+
+    @staticmethod
+    def _can_wrap(pattern: str) -> bool:
+        """(?:...)로 감싸도 컴파일되는 패턴인지 확인"""
+        try:
+            re.compile(f"(?:{pattern})", re.IGNORECASE)
+            return True
+        except re.error:
+            return False
+
+    def first_match(self, text: str, limit: float = NO_MATCH) -> int:
+        """텍스트에 매칭되는 패턴 중 가장 높은 우선순위 반환
+
+        Args:
+            text: 검색 대상 (원본 파일명, 대소문자 무시)
+            limit: 이 우선순위 이상인 패턴은 확인하지 않음
+
+        Returns:
+            우선순위 (limit 미만의 매칭이 없으면 -1)
+        """
+        if not self._built:
+            self.build()
+
+        best = limit
+
+        # 조합 패턴에 걸린 파일만 규칙 순서대로 개별 확인
+        if self._combined is not None and self._combined.search(text):
+            for priority, compiled in self._combined_patterns:
+                if priority >= best:
+                    break
+                if compiled.search(text):
+                    best = priority
+                    break
+
+        for priority, compiled in self._separate_patterns:
+            if priority >= best:
+                break
+            if compiled.search(text):
+                best = priority
+                break
+
+        return -1 if best >= limit else best
@@ -5,7 +5,9 @@
 규칙 관리 로직
 """
 
-from typing import Dict, List, Tuple
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+from src.core.compiled_rules import CompiledRuleSet
 from src.utils.config import ConfigManager
 
 class RuleManager:
@@ -19,6 +21,16 @@ class RuleManager:
         """
         self.config_manager = ConfigManager(config_file)
         self.rules = self.config_manager.load_config()
+
+        # 규칙이 바뀔 때마다 증가 (파생 인덱스 캐시 무효화용)
+        self.rules_version = 0
+        self._listeners: List[Callable[[int], None]] = []
+
+        # 활성 규칙 / 컴파일된 규칙 캐시 (규칙 변경 시에만 다시 생성)
+        self._active_rules = None
+        self._compiled_rules = None
+        self._compiled_version = -1
+        self._compiled_lock = threading.Lock()
         
     def add_rule(self, keyword: str, dest: str, match_mode: str = "포함") -> bool:
         """규칙 추가
@@ -92,15 +104,28 @@ class RuleManager:
     
     def get_active_rules(self) -> Dict:
         """활성화된 규칙만 반환
-        
+
+        결과는 규칙이 바뀔 때까지 캐시되므로 호출한 쪽에서 수정하지 않는다.
+
         Returns:
             활성화된 규칙 딕셔너리
         """
-        return {
-            k: v
-            for k, v in self.rules.items()
-            if isinstance(v, dict) and v.get("enabled", True)
-        }
+        with self._compiled_lock:
+            return self._get_active_rules_locked()
+
+    def _get_active_rules_locked(self) -> Dict:
+        """활성 규칙 캐시 조회/생성 (_compiled_lock을 잡은 상태에서 호출)
+
+        무효화(_notify_change)도 같은 락을 잡으므로 무효화 전에 만든
+        규칙이 무효화 후에 다시 저장되지 않는다.
+        """
+        if self._active_rules is None:
+            self._active_rules = {
+                k: v
+                for k, v in self.rules.items()
+                if isinstance(v, dict) and v.get("enabled", True)
+            }
+        return self._active_rules
     
     def get_rules_list(self) -> List[Tuple[str, Dict]]:
         """규칙 리스트 반환
@@ -110,10 +135,71 @@ class RuleManager:
         """
         return list(self.rules.items())
     
+    def get_compiled_rules(
+        self, log_callback: Optional[Callable] = None
+    ) -> CompiledRuleSet:
+        """활성 규칙의 컴파일된 규칙 집합 반환
+
+        규칙이 바뀌지 않았으면 이전에 만든 객체를 그대로 돌려주므로
+        파일 목록과 자동 정리가 같은 컴파일 결과를 공유한다.
+
+        Args:
+            log_callback: 다시 컴파일할 때 잘못된 정규식을 알릴 로그 콜백
+
+        Returns:
+            컴파일된 규칙 집합
+        """
+        with self._compiled_lock:
+            # 컴파일에 쓸 규칙을 읽기 전의 버전으로 캐시 (컴파일 후 버전을 읽으면
+            # 그 사이 바뀐 규칙이 새 버전으로 잘못 캐시될 수 있음)
+            version = self.rules_version
+            if self._compiled_version != version:
+                self._compiled_rules = CompiledRuleSet(
+                    self._get_active_rules_locked(), log_callback
+                )
+                self._compiled_version = version
+            return self._compiled_rules
+
+    def subscribe(self, callback: Callable[[int], None]):
+        """규칙 변경 알림 구독
+
+        Args:
+            callback: 규칙이 바뀔 때 새 rules_version을 인자로 호출될 함수
+                (규칙을 변경한 스레드에서 호출됨)
+        """
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable[[int], None]):
+        """규칙 변경 알림 구독 해제
+
+        Args:
+            callback: subscribe()에 넘겼던 함수
+        """
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify_change(self):
+        """규칙 변경 처리 (버전 증가, 캐시 무효화, 구독자 알림)"""
+        with self._compiled_lock:
+            self.rules_version += 1
+            self._active_rules = None
+            version = self.rules_version
+
+        for callback in list(self._listeners):
+            try:
+                callback(version)
+            except Exception:
+                # 구독자 오류로 규칙 저장이 실패하지 않도록 무시
+                pass
+
     def save_rules(self):
         """규칙 저장"""
         self.config_manager.save_config(self.rules)
+        # 모든 규칙 변경은 저장을 거치므로 여기서 변경을 알림
+        self._notify_change()
     
     def reload_rules(self):
         """규칙 다시 로드"""
-        self.rules = self.config_manager.load_config()
\ No newline at end of file
+        self.rules = self.config_manager.load_config()
+        self._notify_change()
\ No newline at end of file
@@ -0,0 +1,543 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+파일 목록 모델 - 가상 목록이 표시할 행과 체크 상태 (Tk 없이 동작)
+"""
+
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+class FileListModel:
+    """가상 파일 목록 모델
+
+    매칭된 파일을 행 번호로 관리한다. 파일마다 딕셔너리를 만들지 않고
+    열(column)별로 저장한다. 크기/수정시간/inode는 array에, 폴더 경로와
+    규칙(키워드, 매칭모드, 대상폴더)은 한 번만 저장하고 행에는 번호만 둔다.
+    표시용 문자열은 화면에 그릴 때 만든다.
+
+    체크 상태는 행마다 1바이트인 bytearray에, 필터 결과는 표시 순서대로의
+    행 번호 리스트(view)에 둔다. view가 None이면 모든 행을 순서대로 표시한다.
+
+    필터는 열 값과 색인(확장자/규칙별 행 목록, 크기/수정시간 정렬 순서,
+    소문자 파일명)만 사용하고 파일 시스템은 조회하지 않는다.
+    """
+
+    MB = 1024 * 1024
+
+    # 크기 필터 -> 크기 범위 [이상, 미만) (None은 제한 없음)
+    SIZE_RANGES = {
+        "< 1MB": (None, MB),
+        "1-10MB": (MB, 10 * MB + 1),
+        "10-100MB": (10 * MB, 100 * MB + 1),
+        "> 100MB": (100 * MB + 1, None),
+    }
+
+    def __init__(self):
+        """초기화"""
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def clear(self):
+        """모든 행 삭제"""
+        # 공유 값 (행에는 번호만 저장)
+        self.dirs: List[str] = []
+        self._dir_ids: Dict[str, int] = {}
+        self.rules: List[Tuple[str, str, str, str]] = []  # (키워드, 모드, 대상, 표시)
+        self._rule_ids: Dict[Tuple[str, str, str], int] = {}
+
+        # 행별 열
+        self.names: List[str] = []
+        self.dir_ids = array("I")
+        self.rule_ids = array("I")
+        self.sizes = array("q")
+        self.mtimes = array("d")
+        self.inodes = array("Q")
+
+        self.checked = bytearray()  # 행별 체크 상태 (1: 체크)
+        self.checked_count = 0
+        self.view: Optional[List[int]] = None  # 표시할 행 번호 (None: 전체)
+        self._view_mask: Optional[bytearray] = None  # 행별 표시 여부 (필요할 때 만듦)
+        self._visible_checked: Optional[int] = None  # 표시 중이면서 체크된 행 수
+
+        # 필터 색인 (필요할 때 새 행만 추가)
+        self._indexed_count = 0
+        self.exts: List[str] = []
+        self._ext_ids: Dict[str, int] = {}
+        self.ext_ids = array("I")
+        self._ext_rows: List[array] = []  # 확장자별 행 번호 (행 순서)
+        self._keyword_rows: Dict[str, array] = {}  # 키워드별 행 번호 (행 순서)
+        self._sorted: Dict[str, Tuple[int, array, array]] = {}  # 정렬 색인
+
+        # 소문자 파일명 열과 그것을 구분자로 이어붙인 문자열, 행별 시작 위치
+        self.lower_names: List[str] = []
+        self._name_count = 0
+        self._name_blob = ""
+        self._name_offsets = array("Q", [0])
+
+        # 직전 필터 결과 (검색어가 이어지면 이 결과 안에서만 찾음)
+        self._last_filter = None
+
+    def extend(
+        self,
+        records: Sequence[Tuple],
+        destination_label: Optional[Callable[[str], str]] = None,
+    ):
+        """스캔 레코드 추가 (체크된 상태로 추가되고 현재 표시 목록 끝에 붙음)
+
+        Args:
+            records: (경로, 대상폴더, 키워드, 매칭모드, 크기, 수정시간, inode)
+                형식의 레코드 (ScanRecord)
+            destination_label: 대상 폴더의 표시 문자열을 만드는 함수
+                (규칙마다 한 번만 호출, 없으면 폴더 이름)
+        """
+        start = len(self.names)
+        dirs, dir_ids = self.dirs, self._dir_ids
+        rules, rule_ids = self.rules, self._rule_ids
+
+        for path, dest, keyword, match_mode, size, mtime, inode in records:
+            folder, name = os.path.split(path)
+
+            dir_id = dir_ids.get(folder)
+            if dir_id is None:
+                dir_id = dir_ids[folder] = len(dirs)
+                dirs.append(folder)
+
+            rule_key = (keyword, match_mode, dest)
+            rule_id = rule_ids.get(rule_key)
+            if rule_id is None:
+                if destination_label:
+                    label = destination_label(dest)
+                else:
+                    label = os.path.basename(dest) if dest else ""
+                rule_id = rule_ids[rule_key] = len(rules)
+                rules.append(rule_key + (label,))
+
+            self.names.append(name)
+            self.dir_ids.append(dir_id)
+            self.rule_ids.append(rule_id)
+            self.sizes.append(size or 0)
+            self.mtimes.append(mtime or 0)
+            self.inodes.append(inode or 0)
+
+        added = len(self.names) - start
+        self.checked.extend(b"\x01" * added)
+        self.checked_count += added
+        if self.view is not None:
+            self.view.extend(range(start, len(self.names)))
+            if self._view_mask is not None:
+                self._view_mask.extend(b"\x01" * added)
+            if self._visible_checked is not None:
+                self._visible_checked += added
+
+    # 행 값
+
+    def path(self, row: int) -> str:
+        """행의 파일 경로"""
+        return os.path.join(self.dirs[self.dir_ids[row]], self.names[row])
+
+    def rule(self, row: int) -> Tuple[str, str, str, str]:
+        """행의 규칙 (키워드, 매칭모드, 대상폴더, 대상 표시 문자열)"""
+        return self.rules[self.rule_ids[row]]
+
+    def get(self, row: int) -> Dict:
+        """행의 파일 정보 (필요할 때 딕셔너리로 만듦)"""
+        keyword, match_mode, dest, destination = self.rule(row)
+        return {
+            "path": self.path(row),
+            "filename": self.names[row],
+            "size": self.format_file_size(self.sizes[row]),
+            "modified": self.format_mtime(self.mtimes[row]),
+            "rule": f"{keyword} ({match_mode})",
+            "keyword": keyword,
+            "match_mode": match_mode,
+            "destination": destination,
+            "dest_folder": dest,
+            "size_bytes": self.sizes[row],
+            "mtime": self.mtimes[row],
+            "inode": self.inodes[row],
+        }
+
+    def display_values(self, row: int) -> Tuple[str, str, str, str, str]:
+        """목록에 표시할 값 (파일명, 크기, 수정일, 규칙, 대상)"""
+        keyword, match_mode, _, destination = self.rule(row)
+        return (
+            self.names[row],
+            self.format_file_size(self.sizes[row]),
+            self.format_mtime(self.mtimes[row]),
+            f"{keyword} ({match_mode})",
+            destination,
+        )
+
+    def format_file_size(self, size):
+        """파일 크기 포맷팅"""
+        for unit in ["B", "KB", "MB", "GB"]:
+            if size < 1024.0:
+                return f"{size:.1f} {unit}"
+            size /= 1024.0
+        return f"{size:.1f} TB"
+
+    def format_mtime(self, mtime):
+        """수정시간 포맷팅"""
+        try:
+            return datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M")
+        except (OverflowError, OSError, ValueError):
+            return ""
+
+    # 표시 목록
+
+    @property
+    def view_count(self) -> int:
+        """표시되는 행 수"""
+        return len(self.names) if self.view is None else len(self.view)
+
+    def row_at(self, position: int) -> int:
+        """표시 위치의 행 번호"""
+        return position if self.view is None else self.view[position]
+
+    def set_view(self, rows: Optional[Iterable[int]]):
+        """표시할 행 설정
+
+        Args:
+            rows: 표시 순서대로의 행 번호 (None이면 전체)
+        """
+        if rows is not None and not isinstance(rows, list):
+            rows = list(rows)
+        self.view = rows
+        self._view_mask = None
+        self._visible_checked = None
+
+    # 필터
+
+    @staticmethod
+    def date_range(
+        filter_value: str, now: datetime = None
+    ) -> Optional[Tuple[Optional[float], Optional[float]]]:
+        """날짜 필터 -> 수정시간 범위 [이상, 미만) 타임스탬프
+
+        Args:
+            filter_value: 날짜 필터 ("오늘", "이번 주", "이번 달", "올해")
+            now: 기준 시각 (기본값: 현재)
+
+        Returns:
+            (시작, 끝) 타임스탬프 (필터가 아니면 None)
+        """
+        now = now or datetime.now()
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        if filter_value == "오늘":
+            start, end = today, today + timedelta(days=1)
+        elif filter_value == "이번 주":
+            start, end = now - timedelta(days=now.weekday()), None
+        elif filter_value == "이번 달":
+            start = today.replace(day=1)
+            if start.month == 12:
+                end = start.replace(year=start.year + 1, month=1)
+            else:
+                end = start.replace(month=start.month + 1)
+        elif filter_value == "올해":
+            start = today.replace(month=1, day=1)
+            end = start.replace(year=start.year + 1)
+        else:
+            return None
+
+        return start.timestamp(), end.timestamp() if end else None
+
+    def extensions(self) -> List[str]:
+        """목록에 있는 확장자 (소문자, 정렬)"""
+        self._update_indexes()
+        return sorted(
+            ext for ext, rows in zip(self.exts, self._ext_rows) if ext and rows
+        )
+
+    def keywords(self) -> List[str]:
+        """목록에 있는 규칙 키워드 (정렬)"""
+        return sorted({rule[0] for rule in self.rules})
+
+    def _update_indexes(self):
+        """소문자 파일명/확장자/키워드 색인에 새 행 추가"""
+        start = self._indexed_count
+        if start == len(self.names):
+            return
+
+        ext_ids, ext_rows = self._ext_ids, self._ext_rows
+        keyword_rows = self._keyword_rows
+        for row in range(start, len(self.names)):
+            # 이미 소문자인 이름은 같은 문자열 객체를 공유
+            name = self.names[row]
+            lowered = name.lower()
+            self.lower_names.append(name if lowered == name else lowered)
+
+            ext = os.path.splitext(lowered)[1]
+            ext_id = ext_ids.get(ext)
+            if ext_id is None:
+                ext_id = ext_ids[ext] = len(self.exts)
+                self.exts.append(ext)
+                ext_rows.append(array("I"))
+            self.ext_ids.append(ext_id)
+            ext_rows[ext_id].append(row)
+
+            keyword = self.rules[self.rule_ids[row]][0]
+            rows = keyword_rows.get(keyword)
+            if rows is None:
+                rows = keyword_rows[keyword] = array("I")
+            rows.append(row)
+
+        self._indexed_count = len(self.names)
+
+    def _name_index(self) -> Tuple[str, array]:
+        """소문자 파일명을 이어붙인 문자열과 행별 시작 위치 (행이 늘었을 때만 다시 만듦)
+
+        파일명에 들어갈 수 없는 NUL로 이어붙여서 검색어가 행 경계를 넘어
+        매칭되지 않는다.
+        """
+        self._update_indexes()
+        if self._name_count != len(self.lower_names):
+            self._name_blob = "\0".join(self.lower_names) + "\0"
+            self._name_offsets = array(
+                "Q", accumulate((len(name) + 1 for name in self.lower_names), initial=0)
+            )
+            self._name_count = len(self.lower_names)
+        return self._name_blob, self._name_offsets
+
+    def _filter_text(self, rows, text: str) -> List[int]:
+        """소문자 파일명에 text가 포함된 행만 남김
+
+        Args:
+            rows: 확인할 행 번호 (None이면 전체)
+            text: 소문자 검색어
+        """
+        self._update_indexes()
+        lower_names = self.lower_names
+        if rows is not None:
+            return [row for row in rows if text in lower_names[row]]
+
+        # 매칭이 드물면 이어붙인 문자열에서 찾고 위치를 행 번호로 변환
+        blob, offsets = self._name_index()
+        if "\0" in text:
+            return []
+        if blob.count(text) > len(lower_names) // 8:
+            return [row for row, name in enumerate(lower_names) if text in name]
+
+        matches = []
+        find = blob.find
+        position = find(text)
+        while position >= 0:
+            row = bisect_right(offsets, position) - 1
+            matches.append(row)
+            position = find(text, offsets[row + 1])
+        return matches
+
+    def _sorted_index(self, column: str) -> Tuple[array, array]:
+        """열 값 순서로 정렬한 (행 번호, 값) 색인 (행이 늘었을 때만 다시 만듦)"""
+        values = getattr(self, column)
+        cached = self._sorted.get(column)
+        if cached and cached[0] == len(values):
+            return cached[1], cached[2]
+
+        order = array("I", sorted(range(len(values)), key=values.__getitem__))
+        sorted_values = array(values.typecode, [values[row] for row in order])
+        self._sorted[column] = (len(values), order, sorted_values)
+        return order, sorted_values
+
+    def _range_rows(self, column: str, low, high) -> array:
+        """열 값이 [low, high) 범위인 행 번호 (값 순서)"""
+        order, sorted_values = self._sorted_index(column)
+        start = 0 if low is None else bisect_left(sorted_values, low)
+        end = len(order) if high is None else bisect_left(sorted_values, high)
+        return order[start:max(start, end)]
+
+    def filter_rows(
+        self,
+        text: str = "",
+        ext: Optional[str] = None,
+        size_range: Optional[Tuple] = None,
+        mtime_range: Optional[Tuple] = None,
+        keyword: Optional[str] = None,
+    ) -> Optional[List[int]]:
+        """필터 조건에 맞는 행 번호
+
+        확장자/키워드 색인과 크기/수정시간 범위 중 후보가 가장 적은 것에서
+        시작해서 나머지 조건은 열 값으로 확인한다.
+
+        Args:
+            text: 파일명에 포함될 문자열 (대소문자 무시)
+            ext: 확장자 (예: ".txt")
+            size_range: 크기 범위 [이상, 미만)
+            mtime_range: 수정시간 범위 [이상, 미만)
+            keyword: 규칙 키워드
+
+        Returns:
+            행 순서대로의 행 번호 (조건이 없으면 None)
+        """
+        text = text.lower()
+        if not (text or ext is not None or size_range or mtime_range or keyword):
+            return None
+
+        # 같은 조건에서 검색어만 길어졌으면 직전 결과 안에서만 찾음
+        key = (ext, size_range, mtime_range, keyword, len(self.names))
+        last = self._last_filter
+        if last and last[0] == key and last[1] in text:
+            rows = last[2]
+            if text != last[1]:
+                rows = self._filter_text(rows, text)
+            self._last_filter = (key, text, rows)
+            return list(rows)
+
+        self._update_indexes()
+
+        # 후보 목록 (조건 이름, 행 번호 배열, 이미 행 순서인지)
+        candidates = []
+        if ext is not None:
+            ext_id = self._ext_ids.get(ext.lower())
+            bucket = self._ext_rows[ext_id] if ext_id is not None else array("I")
+            candidates.append(("ext", bucket, True))
+        if keyword is not None:
+            bucket = self._keyword_rows.get(keyword, array("I"))
+            candidates.append(("keyword", bucket, True))
+        if size_range:
+            candidates.append(("sizes", self._range_rows("sizes", *size_range), False))
+        if mtime_range:
+            candidates.append(
+                ("mtimes", self._range_rows("mtimes", *mtime_range), False)
+            )
+
+        base = None
+        rows = None  # 전체
+        if candidates:
+            name, bucket, ordered = min(candidates, key=lambda item: len(item[1]))
+            # 범위 후보가 많으면 정렬보다 열을 한 번 훑는 편이 빠름
+            if ordered or len(bucket) <= len(self.names) // 4:
+                base = name
+                rows = list(bucket) if ordered else sorted(bucket)
+
+        # 나머지 조건은 열 값으로 확인
+        if rows is None and candidates:
+            rows = range(len(self.names))
+        if ext is not None and base != "ext":
+            ext_id = self._ext_ids.get(ext.lower())
+            ext_ids = self.ext_ids
+            rows = [row for row in rows if ext_ids[row] == ext_id]
+        if keyword is not None and base != "keyword":
+            rule_set = {i for i, rule in enumerate(self.rules) if rule[0] == keyword}
+            rule_ids = self.rule_ids
+            rows = [row for row in rows if rule_ids[row] in rule_set]
+        for column, value_range in (("sizes", size_range), ("mtimes", mtime_range)):
+            if value_range and base != column:
+                rows = self._filter_range(rows, getattr(self, column), *value_range)
+        if text:
+            rows = self._filter_text(rows, text)
+
+        rows = rows if isinstance(rows, list) else list(rows)
+        self._last_filter = (key, text, rows)
+        return list(rows)
+
+    @staticmethod
+    def _filter_range(rows, values, low, high) -> List[int]:
+        """값이 [low, high) 범위인 행만 남김"""
+        if low is None:
+            return [row for row in rows if values[row] < high]
+        if high is None:
+            return [row for row in rows if values[row] >= low]
+        return [row for row in rows if low <= values[row] < high]
+
+    # 체크 상태
+
+    def is_checked(self, row: int) -> bool:
+        """행의 체크 여부"""
+        return bool(self.checked[row])
+
+    def set_checked(self, row: int, value: bool):
+        """행의 체크 상태 변경"""
+        value = 1 if value else 0
+        if self.checked[row] != value:
+            self.checked[row] = value
+            change = 1 if value else -1
+            self.checked_count += change
+            if self._visible_checked is not None and self._view_mask[row]:
+                self._visible_checked += change
+
+    def toggle(self, row: int) -> bool:
+        """행의 체크 상태 토글
+
+        Returns:
+            바뀐 체크 상태
+        """
+        value = not self.checked[row]
+        self.set_checked(row, value)
+        return value
+
+    def set_visible_checked(self, value: bool):
+        """표시 중인 모든 행의 체크 상태 변경
+
+        행마다 반복하지 않고 바이트열/정수 연산 한 번으로 바꾼다.
+
+        Args:
+            value: 체크 여부
+        """
+        size = len(self.names)
+        if self.view is None:
+            self.checked = bytearray(b"\x01" * size if value else size)
+            self.checked_count = size if value else 0
+            return
+
+        checked = int.from_bytes(self.checked, "little")
+        mask = int.from_bytes(self._get_view_mask(), "little")
+        if value:
+            checked |= mask
+        else:
+            # 바이트가 0/1이므로 빼도 자리올림이 없음
+            checked -= checked & mask
+        self.checked = bytearray(checked.to_bytes(size, "little"))
+        self.checked_count = self.checked.count(1)
+        self._visible_checked = len(self.view) if value else 0
+
+    def _get_view_mask(self) -> bytearray:
+        """행별 표시 여부 (표시 목록이 바뀐 뒤 처음 필요할 때 만듦)"""
+        if self._view_mask is None:
+            mask = bytearray(len(self.names))
+            for row in self.view:
+                mask[row] = 1
+            self._view_mask = mask
+        return self._view_mask
+
+    def _visible_checked_bytes(self) -> bytes:
+        """행별 (체크 AND 표시) 여부
+
+        0/1 바이트열을 정수로 바꿔 AND하므로 행마다 파이썬 연산을 하지 않는다.
+        """
+        size = len(self.names)
+        value = int.from_bytes(self.checked, "little") & int.from_bytes(
+            self._get_view_mask(), "little"
+        )
+        return value.to_bytes(size, "little")
+
+    def visible_checked_count(self) -> int:
+        """표시 중이면서 체크된 행 수 (체크 변경 시 갱신되므로 보통 O(1))"""
+        if self.view is None:
+            return self.checked_count
+        if self._visible_checked is None:
+            self._visible_checked = self._visible_checked_bytes().count(1)
+        return self._visible_checked
+
+    def visible_checked_rows(self) -> List[int]:
+        """표시 중이면서 체크된 행 번호 (행 순서, 체크된 행 수에 비례)"""
+        if self.view is None:
+            flags = self.checked
+        else:
+            flags = self._visible_checked_bytes()
+
+        rows = []
+        find = flags.find
+        row = find(1)
+        while row != -1:
+            rows.append(row)
+            row = find(1, row + 1)
+        return rows
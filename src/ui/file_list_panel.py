@@ -11,16 +11,29 @@ import threading
 import subprocess
 import platform
 from tkinter import ttk
-from datetime import datetime, timedelta
+from datetime import datetime
 
 # from src.utils.icon_manager import IconManager
-from src.utils.performance import FileInfoCache, ProgressTracker
+from src.constants import ADVANCED_SETTINGS
+from src.core.compiled_rules import CompiledRuleSet
+from src.core.file_matcher import FileMatcher
+from src.utils.performance import ResultStream
+from src.utils.scan_index import ScanIndex
+from src.utils.scan_progress import ScanProgressEstimator
+from src.ui.file_list_model import FileListModel
 from src.ui.progress_dialog import ProgressDialog
 
 
 class FileListPanel:
     """파일 목록 패널 클래스"""
 
+    # 스캔 결과를 목록에 옮기는 타이머 간격(ms)과 한 번에 쓸 시간(초)
+    SCAN_DRAIN_INTERVAL = 50
+    SCAN_DRAIN_BUDGET = 0.03
+
+    # 파일명 검색 입력이 멈춘 뒤 필터를 적용할 때까지 기다리는 시간(ms)
+    FILTER_DELAY = 150
+
     def __init__(self, parent, file_matcher, callbacks):
         """초기화
 
@@ -33,17 +46,23 @@ class FileListPanel:
         self.file_matcher = file_matcher
         self.callbacks = callbacks
 
-        # 파일 목록 관련 변수
-        self.file_list_data = []  # 매칭된 파일 정보
-        self.file_vars = {}  # 체크박스 변수들
+        # 파일 목록 관련 변수 (트리뷰에는 보이는 줄만 만듦)
+        self.model = FileListModel()  # 매칭된 파일 정보와 체크 상태
+        self.view_offset = 0  # 첫 번째 보이는 줄의 표시 위치
+        self.visible_rows = 20  # 트리뷰에 보이는 줄 수
+        self.slot_items = []  # 보이는 줄마다 재사용하는 트리뷰 아이템
+        self.item_slots = {}  # 트리뷰 아이템 -> 줄 위치
+        self.item_rows = {}  # 트리뷰 아이템 -> 표시 중인 행 번호
+        self.selected_pos = None  # 선택된 줄의 표시 위치
 
         # 아이콘 매니저 초기화
         # self.icon_manager = IconManager()
 
         # 성능 개선
-        self.file_cache = FileInfoCache()
         self.scan_thread = None
         self.is_scanning = False
+        self.scan_stream = None  # 스캔 스레드 -> UI 결과 스트림
+        self.scan_error = None
 
         # 필터 변수
         self.filter_var = tk.StringVar()
@@ -51,6 +70,7 @@ class FileListPanel:
         self.size_filter_var = tk.StringVar(value="모든 크기")
         self.date_filter_var = tk.StringVar(value="모든 날짜")
         self.rule_filter_var = tk.StringVar(value="모든 규칙")
+        self._filter_job = None  # 예약된 파일명 검색 필터
 
         # 프레임 생성
         self.create_panel()
@@ -92,7 +112,7 @@ class FileListPanel:
 
         ttk.Label(text_filter_frame, text="파일명 검색:").pack(side=tk.LEFT, padx=2)
 
-        self.filter_var.trace_add("write", lambda *args: self.apply_filters())
+        self.filter_var.trace_add("write", lambda *args: self._schedule_filters())
         filter_entry = ttk.Entry(
             text_filter_frame, textvariable=self.filter_var, width=25
         )
@@ -215,18 +235,17 @@ class FileListPanel:
         self.file_tree.column("rule", width=100)
         self.file_tree.column("destination", width=150)
 
-        file_scrollbar_y = ttk.Scrollbar(
-            tree_frame, orient=tk.VERTICAL, command=self.file_tree.yview
+        # 세로 스크롤은 트리뷰가 아니라 모델의 표시 위치를 움직임
+        self.file_scrollbar_y = ttk.Scrollbar(
+            tree_frame, orient=tk.VERTICAL, command=self._on_scrollbar
         )
         file_scrollbar_x = ttk.Scrollbar(
             tree_frame, orient=tk.HORIZONTAL, command=self.file_tree.xview
         )
-        self.file_tree.configure(
-            yscrollcommand=file_scrollbar_y.set, xscrollcommand=file_scrollbar_x.set
-        )
+        self.file_tree.configure(xscrollcommand=file_scrollbar_x.set)
 
         self.file_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        file_scrollbar_y.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.file_scrollbar_y.grid(row=0, column=1, sticky=(tk.N, tk.S))
         file_scrollbar_x.grid(row=1, column=0, sticky=(tk.W, tk.E))
 
         tree_frame.columnconfigure(0, weight=1)
@@ -237,10 +256,159 @@ class FileListPanel:
         self.file_tree.bind("<Double-Button-1>", self.on_file_double_click)  # 더블 클릭
         self.file_tree.bind("<Return>", self.on_file_enter)  # 엔터
 
+        # 가상 목록 스크롤/선택
+        self.file_tree.bind("<Configure>", self._on_tree_configure)
+        self.file_tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.file_tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.file_tree.bind("<Button-4>", lambda e: self._scroll_rows(-3))
+        self.file_tree.bind("<Button-5>", lambda e: self._scroll_rows(3))
+        self.file_tree.bind("<Up>", lambda e: self._move_selection(-1))
+        self.file_tree.bind("<Down>", lambda e: self._move_selection(1))
+        self.file_tree.bind(
+            "<Prior>", lambda e: self._move_selection(-self.visible_rows)
+        )
+        self.file_tree.bind("<Next>", lambda e: self._move_selection(self.visible_rows))
+        self.file_tree.bind(
+            "<Home>", lambda e: self._move_selection(-self.model.view_count)
+        )
+        self.file_tree.bind(
+            "<End>", lambda e: self._move_selection(self.model.view_count)
+        )
+
         # 컨텍스트 메뉴
         self.create_context_menu()
         self.file_tree.bind("<Button-3>", self.show_context_menu)  # 우클릭
 
+    def render_rows(self):
+        """보이는 줄만 트리뷰에 채우기 (아이템은 재사용)"""
+        count = self.model.view_count
+        self.view_offset = max(0, min(self.view_offset, count - self.visible_rows))
+        slots = max(0, min(self.visible_rows, count - self.view_offset))
+
+        # 보이는 줄 수만큼만 아이템 유지
+        while len(self.slot_items) < slots:
+            item = self.file_tree.insert("", "end")
+            self.item_slots[item] = len(self.slot_items)
+            self.slot_items.append(item)
+        while len(self.slot_items) > slots:
+            item = self.slot_items.pop()
+            del self.item_slots[item]
+            self.item_rows.pop(item, None)
+            self.file_tree.delete(item)
+
+        for slot, item in enumerate(self.slot_items):
+            row = self.model.row_at(self.view_offset + slot)
+            self.item_rows[item] = row
+            self.file_tree.item(item, values=self._row_values(row))
+
+        # 선택된 줄이 보일 때만 트리뷰에서 선택 표시
+        selection = self.file_tree.selection()
+        slot = -1
+        if self.selected_pos is not None:
+            slot = self.selected_pos - self.view_offset
+        if 0 <= slot < slots:
+            if selection != (self.slot_items[slot],):
+                self.file_tree.selection_set(self.slot_items[slot])
+        elif selection:
+            self.file_tree.selection_remove(selection)
+
+        # 트리뷰 자체는 스크롤하지 않음
+        self.file_tree.yview_moveto(0)
+        if count:
+            self.file_scrollbar_y.set(
+                self.view_offset / count, (self.view_offset + slots) / count
+            )
+        else:
+            self.file_scrollbar_y.set(0, 1)
+
+    def _row_values(self, row):
+        """트리뷰 줄에 표시할 값"""
+        check_mark = "✓" if self.model.is_checked(row) else ""
+        return (check_mark,) + self.model.display_values(row)
+
+    def _item_row(self, item):
+        """트리뷰 아이템이 표시 중인 행 번호 (없으면 None)"""
+        return self.item_rows.get(item)
+
+    def _get_selected_row(self):
+        """선택된 줄의 행 번호 (없으면 None)"""
+        if self.selected_pos is None or self.selected_pos >= self.model.view_count:
+            return None
+        return self.model.row_at(self.selected_pos)
+
+    def _on_tree_configure(self, event):
+        """트리뷰 크기 변경 시 보이는 줄 수 다시 계산"""
+        top, row_height = 25, 20  # 헤더 높이, 줄 높이 기본값
+        if self.slot_items:
+            bbox = self.file_tree.bbox(self.slot_items[0])
+            if bbox:
+                top, row_height = bbox[1], bbox[3]
+
+        visible_rows = max(1, (event.height - top) // max(row_height, 1))
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self.render_rows()
+
+    def _on_tree_select(self, event):
+        """트리뷰 선택을 표시 위치로 기억"""
+        selection = self.file_tree.selection()
+        if selection and selection[0] in self.item_slots:
+            self.selected_pos = self.view_offset + self.item_slots[selection[0]]
+
+    def _on_scrollbar(self, *args):
+        """세로 스크롤바 명령 (moveto / scroll)"""
+        if args[0] == "moveto":
+            self.view_offset = int(float(args[1]) * self.model.view_count)
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= self.visible_rows
+            self.view_offset += amount
+        self.render_rows()
+
+    def _on_mousewheel(self, event):
+        """마우스 휠 스크롤 (Windows/macOS)"""
+        if platform.system() == "Darwin":
+            amount = -event.delta
+        else:
+            amount = -(event.delta // 120) * 3
+        return self._scroll_rows(amount)
+
+    def _scroll_rows(self, amount):
+        """amount 줄만큼 스크롤"""
+        self.view_offset += amount
+        self.render_rows()
+        return "break"
+
+    def _move_selection(self, delta):
+        """선택을 delta 줄만큼 이동하고 보이도록 스크롤"""
+        count = self.model.view_count
+        if not count:
+            return "break"
+
+        if self.selected_pos is None:
+            position = self.view_offset
+        else:
+            position = self.selected_pos + delta
+        position = max(0, min(position, count - 1))
+        self.selected_pos = position
+
+        if position < self.view_offset:
+            self.view_offset = position
+        elif position >= self.view_offset + self.visible_rows:
+            self.view_offset = position - self.visible_rows + 1
+        self.render_rows()
+
+        slot = position - self.view_offset
+        if 0 <= slot < len(self.slot_items):
+            self.file_tree.focus(self.slot_items[slot])
+        return "break"
+
+    def _reset_view_position(self):
+        """스크롤과 선택을 처음으로"""
+        self.view_offset = 0
+        self.selected_pos = None
+
     # def refresh_file_list(self):
     #     """파일 목록 새로고침"""
     #     # 기존 목록 초기화
@@ -306,17 +474,16 @@ class FileListPanel:
 
     def refresh_file_list(self):
         """파일 목록 새로고침 - 성능 개선 버전"""
-        # 이미 스캔 중이면 중지
+        # 이미 스캔 중이거나 결과를 옮기는 중이면 중지
         if self.is_scanning and self.scan_thread and self.scan_thread.is_alive():
             return
+        if self.scan_stream is not None:
+            return
 
         # 기존 목록 초기화
-        for item in self.file_tree.get_children():
-            self.file_tree.delete(item)
-
-        self.file_list_data.clear()
-        self.file_vars.clear()
-        self.file_cache.clear()
+        self.model.clear()
+        self._reset_view_position()
+        self.render_rows()
 
         # 설정 가져오기
         source = self.callbacks.get("get_source", lambda: None)()
@@ -331,173 +498,146 @@ class FileListPanel:
             self.callbacks.get("update_stats", lambda: None)()
             return
 
+        # 규칙 관리자의 공유 컴파일 캐시 사용 (규칙이 바뀔 때만 다시 컴파일)
+        get_compiled_rules = self.callbacks.get("get_compiled_rules")
+        if get_compiled_rules:
+            compiled_rules = get_compiled_rules()
+        else:
+            compiled_rules = CompiledRuleSet(active_rules, self.callbacks.get("log"))
+
         # 진행률 다이얼로그 표시
         self.progress_dialog = ProgressDialog(
             self.frame.winfo_toplevel(), title="파일 검색 중", can_cancel=True
         )
         self.progress_dialog.set_indeterminate("파일을 검색하는 중...")
 
+        # 스캔 결과는 크기가 제한된 스트림으로 받아서 타이머로 목록에 추가
+        self.scan_stream = ResultStream(
+            min_chunk=ADVANCED_SETTINGS.get("scan_batch_size", 100)
+        )
+        self.scan_error = None
+
         # 백그라운드 스레드에서 스캔
         self.is_scanning = True
         self.scan_thread = threading.Thread(
-            target=self._scan_files_thread, args=(source, active_rules), daemon=True
+            target=self._scan_files_thread,
+            args=(source, compiled_rules, self.scan_stream, self.progress_dialog),
+            daemon=True,
         )
         self.scan_thread.start()
+        self.frame.after(self.SCAN_DRAIN_INTERVAL, self._drain_scan_results)
 
-    def _scan_files_thread(self, source, active_rules):
-        """백그라운드에서 파일 스캔"""
+    def _scan_files_thread(self, source, compiled_rules, stream, progress_dialog):
+        """백그라운드에서 파일 스캔 (결과는 stream으로 전달)"""
+        scan_index = None
         try:
             include_subfolders = self.callbacks.get(
                 "get_subfolder_option", lambda: True
             )()
 
-            # 먼저 전체 파일 수 계산 (빠른 추정)
-            total_estimate = self._estimate_file_count(source, include_subfolders)
+            # 스캔 색인은 이 스레드에서 열고 닫음 (sqlite 연결은 스레드 전용)
+            scan_index = self._open_scan_index()
+            filter_strategy = ADVANCED_SETTINGS.get(
+                "scan_filter_strategy", FileMatcher.METADATA_FIRST
+            )
 
-            # 진행률 트래커 설정
-            tracker = ProgressTracker(
-                total=total_estimate,
-                callback=lambda cur, tot, pct, msg: self.frame.after(
+            # 사전 탐색 없이 이전 스캔 파일 수와 폴더 진행 상황으로 진행률 추정
+            # (색인 없는 파일명 우선 스캔은 매칭된 파일만 세므로 이전 파일 수 미사용)
+            progress = ScanProgressEstimator(
+                source,
+                include_subfolders,
+                callback=lambda cur, tot, msg: self.frame.after(
                     0, self._update_scan_progress, cur, tot, msg
                 ),
+                counts_all_files=(
+                    scan_index is not None
+                    or filter_strategy != FileMatcher.NAME_FIRST
+                ),
             )
 
-            batch = []
-            batch_size = 100
-
-            for (
-                file_path,
-                dest_folder,
-                keyword,
-                match_mode,
-            ) in self.file_matcher.find_matching_files_generator(
-                source, active_rules, include_subfolders
+            for record in self.file_matcher.find_matching_records(
+                source,
+                compiled_rules,
+                include_subfolders,
+                progress.update,
+                scan_index,
+                exclude_patterns=ADVANCED_SETTINGS.get("scan_exclude_patterns"),
+                max_depth=ADVANCED_SETTINGS.get("scan_max_depth", 0),
+                prune_destinations=ADVANCED_SETTINGS.get(
+                    "scan_prune_destinations", True
+                ),
+                filter_strategy=filter_strategy,
             ):
 
                 # 취소 확인
-                if self.progress_dialog.cancelled:
+                if progress_dialog.cancelled:
                     break
 
-                # 캐시된 정보 사용
-                file_info = self._get_file_info_cached(
-                    file_path, dest_folder, keyword, match_mode
-                )
-                batch.append(file_info)
-
-                # 배치 처리
-                if len(batch) >= batch_size:
-                    self.frame.after(0, self._add_files_batch, batch.copy())
-                    batch.clear()
-                    tracker.update(
-                        batch_size, f"{len(self.file_list_data)}개 파일 발견"
-                    )
-
-            # 남은 파일 처리
-            if batch:
-                self.frame.after(0, self._add_files_batch, batch)
+                # 스캔 중 얻은 stat 정보가 담긴 레코드를 그대로 전달
+                # 목록이 못 따라가면 자리가 날 때까지 대기 (취소 시 중단)
+                if not stream.put(record, lambda: progress_dialog.cancelled):
+                    break
+                progress.matched += 1
 
-            # 완료
-            self.frame.after(0, self._scan_complete)
+            # 끝까지 스캔한 경우에만 파일 수 저장 (다음 스캔 진행률 추정용)
+            if not progress_dialog.cancelled:
+                progress.save()
 
         except Exception as e:
             print(f"파일 스캔 오류: {e}")
-            self.frame.after(0, self._scan_error, str(e))
+            self.scan_error = str(e)
         finally:
+            if scan_index is not None:
+                scan_index.close()
             self.is_scanning = False
+            stream.close()
 
-    def _estimate_file_count(self, source, include_subfolders):
-        """파일 수 추정 (빠른 계산)"""
-        count = 0
-        try:
-            if include_subfolders:
-                for root, dirs, files in os.walk(source):
-                    count += len(files)
-                    # 너무 깊으면 추정치 사용
-                    if count > 1000:
-                        # 현재까지의 비율로 추정
-                        return count * 2
+    def _drain_scan_results(self):
+        """스캔 결과를 시간 예산 안에서 목록에 추가 (UI 타이머)"""
+        stream = self.scan_stream
+        if stream is None:
+            return
+
+        if stream.drain(self._add_files_batch, self.SCAN_DRAIN_BUDGET):
+            # 화면/카운트/통계는 타이머 한 번에 한 번만 갱신
+            self.render_rows()
+            self.file_count_label.config(text=f"({len(self.model)}개 파일)")
+            self.callbacks.get("update_stats", lambda: None)()
+
+        if stream.done:
+            self.scan_stream = None
+            if self.scan_error:
+                self._scan_error(self.scan_error)
             else:
-                count = len(
-                    [
-                        f
-                        for f in os.listdir(source)
-                        if os.path.isfile(os.path.join(source, f))
-                    ]
-                )
-        except:
-            return 100  # 기본값
-
-        return max(count, 100)
-
-    def _get_file_info_cached(self, file_path, dest_folder, keyword, match_mode):
-        """캐시를 사용한 파일 정보 가져오기"""
-        # 캐시 확인
-        cached_info = self.file_cache.get(file_path)
-
-        if cached_info:
-            file_stat_info = cached_info
-        else:
-            # 새로 가져오기
-            try:
-                file_stat = os.stat(file_path)
-                file_stat_info = {
-                    "size": file_stat.st_size,
-                    "modified": file_stat.st_mtime,
-                }
-                self.file_cache.set(file_path, file_stat_info)
-            except:
-                file_stat_info = {"size": 0, "modified": 0}
-
-        # 파일 정보 생성
-        size = self.format_file_size(file_stat_info["size"])
-        modified = datetime.fromtimestamp(file_stat_info["modified"]).strftime(
-            "%Y-%m-%d %H:%M"
-        )
+                self._scan_complete()
+            return
+
+        self.frame.after(self.SCAN_DRAIN_INTERVAL, self._drain_scan_results)
+
+    def _open_scan_index(self):
+        """스캔 색인 열기 (사용하지 않거나 열 수 없으면 None)"""
+        if not ADVANCED_SETTINGS.get("scan_index", True):
+            return None
 
+        try:
+            return ScanIndex()
+        except Exception as e:
+            # 색인 없이도 전체 스캔은 가능
+            print(f"스캔 색인을 열 수 없습니다: {e}")
+            return None
+
+    def _add_files_batch(self, records):
+        """스캔 레코드 배치 추가 (화면 갱신은 _drain_scan_results에서)"""
+        self.model.extend(records, self._destination_label)
+
+    def _destination_label(self, dest_folder):
+        """대상 열에 표시할 문자열 (규칙마다 한 번만 계산)"""
         is_delete = self.callbacks.get("is_delete_mode", lambda: False)()
         is_permanent = self.callbacks.get("is_permanent_delete", lambda: False)()
 
         if is_delete:
-            destination = "삭제" if not is_permanent else "영구삭제"
-        else:
-            destination = os.path.basename(dest_folder) if dest_folder else ""
-
-        return {
-            "path": file_path,
-            "filename": os.path.basename(file_path),
-            "size": size,
-            "modified": modified,
-            "rule": f"{keyword} ({match_mode})",
-            "keyword": keyword,
-            "match_mode": match_mode,
-            "destination": destination,
-            "dest_folder": dest_folder,
-        }
-
-    def _add_files_batch(self, files):
-        """파일 배치 추가"""
-        for file_info in files:
-            self.file_list_data.append(file_info)
-
-            # 트리에 추가
-            item_id = self.file_tree.insert(
-                "",
-                "end",
-                values=(
-                    "✓",
-                    file_info["filename"],
-                    file_info["size"],
-                    file_info["modified"],
-                    file_info["rule"],
-                    file_info["destination"],
-                ),
-            )
-
-            self.file_vars[item_id] = tk.BooleanVar(value=True)
-
-        # 카운트 업데이트
-        self.file_count_label.config(text=f"({len(self.file_list_data)}개 파일)")
-        self.callbacks.get("update_stats", lambda: None)()
+            return "삭제" if not is_permanent else "영구삭제"
+        return os.path.basename(dest_folder) if dest_folder else ""
 
     def _update_scan_progress(self, current, total, message):
         """스캔 진행률 업데이트"""
@@ -528,32 +668,6 @@ class FileListPanel:
 
         messagebox.showerror("오류", f"파일 검색 중 오류 발생:\n{error_msg}")
 
-    def get_file_info(self, file_path, dest_folder, keyword, match_mode):
-        """파일 정보 가져오기"""
-        file_stat = os.stat(file_path)
-        size = self.format_file_size(file_stat.st_size)
-        modified = datetime.fromtimestamp(file_stat.st_mtime).strftime("%Y-%m-%d %H:%M")
-
-        is_delete = self.callbacks.get("is_delete_mode", lambda: False)()
-        is_permanent = self.callbacks.get("is_permanent_delete", lambda: False)()
-
-        if is_delete:
-            destination = "삭제" if not is_permanent else "영구삭제"
-        else:
-            destination = os.path.basename(dest_folder) if dest_folder else ""
-
-        return {
-            "path": file_path,
-            "filename": os.path.basename(file_path),
-            "size": size,
-            "modified": modified,
-            "rule": f"{keyword} ({match_mode})",
-            "keyword": keyword,
-            "match_mode": match_mode,
-            "destination": destination,
-            "dest_folder": dest_folder,
-        }
-
     def format_file_size(self, size):
         """파일 크기 포맷팅"""
         for unit in ["B", "KB", "MB", "GB"]:
@@ -569,14 +683,11 @@ class FileListPanel:
             column = self.file_tree.identify_column(event.x)
             if column == "#1":  # 체크박스 열
                 item = self.file_tree.identify_row(event.y)
-                if item:
+                row = self._item_row(item)
+                if row is not None:
                     # 체크 상태 토글
-                    current = self.file_vars[item].get()
-                    self.file_vars[item].set(not current)
-                    check_mark = "✓" if not current else ""
-                    values = list(self.file_tree.item(item)["values"])
-                    values[0] = check_mark
-                    self.file_tree.item(item, values=values)
+                    self.model.toggle(row)
+                    self.file_tree.item(item, values=self._row_values(row))
                     self.callbacks.get("update_stats", lambda: None)()
 
     def create_context_menu(self):
@@ -602,7 +713,8 @@ class FileListPanel:
     def show_context_menu(self, event):
         """컨텍스트 메뉴 표시"""
         item = self.file_tree.identify_row(event.y)
-        if item:
+        if item in self.item_slots:
+            self.selected_pos = self.view_offset + self.item_slots[item]
             self.file_tree.selection_set(item)
             self.context_menu.post(event.x_root, event.y_root)
 
@@ -616,74 +728,46 @@ class FileListPanel:
 
     def on_file_enter(self, event):
         """엔터키 이벤트"""
-        selection = self.file_tree.selection()
-        if selection:
+        if self._get_selected_row() is not None:
             self.open_selected_file()
 
     def open_selected_file(self):
         """선택된 파일 열기"""
-        selection = self.file_tree.selection()
-        if not selection:
+        row = self._get_selected_row()
+        if row is None:
             return
 
-        item = selection[0]
-        # 트리에서 아이템의 인덱스 찾기
-        items = self.file_tree.get_children()
-        index = items.index(item)
-
-        if 0 <= index < len(self.file_list_data):
-            file_info = self.file_list_data[index]
-            file_path = file_info["path"]
-
-            if os.path.exists(file_path):
-                self.open_file(file_path)
+        file_path = self.model.get(row)["path"]
+        if os.path.exists(file_path):
+            self.open_file(file_path)
 
     def open_file_location(self):
         """파일 위치 열기"""
-        selection = self.file_tree.selection()
-        if not selection:
+        row = self._get_selected_row()
+        if row is None:
             return
 
-        item = selection[0]
-        items = self.file_tree.get_children()
-        index = items.index(item)
-
-        if 0 <= index < len(self.file_list_data):
-            file_info = self.file_list_data[index]
-            file_path = file_info["path"]
-
-            if os.path.exists(file_path):
-                self.open_folder(os.path.dirname(file_path))
+        file_path = self.model.get(row)["path"]
+        if os.path.exists(file_path):
+            self.open_folder(os.path.dirname(file_path))
 
     def show_file_properties(self):
         """파일 속성 표시"""
-        selection = self.file_tree.selection()
-        if not selection:
+        row = self._get_selected_row()
+        if row is None:
             return
 
-        item = selection[0]
-        items = self.file_tree.get_children()
-        index = items.index(item)
-
-        if 0 <= index < len(self.file_list_data):
-            file_info = self.file_list_data[index]
-            self.show_file_info_dialog(file_info)
+        self.show_file_info_dialog(self.model.get(row))
 
     def toggle_selected_file(self):
         """선택된 파일 체크 토글"""
-        selection = self.file_tree.selection()
-        if not selection:
+        row = self._get_selected_row()
+        if row is None:
             return
 
-        item = selection[0]
-        if item in self.file_vars:
-            current = self.file_vars[item].get()
-            self.file_vars[item].set(not current)
-            check_mark = "✓" if not current else ""
-            values = list(self.file_tree.item(item)["values"])
-            values[0] = check_mark
-            self.file_tree.item(item, values=values)
-            self.callbacks.get("update_stats", lambda: None)()
+        self.model.toggle(row)
+        self.render_rows()
+        self.callbacks.get("update_stats", lambda: None)()
 
     def open_file(self, file_path):
         """파일 열기 (플랫폼별)"""
@@ -743,25 +827,30 @@ class FileListPanel:
             messagebox.showerror("오류", f"파일 정보를 가져올 수 없습니다:\n{str(e)}")
 
     def select_all_files(self):
-        """모든 파일 선택"""
-        for item in self.file_tree.get_children():
-            self.file_vars[item].set(True)
-            values = list(self.file_tree.item(item)["values"])
-            values[0] = "✓"
-            self.file_tree.item(item, values=values)
+        """모든 파일 선택 (보이는 줄만 다시 그림)"""
+        self.model.set_visible_checked(True)
+        self.render_rows()
         self.callbacks.get("update_stats", lambda: None)()
 
     def deselect_all_files(self):
-        """모든 파일 선택 해제"""
-        for item in self.file_tree.get_children():
-            self.file_vars[item].set(False)
-            values = list(self.file_tree.item(item)["values"])
-            values[0] = ""
-            self.file_tree.item(item, values=values)
+        """모든 파일 선택 해제 (보이는 줄만 다시 그림)"""
+        self.model.set_visible_checked(False)
+        self.render_rows()
         self.callbacks.get("update_stats", lambda: None)()
 
+    def _schedule_filters(self):
+        """파일명 검색 입력이 멈추면 필터 적용 (키 입력마다 적용하지 않음)"""
+        if self._filter_job is not None:
+            self.frame.after_cancel(self._filter_job)
+        self._filter_job = self.frame.after(self.FILTER_DELAY, self.apply_filters)
+
     def apply_filters(self):
         """모든 필터 적용"""
+        # 예약된 검색 필터는 지금 함께 적용
+        if self._filter_job is not None:
+            self.frame.after_cancel(self._filter_job)
+            self._filter_job = None
+
         # 필터 값 가져오기
         text_filter = self.filter_var.get().lower()
         ext_filter = self.ext_filter_var.get()
@@ -769,131 +858,34 @@ class FileListPanel:
         date_filter = self.date_filter_var.get()
         rule_filter = self.rule_filter_var.get()
 
-        # 먼저 모든 아이템을 삭제
-        for item in self.file_tree.get_children():
-            self.file_tree.delete(item)
+        # 스캔 때 저장한 열 값과 색인으로 필터링 (파일 시스템 조회 없음)
+        visible = self.model.filter_rows(
+            text=text_filter,
+            ext=None if ext_filter == "모든 파일" else ext_filter,
+            size_range=self.model.SIZE_RANGES.get(size_filter),
+            mtime_range=self.model.date_range(date_filter),
+            keyword=None if rule_filter == "모든 규칙" else rule_filter,
+        )
 
-        # 필터링된 아이템만 다시 추가
-        visible_count = 0
-        self.file_vars.clear()
-
-        for i, file_info in enumerate(self.file_list_data):
-            # 각 필터 조건 확인
-            show = True
-
-            # 1. 텍스트 필터
-            if text_filter and text_filter not in file_info["filename"].lower():
-                show = False
-
-            # 2. 확장자 필터
-            if show and ext_filter != "모든 파일":
-                _, ext = os.path.splitext(file_info["filename"])
-                if ext.lower() != ext_filter.lower():
-                    show = False
-
-            # 3. 크기 필터
-            if show and size_filter != "모든 크기":
-                size = self.get_file_size_in_bytes(file_info["path"])
-                if not self.check_size_filter(size, size_filter):
-                    show = False
-
-            # 4. 날짜 필터
-            if show and date_filter != "모든 날짜":
-                if not self.check_date_filter(file_info["path"], date_filter):
-                    show = False
-
-            # 5. 규칙 필터
-            if show and rule_filter != "모든 규칙":
-                if file_info["keyword"] != rule_filter:
-                    show = False
-
-            # 필터 조건에 맞는 아이템만 트리에 추가
-            if show:
-                item_id = self.file_tree.insert(
-                    "",
-                    "end",
-                    # image=self.icon_manager.get_icon(file_info["filename"]),  # 아이콘 추가
-                    values=(
-                        "✓",  # 기본적으로 체크
-                        file_info["filename"],
-                        file_info["size"],
-                        file_info["modified"],
-                        file_info["rule"],
-                        file_info["destination"],
-                    ),
-                )
-                # 체크박스 상태 저장
-                self.file_vars[item_id] = tk.BooleanVar(value=True)
-                visible_count += 1
+        # 트리뷰는 보이는 줄만 다시 채움
+        self.model.set_view(visible)
+        self._reset_view_position()
+        self.render_rows()
 
         # 필터 상태 업데이트
-        total_count = len(self.file_list_data)
-        self.update_filter_status(visible_count, total_count)
+        self.update_filter_status(self.model.view_count, len(self.model))
+        self.callbacks.get("update_stats", lambda: None)()
 
         # 확장자 필터 옵션 업데이트
         self.update_extension_filter_options()
 
     def update_extension_filter_options(self):
         """확장자 필터 옵션 업데이트"""
-        # 현재 파일들의 확장자 수집
-        extensions = set()
-        for file_info in self.file_list_data:
-            _, ext = os.path.splitext(file_info["filename"])
-            if ext:
-                extensions.add(ext.lower())
-
-        # 확장자 필터 콤보박스 업데이트
-        ext_list = ["모든 파일"] + sorted(list(extensions))
-        self.ext_filter["values"] = ext_list
+        # 확장자 필터 콤보박스 업데이트 (모델 색인에서 수집)
+        self.ext_filter["values"] = ["모든 파일"] + self.model.extensions()
 
         # 규칙 필터 옵션도 업데이트
-        rules = set()
-        for file_info in self.file_list_data:
-            rules.add(file_info["keyword"])
-
-        rule_list = ["모든 규칙"] + sorted(list(rules))
-        self.rule_filter["values"] = rule_list
-
-    def get_file_size_in_bytes(self, file_path):
-        """파일 크기를 바이트로 반환"""
-        try:
-            return os.path.getsize(file_path)
-        except:
-            return 0
-
-    def check_size_filter(self, size_bytes, filter_value):
-        """크기 필터 조건 확인"""
-        mb = size_bytes / (1024 * 1024)
-
-        if filter_value == "< 1MB":
-            return mb < 1
-        elif filter_value == "1-10MB":
-            return 1 <= mb <= 10
-        elif filter_value == "10-100MB":
-            return 10 <= mb <= 100
-        elif filter_value == "> 100MB":
-            return mb > 100
-        return True
-
-    def check_date_filter(self, file_path, filter_value):
-        """날짜 필터 조건 확인"""
-        try:
-            file_time = os.path.getmtime(file_path)
-            file_date = datetime.fromtimestamp(file_time)
-            now = datetime.now()
-
-            if filter_value == "오늘":
-                return file_date.date() == now.date()
-            elif filter_value == "이번 주":
-                week_start = now - timedelta(days=now.weekday())
-                return file_date >= week_start
-            elif filter_value == "이번 달":
-                return file_date.year == now.year and file_date.month == now.month
-            elif filter_value == "올해":
-                return file_date.year == now.year
-        except:
-            pass
-        return True
+        self.rule_filter["values"] = ["모든 규칙"] + self.model.keywords()
 
     def update_filter_status(self, visible_count, total_count):
         """필터 상태 표시 업데이트"""
@@ -918,24 +910,16 @@ class FileListPanel:
         self.apply_filters()
 
     def get_filtered_files(self):
-        """필터링된 파일만 반환"""
-        filtered_files = []
-
-        for i, item in enumerate(self.file_tree.get_children()):
-            # hidden 태그가 없는 파일들만
-            if "hidden" not in self.file_tree.item(item)["tags"]:
-                if self.file_vars[item].get():  # 체크된 항목만
-                    filtered_files.append(self.file_list_data[i])
-
-        return filtered_files
+        """필터링된 파일 중 체크된 파일만 반환"""
+        return [self.model.get(row) for row in self.model.visible_checked_rows()]
 
     def get_selected_count(self):
         """선택된 파일 개수 반환"""
-        return sum(1 for var in self.file_vars.values() if var.get())
+        return self.model.visible_checked_count()
 
     def get_total_count(self):
         """전체 파일 개수 반환"""
-        return len(self.file_list_data)
+        return len(self.model)
 
     def get_widget(self):
         """위젯 반환"""
@@ -286,6 +286,7 @@ class MainWindow:
             # 파일 목록 패널 콜백
             "get_source": lambda: self.settings_panel.source_var.get(),
             "get_active_rules": lambda: self.rule_manager.get_active_rules(),
+            "get_compiled_rules": lambda: self.rule_manager.get_compiled_rules(self.log),
             "get_subfolder_option": lambda: self.settings_panel.subfolder_var.get(),
             "is_delete_mode": lambda: self.settings_panel.delete_var.get(),
             "is_permanent_delete": lambda: self.settings_panel.permanent_delete_var.get(),
@@ -412,6 +413,16 @@ class MainWindow:
         )
         thread.start()
 
+    def _get_file_size(self, file_info):
+        """파일 크기 반환 (스캔 때 얻은 크기가 없을 때만 stat)"""
+        size = file_info.get("size_bytes")
+        if size is not None:
+            return size
+        try:
+            return os.path.getsize(file_info["path"])
+        except:
+            return 0
+
     def _organize_files_thread(self, selected_files):
         """파일 정리 스레드 - 성능 개선 버전"""
         self.status_panel.clear_log()
@@ -445,12 +456,9 @@ class MainWindow:
             "file_times": [],
         }
 
-        # 전체 크기 계산
+        # 전체 크기 계산 (스캔 때 얻은 크기 사용)
         for file_info in selected_files:
-            try:
-                stats["total_size"] += os.path.getsize(file_info["path"])
-            except:
-                pass
+            stats["total_size"] += self._get_file_size(file_info)
 
         # 배치 처리를 위한 설정
         batch_size = 10
@@ -472,11 +480,7 @@ class MainWindow:
             match_mode = file_info["match_mode"]
 
             # 파일 크기 추가
-            try:
-                file_size = os.path.getsize(file_path)
-                stats["processed_size"] += file_size
-            except:
-                pass
+            stats["processed_size"] += self._get_file_size(file_info)
 
             batch.append((file_path, dest_folder, keyword, match_mode))
 
@@ -91,6 +91,11 @@ class ProgressDialog(tk.Toplevel):
             detail: 상세 메시지
         """
         if total > 0:
+            # 불확정 모드였으면 진행률이 나오는 시점부터 확정 모드로 전환
+            if str(self.progress_bar.cget("mode")) == "indeterminate":
+                self.progress_bar.stop()
+                self.progress_bar.config(mode="determinate")
+
             progress = (current / total) * 100
             self.progress_var.set(progress)
             self.progress_label.config(text=f"{int(progress)}%")
@@ -118,6 +118,42 @@ class AdvancedSettingsDialog(tk.Toplevel):
         )
         batch_spinbox.grid(row=3, column=1, sticky=tk.W, pady=5)
 
+        # 스캔 색인
+        self.scan_index_var = tk.BooleanVar()
+        ttk.Checkbutton(
+            frame,
+            text="스캔 색인 사용 (바뀌지 않은 폴더는 다시 검색하지 않음)",
+            variable=self.scan_index_var,
+        ).grid(row=4, column=0, columnspan=2, sticky=tk.W, padx=10, pady=5)
+
+        # 제외할 폴더
+        ttk.Label(frame, text="검색 제외 폴더 (쉼표로 구분):").grid(
+            row=5, column=0, sticky=tk.W, padx=10, pady=5
+        )
+
+        self.exclude_patterns_var = tk.StringVar()
+        ttk.Entry(frame, textvariable=self.exclude_patterns_var, width=30).grid(
+            row=5, column=1, sticky=tk.W, pady=5
+        )
+
+        # 하위 폴더 검색 단계
+        ttk.Label(frame, text="하위 폴더 검색 단계 (0 = 제한 없음):").grid(
+            row=6, column=0, sticky=tk.W, padx=10, pady=5
+        )
+
+        self.max_depth_var = tk.IntVar()
+        ttk.Spinbox(
+            frame, from_=0, to=50, textvariable=self.max_depth_var, width=10
+        ).grid(row=6, column=1, sticky=tk.W, pady=5)
+
+        # 대상 폴더 제외
+        self.prune_destinations_var = tk.BooleanVar()
+        ttk.Checkbutton(
+            frame,
+            text="규칙 대상 폴더는 검색하지 않음 (정리된 파일 재검색 방지)",
+            variable=self.prune_destinations_var,
+        ).grid(row=7, column=0, columnspan=2, sticky=tk.W, padx=10, pady=5)
+
     def create_verification_tab(self, parent):
         """검증 설정 탭"""
         frame = ttk.Frame(parent)
@@ -220,6 +256,14 @@ class AdvancedSettingsDialog(tk.Toplevel):
         self.thread_count_var.set(self.current_settings.get("thread_count", 4))
         self.cache_size_var.set(self.current_settings.get("cache_size", 5000))
         self.batch_size_var.set(self.current_settings.get("batch_size", 100))
+        self.scan_index_var.set(self.current_settings.get("scan_index", True))
+        self.exclude_patterns_var.set(
+            ", ".join(self.current_settings.get("scan_exclude_patterns", []))
+        )
+        self.max_depth_var.set(self.current_settings.get("scan_max_depth", 0))
+        self.prune_destinations_var.set(
+            self.current_settings.get("scan_prune_destinations", True)
+        )
 
         # 검증
         self.verify_copy_var.set(self.current_settings.get("verify_copy", True))
@@ -245,6 +289,14 @@ class AdvancedSettingsDialog(tk.Toplevel):
             "thread_count": self.thread_count_var.get(),
             "cache_size": self.cache_size_var.get(),
             "batch_size": self.batch_size_var.get(),
+            "scan_index": self.scan_index_var.get(),
+            "scan_exclude_patterns": [
+                pattern.strip()
+                for pattern in self.exclude_patterns_var.get().split(",")
+                if pattern.strip()
+            ],
+            "scan_max_depth": self.max_depth_var.get(),
+            "scan_prune_destinations": self.prune_destinations_var.get(),
             # 검증
             "verify_copy": self.verify_copy_var.get(),
             "verify_method": self.verify_method_var.get(),
@@ -13,7 +13,6 @@ from tkinter import filedialog, messagebox, ttk
 from src.constants import DEFAULT_MATCH_MODE, MATCH_MODES
 from src.ui.settings_dialog import AdvancedSettingsDialog
 from src.constants import CONFIG_FILE
-from src.utils.performance import FileInfoCache
 from src.ui.benchmark_dialog import BenchmarkDialog
 from src.ui.drag_drop_mixin import DragDropMixin, DragDropFrame
 from src.core.file_processor import FileProcessor
@@ -834,6 +833,10 @@ class SettingsPanel(DragDropMixin):
             "thread_count": 4,
             "cache_size": 5000,
             "batch_size": 100,
+            "scan_index": True,
+            "scan_exclude_patterns": [".git", "node_modules", "__pycache__"],
+            "scan_max_depth": 0,
+            "scan_prune_destinations": True,
             "verify_copy": True,
             "verify_method": "quick",
             "verify_fail_action": "retry",
@@ -894,6 +897,14 @@ class SettingsPanel(DragDropMixin):
                 {
                     "multithread_copy": settings.get("multithread_copy", True),
                     "thread_count": settings.get("thread_count", 4),
+                    "scan_index": settings.get("scan_index", True),
+                    "scan_exclude_patterns": settings.get(
+                        "scan_exclude_patterns", [".git", "node_modules", "__pycache__"]
+                    ),
+                    "scan_max_depth": settings.get("scan_max_depth", 0),
+                    "scan_prune_destinations": settings.get(
+                        "scan_prune_destinations", True
+                    ),
                     "verify_copy": settings.get("verify_copy", True),
                     "verify_method": settings.get("verify_method", "quick"),
                     "verify_fail_action": settings.get("verify_fail_action", "retry"),
@@ -903,13 +914,6 @@ class SettingsPanel(DragDropMixin):
                 }
             )
 
-            # 캐시 초기화 (새 설정 적용)
-            if hasattr(self, "file_list_panel") and self.file_list_panel:
-                # 캐시 크기 변경 시 재생성
-                self.file_list_panel.file_cache = FileInfoCache(
-                    max_size=settings.get("cache_size", 5000)
-                )
-
             # 로그
             if self.callbacks.get("log"):
                 self.callbacks["log"]("고급 설정이 저장되었습니다.")
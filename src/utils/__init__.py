@@ -3,7 +3,17 @@ from .config import ConfigManager
 from .logger import Logger
 from .validators import Validator
 from .icon_manager import IconManager
-from .performance import FileInfoCache, ProgressTracker, copy_file_with_progress
+from .performance import (
+    BufferPool,
+    FileInfoCache,
+    ProgressTracker,
+    ResultStream,
+    copy_file_with_progress,
+)
+from .scan_index import ScanIndex
+from .scan_progress import ScanProgressEstimator
+from .chunk_tuner import ChunkSizeTuner
+from .device_profile import DeviceProfile, DeviceProfiler, get_device_profile
 from .benchmark import PerformanceBenchmark
 from .file_monitor import FileSystemMonitor, AutoOrganizer
 
@@ -12,9 +22,17 @@ __all__ = [
     "Logger", 
     "Validator", 
     "IconManager",
+    "BufferPool",
     "FileInfoCache",
     "ProgressTracker",
+    "ResultStream",
     "copy_file_with_progress",
+    "ScanIndex",
+    "ScanProgressEstimator",
+    "ChunkSizeTuner",
+    "DeviceProfile",
+    "DeviceProfiler",
+    "get_device_profile",
     "PerformanceBenchmark",
     "FileSystemMonitor",
     "AutoOrganizer",
@@ -485,6 +485,248 @@ class PerformanceBenchmark:
             "average_speed": f"{avg_speed:.1f} MB/s",
         }
 
+    def benchmark_rule_matching(
+        self, rule_count: int = 2000, file_count: int = 20000
+    ) -> Dict:
+        """규칙 매칭 벤치마크 (규칙별 루프 vs CompiledRuleSet)
+
+        Args:
+            rule_count: 생성할 규칙 수
+            file_count: 생성할 파일명 수
+
+        Returns:
+            측정 결과 (두 방식의 결과 일치 여부 포함)
+        """
+        from src.core.compiled_rules import CompiledRuleSet
+        from src.core.file_matcher import FileMatcher
+
+        rules, filenames = self._generate_rule_test_data(rule_count, file_count)
+
+        # 1. 기존 방식: 파일마다 규칙 순서대로 match_file 호출
+        start_time = time.perf_counter()
+        loop_results = []
+        for filename in filenames:
+            matched = None
+            for keyword, rule_data in rules.items():
+                if FileMatcher.match_file(filename, keyword, rule_data["match_mode"]):
+                    matched = keyword
+                    break
+            loop_results.append(matched)
+        loop_time = time.perf_counter() - start_time
+
+        # 2. 컴파일된 규칙 집합
+        start_time = time.perf_counter()
+        compiled = CompiledRuleSet(rules)
+        compile_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        compiled_results = []
+        for filename in filenames:
+            matched = compiled.match(filename)
+            compiled_results.append(matched[0] if matched else None)
+        compiled_time = time.perf_counter() - start_time
+
+        results = {
+            "rule_count": rule_count,
+            "file_count": file_count,
+            "matched_count": sum(1 for r in compiled_results if r is not None),
+            "loop_time": loop_time,
+            "compile_time": compile_time,
+            "compiled_time": compiled_time,
+            "speedup": loop_time / compiled_time if compiled_time > 0 else 0,
+            "consistent": loop_results == compiled_results,
+        }
+
+        self.log(
+            f"규칙 매칭: 루프 {loop_time:.3f}초, 컴파일 {compiled_time:.3f}초 "
+            f"(x{results['speedup']:.1f}, 일치: {results['consistent']})"
+        )
+
+        return results
+
+    def benchmark_regex_matching(
+        self, pattern_count: int = 600, file_count: int = 5000
+    ) -> Dict:
+        """정규식 규칙 벤치마크 (규칙별 re.search vs 사전 컴파일 vs 조합 사전 필터)
+
+        re 모듈의 내부 캐시(512개)보다 패턴이 많으면 규칙별 re.search는
+        매번 다시 컴파일하게 된다.
+
+        Args:
+            pattern_count: 생성할 정규식 규칙 수
+            file_count: 생성할 파일명 수
+
+        Returns:
+            측정 결과 (세 방식의 결과 일치 여부 포함)
+        """
+        import random
+        import re
+        from src.core.rule_index import RegexIndex
+
+        rng = random.Random(42)
+        patterns = [rf"^rx{i:05d}_\d+" for i in range(pattern_count)]
+        filenames = []
+        for _ in range(file_count):
+            if rng.random() < 0.1:
+                filenames.append(f"rx{rng.randrange(pattern_count):05d}_2025.txt")
+            else:
+                filenames.append(f"file_{rng.randrange(10 ** 8):08d}.dat")
+
+        # 1. 기존 방식: 규칙마다 re.search(문자열 패턴)
+        start_time = time.perf_counter()
+        search_results = []
+        for filename in filenames:
+            matched = -1
+            for priority, pattern in enumerate(patterns):
+                if re.search(pattern, filename, re.IGNORECASE):
+                    matched = priority
+                    break
+            search_results.append(matched)
+        search_time = time.perf_counter() - start_time
+
+        # 2. 사전 컴파일 + 규칙별 search / 3. 하나의 alternation
+        timings = {}
+        index_results = {}
+        for combine in (False, True):
+            index = RegexIndex(combine=combine)
+            for priority, pattern in enumerate(patterns):
+                index.add(pattern, priority)
+            index.build()
+
+            start_time = time.perf_counter()
+            index_results[combine] = [index.first_match(f) for f in filenames]
+            timings[combine] = time.perf_counter() - start_time
+
+        results = {
+            "pattern_count": pattern_count,
+            "file_count": file_count,
+            "search_time": search_time,
+            "precompiled_time": timings[False],
+            "combined_time": timings[True],
+            "speedup": search_time / timings[True] if timings[True] > 0 else 0,
+            "consistent": search_results == index_results[False] == index_results[True],
+        }
+
+        self.log(
+            f"정규식 매칭: re.search {search_time:.3f}초, "
+            f"사전 컴파일 {timings[False]:.3f}초, 조합 {timings[True]:.3f}초 "
+            f"(일치: {results['consistent']})"
+        )
+
+        return results
+
+    def benchmark_scan_strategies(
+        self,
+        file_count: int = 20000,
+        match_ratio: float = 0.01,
+        dir_count: int = 50,
+        repeat: int = 3,
+    ) -> Dict:
+        """파일 필터링 순서 벤치마크 (메타데이터 우선 vs 파일명 우선)
+
+        Args:
+            file_count: 생성할 파일 수
+            match_ratio: 규칙에 매칭되는 파일 비율
+            dir_count: 파일을 나눠 담을 폴더 수
+            repeat: 반복 횟수 (가장 빠른 값 사용)
+
+        Returns:
+            측정 결과 (두 방식의 결과 일치 여부 포함)
+        """
+        import random
+        from src.core.file_matcher import FileMatcher
+
+        rng = random.Random(42)
+        rules = {"matchme": {"dest": "/dest", "match_mode": "포함"}}
+        matcher = FileMatcher()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # 테스트 폴더 트리 생성 (일부는 숨김 파일)
+            for index in range(file_count):
+                folder = os.path.join(temp_dir, f"dir_{index % dir_count}")
+                os.makedirs(folder, exist_ok=True)
+
+                name = f"file_{index}_{rng.randrange(10**6)}.dat"
+                if rng.random() < match_ratio:
+                    name = "matchme_" + name
+                if index % 97 == 0:
+                    name = "." + name
+                with open(os.path.join(folder, name), "wb"):
+                    pass
+
+            results = {"file_count": file_count, "match_ratio": match_ratio}
+            found = {}
+
+            for strategy in FileMatcher.FILTER_STRATEGIES:
+                best = None
+                for _ in range(repeat):
+                    start_time = time.perf_counter()
+                    matches = sorted(
+                        matcher.find_matching_files_generator(
+                            temp_dir, rules, filter_strategy=strategy
+                        )
+                    )
+                    elapsed = time.perf_counter() - start_time
+                    best = elapsed if best is None else min(best, elapsed)
+                results[f"{strategy}_time"] = best
+                found[strategy] = matches
+
+        metadata_time = results[f"{FileMatcher.METADATA_FIRST}_time"]
+        name_time = results[f"{FileMatcher.NAME_FIRST}_time"]
+        results["matched_count"] = len(found[FileMatcher.NAME_FIRST])
+        results["speedup"] = metadata_time / name_time if name_time > 0 else 0
+        results["consistent"] = (
+            found[FileMatcher.METADATA_FIRST] == found[FileMatcher.NAME_FIRST]
+        )
+
+        self.log(
+            f"필터링 순서: 메타데이터 우선 {metadata_time:.3f}초, "
+            f"파일명 우선 {name_time:.3f}초 "
+            f"(x{results['speedup']:.2f}, 일치: {results['consistent']})"
+        )
+
+        return results
+
+    def _generate_rule_test_data(
+        self, rule_count: int, file_count: int
+    ) -> Tuple[Dict, List[str]]:
+        """규칙 매칭 벤치마크용 규칙과 파일명 생성"""
+        import random
+
+        rng = random.Random(42)  # 재현 가능한 결과
+        modes = ["포함"] * 6 + ["정확히", "시작", "끝", "정규식"]
+
+        rules = {}
+        for i in range(rule_count):
+            match_mode = modes[i % len(modes)]
+            if match_mode == "정규식":
+                keyword = rf"^rx{i:05d}_\d+"
+            else:
+                keyword = f"kw{i:05d}"
+            rules[keyword] = {
+                "dest": f"dest_{i}",
+                "match_mode": match_mode,
+                "enabled": True,
+            }
+
+        # 약 30%는 규칙에 매칭되는 파일명
+        name_formats = {
+            "포함": "report_kw{:05d}_final.pdf",
+            "정확히": "kw{:05d}.docx",
+            "시작": "kw{:05d}_scan.jpg",
+            "끝": "photo_kw{:05d}.png",
+            "정규식": "rx{:05d}_2025.txt",
+        }
+        filenames = []
+        for _ in range(file_count):
+            if rule_count and rng.random() < 0.3:
+                i = rng.randrange(rule_count)
+                filenames.append(name_formats[modes[i % len(modes)]].format(i))
+            else:
+                filenames.append(f"file_{rng.randrange(10 ** 8):08d}.dat")
+
+        return rules, filenames
+
     def _format_time(self, seconds: float) -> str:
         """시간을 읽기 쉬운 형식으로 변환"""
         if seconds < 60:
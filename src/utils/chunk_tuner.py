@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+복사 청크 크기 자동 조절 - 대상 장치별로 측정한 처리량으로 청크 크기 결정
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from src.constants import CONFIG_FILE
+from src.utils.device_profile import get_device_profile
+
+
+class ChunkTuningSession:
+    """파일 하나를 복사하는 동안의 청크 크기 조절
+
+    처음 몇 청크의 처리량을 재면서 좋아지는 동안은 청크를 조금씩 키우고
+    (additive increase), 크게 떨어지면 절반으로 줄인다 (multiplicative
+    decrease). 측정이 끝나면 가장 빨랐던 청크 크기로 나머지를 복사한다.
+    """
+
+    # 처리량이 이 비율 이상 좋아져야 개선으로 봄
+    IMPROVE_RATIO = 0.05
+
+    # 처리량이 이 비율 이상 떨어지면 청크를 줄임
+    DROP_RATIO = 0.15
+
+    def __init__(
+        self,
+        tuner: "ChunkSizeTuner",
+        mount_point: str,
+        chunk_size: int,
+        probe_chunks: int = 16,
+    ):
+        """초기화
+
+        Args:
+            tuner: 결과를 저장할 ChunkSizeTuner
+            mount_point: 대상 장치의 마운트 지점
+            chunk_size: 시작 청크 크기
+            probe_chunks: 처리량을 잴 청크 수 (첫 청크는 준비 시간이 섞여서 제외)
+        """
+        self.tuner = tuner
+        self.mount_point = mount_point
+        self.chunk_size = chunk_size
+        self.probe_chunks = probe_chunks
+
+        self.step = max(tuner.min_chunk, chunk_size // 2)
+        self.best_chunk = chunk_size
+        self.best_throughput = 0.0
+        self.samples = 0
+        self.done = False
+
+    def record(self, nbytes: int, seconds: float):
+        """청크 하나의 복사 결과 반영 (다음 청크부터 self.chunk_size 사용)
+
+        Args:
+            nbytes: 복사한 바이트
+            seconds: 걸린 시간 (초)
+        """
+        if self.done or nbytes <= 0:
+            return
+
+        self.samples += 1
+        if self.samples == 1:
+            return
+
+        throughput = nbytes / max(seconds, 1e-6)
+        if throughput > self.best_throughput * (1 + self.IMPROVE_RATIO):
+            self.best_throughput = throughput
+            self.best_chunk = self.chunk_size
+            self.chunk_size = min(self.tuner.max_chunk, self.chunk_size + self.step)
+        elif throughput < self.best_throughput * (1 - self.DROP_RATIO):
+            self.chunk_size = max(self.tuner.min_chunk, self.chunk_size // 2)
+
+        if self.samples > self.probe_chunks:
+            self.done = True
+            self.chunk_size = self.best_chunk
+
+    def finish(self):
+        """측정한 결과 저장 (측정한 청크가 없으면 저장하지 않음)"""
+        if self.best_throughput:
+            self.tuner.store(self.mount_point, self.best_chunk, self.best_throughput)
+
+
+class ChunkSizeTuner:
+    """대상 장치(마운트 지점)별 청크 크기 저장소
+
+    로컬 SSD, USB 하드디스크, 네트워크 공유 폴더는 알맞은 청크 크기가
+    크게 다르므로, 복사하면서 찾은 청크 크기를 마운트 지점마다 저장하고
+    다음 복사에서 그 값부터 다시 조절한다.
+    """
+
+    # 저장할 마운트 지점 수 (오래된 것부터 삭제)
+    MAX_DEVICES = 100
+
+    def __init__(
+        self,
+        tuning_file: str = None,
+        min_chunk: int = 64 * 1024,
+        max_chunk: int = 128 * 1024 * 1024,
+    ):
+        """초기화
+
+        Args:
+            tuning_file: 조절 결과를 저장할 파일 경로
+            min_chunk: 최소 청크 크기
+            max_chunk: 최대 청크 크기
+        """
+        self.tuning_file = tuning_file or os.path.join(
+            os.path.dirname(CONFIG_FILE), "chunk_sizes.json"
+        )
+        self.min_chunk = min_chunk
+        self.max_chunk = max_chunk
+        self._lock = threading.Lock()
+        self._devices = self._load()
+
+    def get(self, path: str) -> Optional[int]:
+        """경로의 장치에 저장된 청크 크기 (없으면 None)"""
+        with self._lock:
+            device = self._devices.get(get_device_profile(path).mount_point)
+        return device["chunk_size"] if device else None
+
+    def start(
+        self, path: str, default_chunk: int, probe_chunks: int = 16
+    ) -> ChunkTuningSession:
+        """복사 한 번의 청크 크기 조절 시작
+
+        Args:
+            path: 대상 파일 경로
+            default_chunk: 저장된 값이 없을 때 시작할 청크 크기
+            probe_chunks: 처리량을 잴 청크 수
+
+        Returns:
+            ChunkTuningSession
+        """
+        mount_point = get_device_profile(path).mount_point
+        with self._lock:
+            device = self._devices.get(mount_point)
+        chunk_size = device["chunk_size"] if device else default_chunk
+        chunk_size = min(self.max_chunk, max(self.min_chunk, chunk_size))
+        return ChunkTuningSession(self, mount_point, chunk_size, probe_chunks)
+
+    def store(self, mount_point: str, chunk_size: int, throughput: float):
+        """마운트 지점의 청크 크기 저장
+
+        Args:
+            mount_point: 마운트 지점
+            chunk_size: 가장 빨랐던 청크 크기
+            throughput: 그때의 처리량 (바이트/초)
+        """
+        with self._lock:
+            self._devices.pop(mount_point, None)
+            self._devices[mount_point] = {
+                "chunk_size": int(chunk_size),
+                "throughput": round(throughput),
+                "updated": time.time(),
+            }
+
+            # 오래된 장치부터 정리
+            while len(self._devices) > self.MAX_DEVICES:
+                self._devices.pop(next(iter(self._devices)))
+
+            try:
+                os.makedirs(os.path.dirname(self.tuning_file) or ".", exist_ok=True)
+                with open(self.tuning_file, "w", encoding="utf-8") as f:
+                    json.dump(self._devices, f, ensure_ascii=False, indent=2)
+            except Exception as e:
+                print(f"청크 크기 저장 중 오류: {str(e)}")
+
+    def clear(self):
+        """저장된 청크 크기 모두 삭제"""
+        with self._lock:
+            self._devices = {}
+            if os.path.exists(self.tuning_file):
+                os.remove(self.tuning_file)
+
+    def _load(self) -> Dict[str, dict]:
+        """저장된 청크 크기 로드"""
+        if os.path.exists(self.tuning_file):
+            try:
+                with open(self.tuning_file, "r", encoding="utf-8") as f:
+                    devices = json.load(f)
+                if isinstance(devices, dict):
+                    return {
+                        mount: device
+                        for mount, device in devices.items()
+                        if isinstance(device, dict)
+                        and isinstance(device.get("chunk_size"), int)
+                    }
+            except Exception:
+                pass
+        return {}
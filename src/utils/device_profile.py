@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+장치 프로필 - 경로가 속한 마운트의 파일 시스템 종류, 네트워크 여부, 회전식 디스크 여부
+"""
+
+import ntpath
+import os
+import platform
+import re
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# 네트워크 파일 시스템 종류 (/proc/self/mountinfo의 fstype)
+NETWORK_FS_TYPES = {
+    "nfs",
+    "nfs4",
+    "cifs",
+    "smb3",
+    "smbfs",
+    "ncpfs",
+    "afs",
+    "9p",
+    "ceph",
+    "glusterfs",
+    "lustre",
+    "davfs",
+    "fuse.sshfs",
+    "fuse.rclone",
+    "fuse.s3fs",
+    "fuse.gcsfuse",
+    "fuse.davfs2",
+    "fuse.gvfsd-fuse",
+    "fuse.smbnetfs",
+    "fuse.curlftpfs",
+    "fuse.glusterfs",
+    "fuse.cephfs",
+}
+
+# Windows GetDriveTypeW 반환값
+DRIVE_REMOTE = 4
+
+
+class DeviceProfile(NamedTuple):
+    """마운트 하나의 입출력 특성"""
+
+    mount_point: str
+    fs_type: str  # 알 수 없으면 ""
+    device: str  # 마운트 소스 (/dev/sda1, //server/share, host:/export 등)
+    is_network: bool
+    rotational: Optional[bool]  # 알 수 없으면 None
+
+    def scan_workers(self, default: int) -> int:
+        """폴더 목록을 동시에 조회할 스레드 수
+
+        설정값(scan_threads)을 상한으로 쓴다. 회전식 디스크는 동시 조회가
+        탐색(seek)만 늘리므로 줄이고, 네트워크는 설정값을 그대로 쓴다
+        (NAS 부하를 줄이려고 낮춘 설정을 넘지 않음).
+        """
+        if self.rotational:
+            return min(default, 2)
+        return default
+
+    @property
+    def allows_multithread_copy(self) -> bool:
+        """범위를 나눠 동시에 복사해도 빨라지는 장치인지 (로컬 SSD 등)"""
+        return not self.is_network and not self.rotational
+
+    @property
+    def needs_full_verify(self) -> bool:
+        """크기 비교만으로는 부족해서 해시로 검증해야 하는 장치인지"""
+        return self.is_network
+
+
+class DeviceProfiler:
+    """경로 → 장치 프로필 조회
+
+    리눅스는 /proc/self/mountinfo의 마운트 목록에서 가장 긴 마운트 지점을
+    찾고, 블록 장치면 /sys/dev/block/<major:minor>의 rotational 값을 읽는다.
+    Windows는 UNC 경로와 GetDriveTypeW로 네트워크 드라이브를 판별한다.
+    마운트 목록은 ttl 초 동안, 프로필은 마운트 지점별로 캐시한다.
+    """
+
+    def __init__(
+        self,
+        mountinfo_path: str = "/proc/self/mountinfo",
+        sys_block_dir: str = "/sys/dev/block",
+        ttl: float = 60,
+    ):
+        """초기화
+
+        Args:
+            mountinfo_path: 마운트 목록 파일
+            sys_block_dir: 블록 장치 정보 폴더 (major:minor별)
+            ttl: 마운트 목록을 다시 읽기 전까지의 시간 (초)
+        """
+        self.mountinfo_path = mountinfo_path
+        self.sys_block_dir = sys_block_dir
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._mounts: List[Tuple[str, str, str, str]] = []
+        self._loaded_at = None
+        self._profiles: Dict[str, DeviceProfile] = {}
+
+    def profile(self, path: str) -> DeviceProfile:
+        """경로가 속한 장치의 프로필
+
+        Args:
+            path: 파일/폴더 경로 (아직 없어도 됨)
+
+        Returns:
+            DeviceProfile
+        """
+        if platform.system() == "Windows":
+            # UNC 경로 (\\server\share 형식)는 공유 폴더별로 구분
+            if path.startswith("\\\\") or path.startswith("//"):
+                share = ntpath.splitdrive(path)[0].replace("/", "\\").casefold()
+                return DeviceProfile(share, "", share, True, None)
+            return self._windows_profile(path)
+
+        path = os.path.realpath(path)
+        with self._lock:
+            mount = self._find_mount(path)
+            if mount is None:
+                return DeviceProfile(os.sep, "", "", False, None)
+
+            mount_point = mount[0]
+            profile = self._profiles.get(mount_point)
+            if profile is None:
+                profile = self._make_profile(*mount)
+                self._profiles[mount_point] = profile
+            return profile
+
+    def clear(self):
+        """캐시 삭제 (다음 조회 때 마운트 목록을 다시 읽음)"""
+        with self._lock:
+            self._mounts = []
+            self._loaded_at = None
+            self._profiles = {}
+
+    def _find_mount(self, path: str) -> Optional[Tuple[str, str, str, str]]:
+        """path를 포함하는 가장 긴 마운트 지점 (lock을 잡은 상태에서 호출)"""
+        now = time.monotonic()
+        if self._loaded_at is None or now - self._loaded_at > self.ttl:
+            self._mounts = self._read_mountinfo()
+            self._loaded_at = now
+            self._profiles = {}
+
+        # 마운트 지점이 긴 것부터 정렬되어 있음
+        for mount in self._mounts:
+            mount_point = mount[0]
+            if (
+                path == mount_point
+                or mount_point == "/"
+                or path.startswith(mount_point + "/")
+            ):
+                return mount
+        return None
+
+    def _read_mountinfo(self) -> List[Tuple[str, str, str, str]]:
+        """마운트 목록 읽기
+
+        Returns:
+            [(마운트 지점, 파일 시스템 종류, 마운트 소스, major:minor)]
+            (마운트 지점이 긴 것부터, 같은 지점은 나중 마운트가 우선)
+        """
+        mounts = {}
+        try:
+            with open(self.mountinfo_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    # ID 부모ID major:minor 루트 마운트지점 옵션 [선택 필드...] - 종류 소스 옵션
+                    left, sep, right = line.partition(" - ")
+                    fields, extra = left.split(), right.split()
+                    if not sep or len(fields) < 5 or len(extra) < 2:
+                        continue
+                    mount_point = _unescape(fields[4])
+                    mounts[mount_point] = (
+                        mount_point,
+                        extra[0],
+                        _unescape(extra[1]),
+                        fields[2],
+                    )
+        except OSError:
+            pass
+        return sorted(mounts.values(), key=lambda mount: len(mount[0]), reverse=True)
+
+    def _make_profile(
+        self, mount_point: str, fs_type: str, device: str, dev_id: str
+    ) -> DeviceProfile:
+        """마운트 정보로 프로필 생성"""
+        is_network = fs_type in NETWORK_FS_TYPES
+        if not is_network and fs_type.startswith("fuse."):
+            # 종류를 모르는 FUSE 마운트라도 소스가 원격 형식이면 네트워크
+            # (//server/share, host:/path, user@host:path). mergerfs 같은 로컬
+            # 합치기 마운트의 disk1:disk2 형식은 네트워크가 아님
+            is_network = device.startswith("//") or bool(
+                re.match(r"^([\w.-]+:/|[\w.-]+@[\w.-]+:)", device)
+            )
+        rotational = None if is_network else self._read_rotational(dev_id)
+        return DeviceProfile(mount_point, fs_type, device, is_network, rotational)
+
+    def _read_rotational(self, dev_id: str) -> Optional[bool]:
+        """블록 장치의 회전식 디스크 여부 (파티션이면 상위 디스크 기준)"""
+        device_dir = os.path.realpath(os.path.join(self.sys_block_dir, dev_id))
+        for base in (device_dir, os.path.dirname(device_dir)):
+            try:
+                with open(os.path.join(base, "queue", "rotational"), "r") as f:
+                    return f.read().strip() == "1"
+            except OSError:
+                continue
+        return None
+
+    def _windows_profile(self, path: str) -> DeviceProfile:
+        """Windows 드라이브 프로필 (GetDriveTypeW)"""
+        drive = os.path.splitdrive(os.path.abspath(path))[0]
+        root = drive + "\\"
+        is_network = False
+        try:
+            import ctypes
+
+            is_network = ctypes.windll.kernel32.GetDriveTypeW(root) == DRIVE_REMOTE
+        except Exception:
+            pass
+        return DeviceProfile(root, "", drive, is_network, None)
+
+
+def _unescape(value: str) -> str:
+    """mountinfo의 8진수 이스케이프 (\\040 등) 복원"""
+    return re.sub(r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), value)
+
+
+_profiler = None
+
+
+def get_device_profile(path: str) -> DeviceProfile:
+    """기본 DeviceProfiler로 경로의 장치 프로필 조회"""
+    global _profiler
+    if _profiler is None:
+        _profiler = DeviceProfiler()
+    return _profiler.profile(path)
@@ -253,51 +253,25 @@ class AutoOrganizer:
     def _process_file(self, filepath: str):
         """단일 파일 처리"""
         try:
-            # 활성화된 규칙 가져오기
-            active_rules = self.rule_manager.get_active_rules()
-            if not active_rules:
+            # 규칙이 바뀔 때만 다시 컴파일되는 공유 규칙 집합 사용
+            compiled_rules = self.rule_manager.get_compiled_rules(self.log_callback)
+            if not compiled_rules:
                 return
 
             # 파일 매칭 확인
             filename = os.path.basename(filepath)
+            matched = compiled_rules.match(filename)
+            if not matched:
+                return
+
+            # 파일 이동
+            keyword, dest, match_mode = matched
+            batch = [(filepath, dest, keyword, match_mode)]
+            success, error = self.file_processor.process_batch(
+                batch, False, False, False, "자동 이동"
+            )
 
-            for keyword, rule_data in active_rules.items():
-                dest = rule_data.get("dest", "")
-                match_mode = rule_data.get("match_mode", "포함")
-
-                # 파일 매칭 확인
-                if self._match_file(filename, keyword, match_mode):
-                    # 파일 이동
-                    batch = [(filepath, dest, keyword, match_mode)]
-                    success, error = self.file_processor.process_batch(
-                        batch, False, False, False, "자동 이동"
-                    )
-
-                    if success > 0:
-                        self.log_callback(
-                            f"자동 정리: {filename} → {os.path.basename(dest)}"
-                        )
-                    break
+            if success > 0:
+                self.log_callback(f"자동 정리: {filename} → {os.path.basename(dest)}")
         except Exception as e:
             self.log_callback(f"자동 정리 오류: {str(e)}")
-
-    def _match_file(self, filename: str, keyword: str, match_mode: str) -> bool:
-        """파일명 매칭 확인"""
-        if match_mode == "포함":
-            return keyword.lower() in filename.lower()
-        elif match_mode == "정확히":
-            name_without_ext, _ = os.path.splitext(filename)
-            return keyword.lower() == name_without_ext.lower()
-        elif match_mode == "시작":
-            return filename.lower().startswith(keyword.lower())
-        elif match_mode == "끝":
-            name_without_ext, _ = os.path.splitext(filename)
-            return name_without_ext.lower().endswith(keyword.lower())
-        elif match_mode == "정규식":
-            import re
-
-            try:
-                return bool(re.search(keyword, filename, re.IGNORECASE))
-            except re.error:
-                return False
-        return False
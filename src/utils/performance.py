@@ -6,13 +6,49 @@
 """
 
 import os
+import errno
 import time
 import threading
 import hashlib
 import platform
 import concurrent.futures
+import queue
 import shutil
-from typing import Dict, Any, Callable, Optional, Tuple
+from contextlib import contextmanager
+from typing import Dict, Any, Callable, Optional, Sequence, Tuple
+
+from src.constants import ADVANCED_SETTINGS
+from src.utils.chunk_tuner import ChunkSizeTuner, ChunkTuningSession
+from src.utils.device_profile import get_device_profile
+
+try:
+    import fcntl
+
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+# 커널 복사 경로 (copy_file_range / sendfile / reflink)는 리눅스에서만 사용
+IS_LINUX = platform.system() == "Linux"
+
+# 리눅스 reflink ioctl (btrfs, XFS 등에서 데이터 블록을 공유하는 복제)
+FICLONE = 0x40049409
+
+# 복사 방식 (시도 순서)
+COPY_BACKENDS = ("reflink", "copy_file_range", "sendfile", "buffered")
+
+# 이 오류면 다음 복사 방식으로 넘어감 (지원하지 않는 파일 시스템/조합)
+_FALLBACK_ERRNOS = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.EPERM,
+    errno.EBADF,
+    errno.ENOTTY,
+    errno.ENOTSOCK,
+}
 
 
 class FileInfoCache:
@@ -109,6 +145,312 @@ class ProgressTracker:
             self._last_update = 0
 
 
+class ResultStream:
+    """생산자/소비자 결과 스트림
+
+    작업 스레드가 결과를 넣고(put) UI 스레드가 타이머마다 꺼낸다(drain).
+    큐 크기가 제한되어 있어서 UI가 못 따라가면 생산자가 기다리므로
+    메모리와 UI 이벤트 큐가 한없이 늘어나지 않는다. 한 번에 꺼내는 양은
+    처리 시간에 맞춰 자동으로 조절된다.
+    """
+
+    def __init__(
+        self, maxsize: int = 20000, min_chunk: int = 50, max_chunk: int = 5000
+    ):
+        """초기화
+
+        Args:
+            maxsize: 큐에 쌓아둘 최대 결과 수
+            min_chunk: 한 번에 처리할 최소 결과 수
+            max_chunk: 한 번에 처리할 최대 결과 수
+        """
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._closed = threading.Event()
+        self.min_chunk = min_chunk
+        self.max_chunk = max_chunk
+        self.chunk_size = min_chunk
+
+    def put(self, item: Any, should_stop: Optional[Callable] = None) -> bool:
+        """결과 추가 (큐가 가득 차면 자리가 날 때까지 대기)
+
+        Args:
+            item: 추가할 결과
+            should_stop: 대기 중 중단 여부를 확인할 함수
+
+        Returns:
+            추가 여부 (중단된 경우 False)
+        """
+        while True:
+            if should_stop and should_stop():
+                return False
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+
+    def close(self):
+        """생산 종료 표시"""
+        self._closed.set()
+
+    @property
+    def done(self) -> bool:
+        """생산이 끝났고 남은 결과도 없는지 여부"""
+        return self._closed.is_set() and self._queue.empty()
+
+    def _take(self, count: int) -> list:
+        """최대 count개 꺼내기 (기다리지 않음)"""
+        items = []
+        try:
+            for _ in range(count):
+                items.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return items
+
+    def drain(self, handler: Callable[[list], Any], time_budget: float = 0.03) -> int:
+        """시간 예산 안에서 결과를 꺼내 처리
+
+        처리 시간이 예산에 비해 짧으면 다음 묶음을 늘리고, 길면 줄인다.
+
+        Args:
+            handler: 결과 묶음을 처리할 함수
+            time_budget: 이번 호출에서 쓸 시간 (초)
+
+        Returns:
+            처리한 결과 수
+        """
+        start_time = time.perf_counter()
+        deadline = start_time + time_budget
+        processed = 0
+
+        while True:
+            items = self._take(self.chunk_size)
+            if not items:
+                break
+
+            chunk_start = time.perf_counter()
+            handler(items)
+            now = time.perf_counter()
+            processed += len(items)
+
+            # 한 묶음이 예산의 1/4 안쪽이 되도록 크기 조절
+            elapsed = now - chunk_start
+            if elapsed < time_budget / 8:
+                self.chunk_size = min(self.chunk_size * 2, self.max_chunk)
+            elif elapsed > time_budget / 4:
+                self.chunk_size = max(self.chunk_size // 2, self.min_chunk)
+
+            if now >= deadline:
+                break
+
+        return processed
+
+
+class BufferPool:
+    """복사/해시 루프에서 재사용하는 읽기 버퍼 풀
+
+    버퍼는 크기 등급별로 보관한다 (1MB 이하는 2의 거듭제곱, 그보다 크면
+    1MB 단위로 올림). readinto로 채우고 memoryview 슬라이스로 쓰므로 청크마다
+    새 bytes 객체를 만들지 않는다. 쉬고 있는 버퍼의 총 크기는 max_idle_bytes로
+    제한되고, 넘치는 버퍼는 반납할 때 버린다.
+    """
+
+    MIN_CLASS = 64 * 1024
+    LARGE_STEP = 1024 * 1024
+
+    def __init__(
+        self, max_idle_bytes: int = 128 * 1024 * 1024, max_per_class: int = 4
+    ):
+        """초기화
+
+        Args:
+            max_idle_bytes: 풀에 보관할 버퍼의 최대 총 크기
+            max_per_class: 크기 등급별로 보관할 최대 버퍼 수
+        """
+        self.max_idle_bytes = max_idle_bytes
+        self.max_per_class = max_per_class
+        self._free: Dict[int, list] = {}
+        self._idle_bytes = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def size_class(cls, size: int) -> int:
+        """요청 크기가 속하는 크기 등급 (실제 할당 크기)"""
+        if size <= cls.MIN_CLASS:
+            return cls.MIN_CLASS
+        if size <= cls.LARGE_STEP:
+            return 1 << (size - 1).bit_length()
+        return -(-size // cls.LARGE_STEP) * cls.LARGE_STEP
+
+    def acquire(self, size: int) -> bytearray:
+        """size 이상인 버퍼 꺼내기 (없으면 새로 할당)"""
+        capacity = self.size_class(size)
+        with self._lock:
+            free = self._free.get(capacity)
+            if free:
+                self._idle_bytes -= capacity
+                return free.pop()
+        return bytearray(capacity)
+
+    def release(self, buffer: bytearray):
+        """버퍼 반납 (보관 한도를 넘으면 버림)"""
+        capacity = len(buffer)
+        with self._lock:
+            free = self._free.setdefault(capacity, [])
+            if (
+                len(free) < self.max_per_class
+                and self._idle_bytes + capacity <= self.max_idle_bytes
+            ):
+                free.append(buffer)
+                self._idle_bytes += capacity
+
+    @contextmanager
+    def buffer(self, size: int):
+        """size 바이트짜리 memoryview를 빌려주고 블록이 끝나면 반납
+
+        사용 예:
+            with BUFFER_POOL.buffer(chunk_size) as view:
+                n = f.readinto(view)
+                out.write(view[:n])
+        """
+        buffer = self.acquire(size)
+        view = memoryview(buffer)
+        try:
+            yield view[:size]
+        finally:
+            view.release()
+            self.release(buffer)
+
+    @property
+    def idle_bytes(self) -> int:
+        """풀에 보관 중인 버퍼의 총 크기"""
+        return self._idle_bytes
+
+    def clear(self):
+        """보관 중인 버퍼 모두 해제"""
+        with self._lock:
+            self._free.clear()
+            self._idle_bytes = 0
+
+
+# 복사/해시 루프가 함께 쓰는 버퍼 풀
+BUFFER_POOL = BufferPool()
+
+
+def copy_file_data(
+    fsrc,
+    fdst,
+    file_size: int,
+    chunk_size: int,
+    on_chunk: Optional[Callable[[int], None]] = None,
+    backends: Sequence[str] = COPY_BACKENDS,
+    tuning: Optional[ChunkTuningSession] = None,
+) -> str:
+    """열린 파일의 내용을 커널 복사 경로부터 차례로 시도해서 복사
+
+    reflink(FICLONE)는 파일 전체를 한 번에 복제하므로 맨 먼저 시도하고,
+    copy_file_range / sendfile / 버퍼 복사는 chunk_size 단위로 원본 끝(EOF)까지
+    진행한다 (복사 중에 원본이 커져도 끝까지 복사). 지원하지 않는 방식이면
+    이미 복사한 위치부터 다음 방식으로 이어간다. 커널 복사가 처음부터 0을
+    돌려주면 (일부 FUSE/ecryptfs 등) 동작하지 않는 것으로 보고 다음 방식을 쓴다.
+
+    Args:
+        fsrc: 원본 파일 (rb)
+        fdst: 대상 파일 (wb, 아직 쓰지 않은 상태)
+        file_size: 복사 시작 시점의 원본 크기 (빈 파일은 reflink 생략)
+        chunk_size: 청크 크기 (tuning이 있으면 tuning.chunk_size 사용,
+            어느 쪽이든 file_size보다 크게 잡지 않음)
+        on_chunk: 청크마다 호출할 콜백 (지금까지 복사한 바이트)
+        backends: 시도할 복사 방식 (COPY_BACKENDS 중에서)
+        tuning: 청크마다 처리량을 재서 청크 크기를 조절할 세션
+
+    Returns:
+        마지막으로 사용한 복사 방식
+    """
+    src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+    copied = 0
+    started = 0.0
+
+    # 청크(버퍼)는 파일 크기보다 크게 잡지 않음
+    max_chunk = max(file_size, BufferPool.MIN_CLASS)
+
+    def next_chunk():
+        nonlocal started
+        started = time.perf_counter()
+        return min(tuning.chunk_size if tuning else chunk_size, max_chunk)
+
+    def report(count):
+        if tuning:
+            tuning.record(count, time.perf_counter() - started)
+        if on_chunk:
+            on_chunk(copied)
+
+    if "reflink" in backends and IS_LINUX and HAS_FCNTL and file_size > 0:
+        try:
+            fcntl.ioctl(dst_fd, FICLONE, src_fd)
+            copied = os.fstat(dst_fd).st_size
+            if on_chunk:
+                on_chunk(copied)
+            return "reflink"
+        except OSError as e:
+            if e.errno not in _FALLBACK_ERRNOS:
+                raise
+
+    if "copy_file_range" in backends and IS_LINUX and hasattr(os, "copy_file_range"):
+        try:
+            while True:
+                sent = os.copy_file_range(
+                    src_fd, dst_fd, next_chunk(), copied, copied
+                )
+                if sent == 0:  # 원본 끝
+                    break
+                copied += sent
+                report(sent)
+            # 처음부터 0이면 이 파일 시스템 조합에서는 동작하지 않는 것으로 봄
+            if copied:
+                return "copy_file_range"
+        except OSError as e:
+            if e.errno not in _FALLBACK_ERRNOS:
+                raise
+
+    if "sendfile" in backends and IS_LINUX and hasattr(os, "sendfile"):
+        try:
+            # sendfile은 대상 파일의 현재 위치에 씀
+            os.lseek(dst_fd, copied, os.SEEK_SET)
+            while True:
+                sent = os.sendfile(dst_fd, src_fd, copied, next_chunk())
+                if sent == 0:  # 원본 끝
+                    break
+                copied += sent
+                report(sent)
+            # 처음부터 0이면 이 파일 시스템 조합에서는 동작하지 않는 것으로 봄
+            if copied:
+                return "sendfile"
+        except OSError as e:
+            if e.errno not in _FALLBACK_ERRNOS:
+                raise
+
+    # 버퍼 복사 (풀의 버퍼에 readinto로 읽음, 청크 크기가 바뀌면 버퍼도 교체)
+    fsrc.seek(copied)
+    fdst.seek(copied)
+    size = next_chunk()
+    while True:
+        with BUFFER_POOL.buffer(size) as view:
+            while True:
+                read = fsrc.readinto(view)
+                if not read:
+                    return "buffered"
+
+                fdst.write(view[:read])
+                copied += read
+                report(read)
+
+                if next_chunk() != size:
+                    size = next_chunk()
+                    break
+
+
 def copy_file_with_progress(
     src: str,
     dst: str,
@@ -134,25 +476,20 @@ def copy_file_with_progress(
             progress_callback(file_size, file_size, 100)
         return
 
-    # 대용량 파일은 청크 단위로 복사
-    copied = 0
+    # 대용량 파일은 청크 단위로 복사 (가능하면 커널 복사 경로 사용)
     last_progress = -1
 
+    def on_chunk(copied):
+        nonlocal last_progress
+        # 진행률 계산 (1% 단위로 업데이트)
+        progress = min(100, int((copied / file_size) * 100))
+        if progress != last_progress and progress_callback:
+            progress_callback(copied, file_size, progress)
+            last_progress = progress
+
     with open(src, "rb") as fsrc:
         with open(dst, "wb") as fdst:
-            while True:
-                chunk = fsrc.read(chunk_size)
-                if not chunk:
-                    break
-
-                fdst.write(chunk)
-                copied += len(chunk)
-
-                # 진행률 계산 (1% 단위로 업데이트)
-                progress = int((copied / file_size) * 100)
-                if progress != last_progress and progress_callback:
-                    progress_callback(copied, file_size, progress)
-                    last_progress = progress
+            copy_file_data(fsrc, fdst, file_size, chunk_size, on_chunk)
 
     # 메타데이터 복사
     import shutil
@@ -161,52 +498,53 @@ def copy_file_with_progress(
 
 
 def get_optimal_chunk_size(file_size: int) -> int:
-    """파일 크기에 따른 최적 청크 크기 계산
+    """파일 크기에 따른 기본 청크 크기 (ADVANCED_SETTINGS["chunk_sizes"])
+
+    대상 장치에서 측정한 값이 없을 때 시작 값으로 쓴다.
 
     Args:
         file_size: 파일 크기 (바이트)
 
     Returns:
-        최적 청크 크기
+        청크 크기
     """
+    chunk_sizes = ADVANCED_SETTINGS["chunk_sizes"]
     if file_size < 10 * 1024 * 1024:  # 10MB 미만
-        return 512 * 1024  # 512KB
+        return chunk_sizes["tiny"]
     elif file_size < 100 * 1024 * 1024:  # 100MB 미만
-        return 1024 * 1024  # 1MB
+        return chunk_sizes["small"]
     elif file_size < 1024 * 1024 * 1024:  # 1GB 미만
-        return 10 * 1024 * 1024  # 10MB
+        return chunk_sizes["medium"]
     elif file_size < 10 * 1024 * 1024 * 1024:  # 10GB 미만
-        return 50 * 1024 * 1024  # 50MB
+        return chunk_sizes["large"]
     else:  # 10GB 이상
-        return 100 * 1024 * 1024  # 100MB
+        return chunk_sizes["huge"]
+
+
+_chunk_tuner = None
+
+
+def get_chunk_tuner() -> ChunkSizeTuner:
+    """복사에 쓰는 기본 ChunkSizeTuner (처음 호출할 때 생성)"""
+    global _chunk_tuner
+    if _chunk_tuner is None:
+        _chunk_tuner = ChunkSizeTuner()
+    return _chunk_tuner
 
 
 def is_network_drive(path: str) -> bool:
     """네트워크 드라이브 여부 확인
 
+    UNC 경로, 리눅스의 NFS/CIFS/원격 FUSE 마운트, Windows의 네트워크
+    드라이브를 네트워크로 본다 (device_profile.DeviceProfiler 참고).
+
     Args:
         path: 확인할 경로
 
     Returns:
         네트워크 드라이브 여부
     """
-    # UNC 경로 확인 (\\server\share 형식)
-    if path.startswith("\\\\") or path.startswith("//"):
-        return True
-
-    # 매핑된 네트워크 드라이브 확인 (간단한 휴리스틱)
-    # 실제로는 더 복잡한 확인이 필요하지만, 대부분의 경우 충분함
-    try:
-        # 드라이브 문자 추출
-        drive = os.path.splitdrive(path)[0]
-        if drive and platform.system() == "Windows":
-            # Z: 드라이브는 종종 네트워크 드라이브로 사용됨
-            if drive.upper() in ["Y:", "Z:"]:
-                return True
-    except:
-        pass
-
-    return False
+    return get_device_profile(path).is_network
 
 
 def copy_file_with_progress_optimized(
@@ -215,6 +553,9 @@ def copy_file_with_progress_optimized(
     progress_callback: Optional[Callable] = None,
     verify: bool = False,
     use_multithread: bool = False,
+    adaptive_chunk: bool = True,
+    tuner: Optional[ChunkSizeTuner] = None,
+    verify_method: str = "quick",
 ) -> Tuple[bool, Optional[str]]:
     """최적화된 파일 복사
 
@@ -224,33 +565,68 @@ def copy_file_with_progress_optimized(
         progress_callback: 진행률 콜백
         verify: 복사 후 검증 여부
         use_multithread: 멀티스레드 사용 여부
+        adaptive_chunk: 대상 장치에서 측정한 처리량으로 청크 크기 조절 여부
+        tuner: 청크 크기 저장소 (기본값: get_chunk_tuner())
+        verify_method: 'quick' (크기 비교) 또는 'full' (해시 비교).
+            네트워크 대상은 항상 해시로 검증
 
     Returns:
         (성공 여부, 에러 메시지)
     """
     file_size = os.path.getsize(src)
 
-    # 네트워크 드라이브 확인
-    is_network = is_network_drive(dst)
+    # 대상 장치 확인 (네트워크 / 회전식 디스크)
+    profile = get_device_profile(dst)
 
-    # 최적 청크 크기 결정
+    # 기본 청크 크기 결정
     chunk_size = get_optimal_chunk_size(file_size)
-    if is_network:
-        chunk_size = max(chunk_size, 50 * 1024 * 1024)  # 네트워크는 최소 50MB
+    if profile.is_network:
+        # 네트워크는 최소 network_chunk_size
+        chunk_size = max(chunk_size, ADVANCED_SETTINGS["network_chunk_size"])
+
+    # 대용량 파일이고 동시 복사로 빨라지는 장치(로컬 SSD 등)면 멀티스레드 사용
+    multithread = (
+        use_multithread
+        and file_size > 1024 * 1024 * 1024
+        and profile.allows_multithread_copy
+    )
+
+    # 대상 장치에 저장된 청크 크기부터 시작해서 복사하면서 조절
+    # (멀티스레드 복사나 측정할 청크가 충분하지 않은 파일은 크기별 기본값 사용)
+    tuning = None
+    if adaptive_chunk and not multithread:
+        session = (tuner or get_chunk_tuner()).start(dst, chunk_size)
+        if file_size >= session.chunk_size * (session.probe_chunks // 2):
+            tuning = session
+            chunk_size = session.chunk_size
+
+    # 작은 파일에 큰 버퍼를 잡지 않도록 파일 크기로 제한
+    chunk_size = min(chunk_size, max(file_size, BufferPool.MIN_CLASS))
 
     try:
-        # 대용량 파일이고 로컬 드라이브면 멀티스레드 사용
-        if use_multithread and file_size > 1024 * 1024 * 1024 and not is_network:
-            success = copy_file_multithread(src, dst, progress_callback)
+        if multithread:
+            # 범위마다 버퍼를 따로 잡으므로 파일 크기와 상관없이 고정 청크 사용
+            success = copy_file_multithread(
+                src,
+                dst,
+                progress_callback,
+                chunk_size=ADVANCED_SETTINGS["chunk_sizes"]["medium"],
+            )
         else:
-            success = copy_file_single_thread(src, dst, chunk_size, progress_callback)
+            success = copy_file_single_thread(
+                src, dst, chunk_size, progress_callback, tuning
+            )
 
         if not success:
             return False, "복사 실패"
 
+        if tuning:
+            tuning.finish()
+
         # 복사 후 검증
         if verify:
-            if not verify_copy(src, dst, progress_callback):
+            quick_check = verify_method != "full" and not profile.needs_full_verify
+            if not verify_copy(src, dst, progress_callback, quick_check):
                 os.remove(dst)  # 검증 실패 시 삭제
                 return False, "파일 검증 실패"
 
@@ -263,28 +639,27 @@ def copy_file_with_progress_optimized(
 
 
 def copy_file_single_thread(
-    src: str, dst: str, chunk_size: int, progress_callback: Optional[Callable] = None
+    src: str,
+    dst: str,
+    chunk_size: int,
+    progress_callback: Optional[Callable] = None,
+    tuning: Optional[ChunkTuningSession] = None,
 ) -> bool:
-    """단일 스레드 파일 복사"""
+    """단일 스레드 파일 복사 (가능하면 커널 복사 경로 사용)"""
     file_size = os.path.getsize(src)
-    copied = 0
     last_progress = -1
 
+    def on_chunk(copied):
+        nonlocal last_progress
+        # 진행률 계산
+        progress = min(100, int((copied / file_size) * 100))
+        if progress != last_progress and progress_callback:
+            progress_callback(copied, file_size, progress)
+            last_progress = progress
+
     with open(src, "rb") as fsrc:
         with open(dst, "wb") as fdst:
-            while True:
-                chunk = fsrc.read(chunk_size)
-                if not chunk:
-                    break
-
-                fdst.write(chunk)
-                copied += len(chunk)
-
-                # 진행률 계산
-                progress = int((copied / file_size) * 100)
-                if progress != last_progress and progress_callback:
-                    progress_callback(copied, file_size, progress)
-                    last_progress = progress
+            copy_file_data(fsrc, fdst, file_size, chunk_size, on_chunk, tuning=tuning)
 
     # 메타데이터 복사
     import shutil
@@ -293,110 +668,165 @@ def copy_file_single_thread(
     return True
 
 
+class _CopyProgress:
+    """여러 스레드가 함께 갱신하는 복사 진행률 (1% 단위로 콜백 호출)"""
+
+    def __init__(self, total: int, callback: Optional[Callable], detail: str = ""):
+        """초기화
+
+        Args:
+            total: 전체 바이트
+            callback: 진행률 콜백 (bytes_copied, total_bytes, progress_percent, detail)
+            detail: 콜백에 함께 넘길 설명
+        """
+        self.total = total
+        self.callback = callback
+        self.detail = detail
+        self.copied = 0
+        self._last_progress = -1
+        self._lock = threading.Lock()
+
+    def add(self, count: int):
+        """복사한 바이트 추가"""
+        with self._lock:
+            self.copied += count
+            if not self.callback:
+                return
+            progress = int((self.copied / self.total) * 100) if self.total else 100
+            if progress != self._last_progress:
+                self._last_progress = progress
+                self.callback(self.copied, self.total, progress, self.detail)
+
+
 def copy_file_multithread(
     src: str,
     dst: str,
     progress_callback: Optional[Callable] = None,
     num_threads: int = 4,
+    chunk_size: int = 10 * 1024 * 1024,
 ) -> bool:
     """멀티스레드 파일 복사
 
-    대용량 파일을 여러 스레드로 나누어 복사
+    대상 파일을 미리 전체 크기로 할당한 뒤, 각 스레드가 맡은 범위를
+    pread/pwrite로 대상 파일의 같은 위치에 바로 쓴다 (임시 파일 없음).
+    위치 지정 입출력이 없는 플랫폼에서는 단일 스레드 복사를 사용한다.
+    스레드마다 청크 크기의 버퍼를 잡으므로, 모든 스레드의 버퍼가
+    BUFFER_POOL에 보관될 수 있는 크기로 청크를 제한한다.
     """
+    if not hasattr(os, "pwrite"):
+        return copy_file_single_thread(src, dst, chunk_size, progress_callback)
+
+    per_thread = (
+        BUFFER_POOL.max_idle_bytes
+        // max(1, num_threads)
+        // BufferPool.LARGE_STEP
+        * BufferPool.LARGE_STEP
+    )
+    chunk_size = max(BufferPool.MIN_CLASS, min(chunk_size, per_thread))
     file_size = os.path.getsize(src)
-    chunk_size = file_size // num_threads
-
-    # 임시 파일들 생성
-    temp_files = []
-    futures = []
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=num_threads) as executor:
-        for i in range(num_threads):
-            start_pos = i * chunk_size
-            end_pos = start_pos + chunk_size if i < num_threads - 1 else file_size
-            temp_file = f"{dst}.part{i}"
-            temp_files.append(temp_file)
-
-            future = executor.submit(
-                copy_file_range,
-                src,
-                temp_file,
-                start_pos,
-                end_pos,
-                i,
-                num_threads,
-                progress_callback,
-            )
-            futures.append(future)
-
-        # 모든 스레드 완료 대기
-        for future in concurrent.futures.as_completed(futures):
-            if not future.result():
-                # 실패 시 임시 파일 정리
-                for temp_file in temp_files:
-                    if os.path.exists(temp_file):
-                        os.remove(temp_file)
-                return False
+    num_threads = max(1, min(num_threads, file_size // chunk_size or 1))
+    range_size = max(1, -(-file_size // num_threads))
+    progress = _CopyProgress(
+        file_size, progress_callback, f"{num_threads}개 스레드"
+    )
+    failed = threading.Event()
+
+    src_fd = os.open(src, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        dst_fd = os.open(
+            dst,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+            0o666,
+        )
+        try:
+            _preallocate(dst_fd, file_size)
+
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=num_threads
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _copy_range,
+                        src_fd,
+                        dst_fd,
+                        start,
+                        min(start + range_size, file_size),
+                        chunk_size,
+                        progress,
+                        failed,
+                    )
+                    for start in range(0, file_size, range_size)
+                ]
+                success = all(
+                    future.result()
+                    for future in concurrent.futures.as_completed(futures)
+                )
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
 
-    # 임시 파일들을 하나로 합치기
-    with open(dst, "wb") as fdst:
-        for temp_file in temp_files:
-            with open(temp_file, "rb") as fsrc:
-                shutil.copyfileobj(fsrc, fdst)
-            os.remove(temp_file)
+    if not success:
+        # 실패 시 부분 파일 정리
+        if os.path.exists(dst):
+            os.remove(dst)
+        return False
 
     # 메타데이터 복사
-    import shutil
-
     shutil.copystat(src, dst)
     return True
 
 
-def copy_file_range(
-    src: str,
-    dst: str,
+def _preallocate(fd: int, size: int):
+    """대상 파일을 전체 크기로 미리 할당 (지원하지 않으면 크기만 설정)"""
+    if size and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+            return
+        except OSError as e:
+            if e.errno not in _FALLBACK_ERRNOS:
+                raise
+    os.ftruncate(fd, size)
+
+
+def _copy_range(
+    src_fd: int,
+    dst_fd: int,
     start: int,
     end: int,
-    thread_id: int,
-    total_threads: int,
-    progress_callback: Optional[Callable] = None,
+    chunk_size: int,
+    progress: _CopyProgress,
+    failed: threading.Event,
 ) -> bool:
-    """파일의 특정 범위 복사"""
+    """파일의 start~end 범위를 대상 파일의 같은 위치에 복사 (스레드 작업)"""
     try:
-        with open(src, "rb") as fsrc:
-            fsrc.seek(start)
-            remaining = end - start
-
-            with open(dst, "wb") as fdst:
-                chunk_size = 10 * 1024 * 1024  # 10MB
-                copied = 0
-
-                while remaining > 0:
-                    to_read = min(chunk_size, remaining)
-                    chunk = fsrc.read(to_read)
-                    if not chunk:
-                        break
-
-                    fdst.write(chunk)
-                    copied += len(chunk)
-                    remaining -= len(chunk)
-
-                    # 스레드별 진행률 계산
-                    if progress_callback:
-                        thread_progress = (copied / (end - start)) * 100
-                        overall_progress = (
-                            (thread_id + thread_progress / 100) / total_threads * 100
-                        )
-                        progress_callback(
-                            start + copied,
-                            end - start,
-                            overall_progress,
-                            f"스레드 {thread_id + 1}/{total_threads}",
-                        )
+        position = start
+        # 맡은 범위보다 큰 버퍼는 잡지 않음
+        chunk_size = min(chunk_size, end - start)
+        with BUFFER_POOL.buffer(chunk_size) as view:
+            while position < end and not failed.is_set():
+                to_read = min(chunk_size, end - position)
+                if hasattr(os, "preadv"):
+                    read = os.preadv(src_fd, [view[:to_read]], position)
+                else:
+                    data = os.pread(src_fd, to_read, position)
+                    read = len(data)
+                    view[:read] = data
+                if not read:
+                    raise OSError(errno.EIO, "원본 파일이 복사 중에 줄어들었습니다")
+
+                written = 0
+                while written < read:
+                    written += os.pwrite(
+                        dst_fd, view[written:read], position + written
+                    )
 
-        return True
+                position += read
+                progress.add(read)
+        return position >= end
     except Exception as e:
-        print(f"스레드 {thread_id} 복사 실패: {e}")
+        failed.set()
+        print(f"범위 {start}-{end} 복사 실패: {e}")
         return False
 
 
@@ -421,10 +851,10 @@ def calculate_file_hash(
     file_size = os.path.getsize(file_path)
     processed = 0
 
-    with open(file_path, "rb") as f:
-        while chunk := f.read(chunk_size):
-            hash_obj.update(chunk)
-            processed += len(chunk)
+    with open(file_path, "rb") as f, BUFFER_POOL.buffer(chunk_size) as view:
+        while read := f.readinto(view):
+            hash_obj.update(view[:read])
+            processed += read
 
             if progress_callback:
                 progress = int((processed / file_size) * 100)
@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+스캔 색인 (SQLite) - 바뀌지 않은 폴더를 다시 조회하지 않기 위한 저장소
+"""
+
+import json
+import os
+import sqlite3
+from typing import List, Optional, Sequence, Tuple
+
+from src.constants import CONFIG_FILE
+
+
+class ScanIndex:
+    """폴더 단위 스캔 색인
+
+    폴더마다 수정시간, 하위 폴더, 파일 항목(이름, 크기, 수정시간, inode,
+    매칭된 규칙)과 매칭에 쓴 규칙 서명을 저장한다. 폴더의 수정시간은 그 안의
+    파일이 추가/삭제/이름변경될 때만 바뀌므로, 파일 내용만 바뀐 경우 저장된
+    크기/수정시간은 다음 폴더 변경 전까지 갱신되지 않는다.
+
+    sqlite3 연결은 만든 스레드에서만 사용한다.
+    """
+
+    # 스키마가 바뀌면 증가 (기존 색인은 버리고 새로 만듦)
+    SCHEMA_VERSION = 1
+
+    # 이 횟수만큼 폴더를 기록할 때마다 커밋
+    COMMIT_INTERVAL = 200
+
+    def __init__(self, db_path: str = None):
+        """초기화
+
+        Args:
+            db_path: 색인 파일 경로
+        """
+        self.db_path = db_path or os.path.join(
+            os.path.dirname(CONFIG_FILE), "scan_index.sqlite3"
+        )
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_tables()
+        self._pending_writes = 0
+
+    def _create_tables(self):
+        """테이블 생성 (스키마 버전이 다르면 다시 생성)"""
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != self.SCHEMA_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS directories")
+            self._conn.execute("DROP TABLE IF EXISTS entries")
+
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS directories (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                subdirs TEXT NOT NULL,
+                file_count INTEGER NOT NULL,
+                rules_signature TEXT
+            )"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS entries (
+                dir TEXT NOT NULL,
+                name TEXT NOT NULL,
+                size INTEGER,
+                mtime REAL,
+                inode INTEGER,
+                keyword TEXT,
+                dest TEXT,
+                match_mode TEXT,
+                PRIMARY KEY (dir, name)
+            ) WITHOUT ROWID"""
+        )
+        # 매칭된 파일만 빠르게 읽기 위한 부분 인덱스
+        self._conn.execute(
+            """CREATE INDEX IF NOT EXISTS entries_matched
+            ON entries (dir, name) WHERE keyword IS NOT NULL"""
+        )
+        self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        self._conn.commit()
+
+    def lookup(self, path: str) -> Optional[Tuple[int, List[str], int]]:
+        """저장된 폴더 상태 조회 (DirectoryScanner.scan_directories의 lookup)
+
+        Args:
+            path: 폴더 경로
+
+        Returns:
+            (수정시간 ns, 하위 폴더 경로 리스트, 파일 수) (없으면 None)
+        """
+        row = self._conn.execute(
+            "SELECT mtime_ns, subdirs, file_count FROM directories WHERE path = ?",
+            (path,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        mtime_ns, subdirs, file_count = row
+        return (
+            mtime_ns,
+            [os.path.join(path, name) for name in json.loads(subdirs)],
+            file_count,
+        )
+
+    def get_signature(self, path: str) -> Optional[str]:
+        """폴더의 매칭 결과를 만들 때 쓴 규칙 서명"""
+        row = self._conn.execute(
+            "SELECT rules_signature FROM directories WHERE path = ?", (path,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_matches(self, path: str) -> List[Tuple]:
+        """폴더에서 규칙에 매칭된 파일 항목
+
+        Returns:
+            [(파일명, 크기, 수정시간, inode, 키워드, 대상폴더, 매칭모드)]
+        """
+        return self._conn.execute(
+            """SELECT name, size, mtime, inode, keyword, dest, match_mode
+            FROM entries WHERE dir = ? AND keyword IS NOT NULL""",
+            (path,),
+        ).fetchall()
+
+    def get_entries(self, path: str) -> List[Tuple]:
+        """폴더의 모든 파일 항목 (매칭되지 않은 파일은 크기 등이 None일 수 있음)
+
+        Returns:
+            [(파일명, 크기, 수정시간, inode, 키워드, 대상폴더, 매칭모드)]
+        """
+        return self._conn.execute(
+            """SELECT name, size, mtime, inode, keyword, dest, match_mode
+            FROM entries WHERE dir = ?""",
+            (path,),
+        ).fetchall()
+
+    def store_directory(
+        self,
+        path: str,
+        mtime_ns: int,
+        subdirs: Sequence[str],
+        entries: Sequence[Tuple],
+        rules_signature: str,
+    ):
+        """폴더 조회 결과 저장 (기존 항목은 교체)
+
+        Args:
+            path: 폴더 경로
+            mtime_ns: 조회 직전의 폴더 수정시간
+            subdirs: 하위 폴더 경로 리스트
+            entries: [(파일명, 크기, 수정시간, inode, 키워드, 대상폴더, 매칭모드)]
+            rules_signature: 매칭에 쓴 규칙 서명
+        """
+        # 없어진 하위 폴더는 그 아래까지 모두 삭제
+        previous = self.lookup(path)
+        if previous:
+            for removed in set(previous[1]) - set(subdirs):
+                self.forget(removed)
+
+        self._conn.execute("DELETE FROM entries WHERE dir = ?", (path,))
+        self._conn.executemany(
+            "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(path,) + tuple(entry) for entry in entries],
+        )
+        self._conn.execute(
+            "INSERT OR REPLACE INTO directories VALUES (?, ?, ?, ?, ?)",
+            (
+                path,
+                mtime_ns,
+                json.dumps(
+                    [os.path.basename(subdir) for subdir in subdirs],
+                    ensure_ascii=False,
+                ),
+                len(entries),
+                rules_signature,
+            ),
+        )
+        self._written()
+
+    def update_matches(
+        self, path: str, entries: Sequence[Tuple], rules_signature: str
+    ):
+        """규칙이 바뀐 폴더의 매칭 결과만 갱신
+
+        Args:
+            path: 폴더 경로
+            entries: [(파일명, 크기, 수정시간, inode, 키워드, 대상폴더, 매칭모드)]
+            rules_signature: 매칭에 쓴 규칙 서명
+        """
+        self._conn.executemany(
+            """UPDATE entries
+            SET size = ?, mtime = ?, inode = ?, keyword = ?, dest = ?, match_mode = ?
+            WHERE dir = ? AND name = ?""",
+            [tuple(entry[1:]) + (path, entry[0]) for entry in entries],
+        )
+        self._conn.execute(
+            "UPDATE directories SET rules_signature = ? WHERE path = ?",
+            (rules_signature, path),
+        )
+        self._written()
+
+    def forget(self, path: str):
+        """폴더와 그 아래 모든 폴더의 색인 삭제
+
+        Args:
+            path: 폴더 경로
+        """
+        # path + 구분자로 시작하는 경로를 범위 조건으로 찾음
+        lower = path.rstrip(os.sep) + os.sep
+        upper = lower[:-1] + chr(ord(os.sep) + 1)
+
+        self._conn.execute(
+            "DELETE FROM directories WHERE path = ? OR (path >= ? AND path < ?)",
+            (path, lower, upper),
+        )
+        self._conn.execute(
+            "DELETE FROM entries WHERE dir = ? OR (dir >= ? AND dir < ?)",
+            (path, lower, upper),
+        )
+        self._written()
+
+    def clear(self):
+        """색인 전체 삭제"""
+        self._conn.execute("DELETE FROM directories")
+        self._conn.execute("DELETE FROM entries")
+        self._conn.commit()
+        self._pending_writes = 0
+
+    def _written(self):
+        """기록 횟수 확인 후 주기적으로 커밋"""
+        self._pending_writes += 1
+        if self._pending_writes >= self.COMMIT_INTERVAL:
+            self.commit()
+
+    def commit(self):
+        """변경 사항 커밋"""
+        self._conn.commit()
+        self._pending_writes = 0
+
+    def close(self):
+        """커밋 후 연결 종료"""
+        if self._conn is not None:
+            self.commit()
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+사전 탐색 없는 스캔 진행률 추정
+"""
+
+import json
+import os
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from src.constants import CONFIG_FILE
+
+
+class ScanProgressEstimator:
+    """스캔 진행률 추정기
+
+    전체 파일 수를 미리 세지 않는다. 같은 소스를 이전에 스캔했으면 그때의
+    파일 수를 전체로 보고, 처음이면 발견한 폴더 중 완료한 폴더의 비율을 쓴다.
+    스캔이 끝나면 이번 파일 수를 저장해서 다음 스캔의 추정에 사용한다.
+    """
+
+    # 저장할 소스 폴더 수 (오래된 것부터 삭제)
+    MAX_SOURCES = 100
+
+    def __init__(
+        self,
+        source: str,
+        include_subfolders: bool = True,
+        callback: Optional[Callable] = None,
+        counts_file: str = None,
+        counts_all_files: bool = True,
+    ):
+        """초기화
+
+        Args:
+            source: 스캔할 소스 폴더
+            include_subfolders: 하위 폴더 포함 여부
+            callback: 진행률 콜백 (현재값, 전체값, 메시지)
+            counts_file: 이전 스캔 파일 수를 저장할 파일 경로
+            counts_all_files: 스캐너가 보고하는 파일 수가 전체 파일 수인지 여부.
+                False면 (파일명 우선 스캔 등) 이전 파일 수를 쓰지도 저장하지도 않음
+        """
+        self.key = f"{os.path.abspath(source)}|{int(bool(include_subfolders))}"
+        self.callback = callback
+        self.counts_file = counts_file or os.path.join(
+            os.path.dirname(CONFIG_FILE), "scan_counts.json"
+        )
+        self.counts_all_files = counts_all_files
+        self.previous_count = (
+            self._load_counts().get(self.key) if counts_all_files else None
+        )
+
+        # 진행 상황 (스캔 스레드에서만 갱신)
+        self.matched = 0
+        self.files_found = 0
+        self.dirs_completed = 0
+        self.dirs_discovered = 0
+
+        self._last_update = 0
+        self._update_interval = 0.1  # 최소 업데이트 간격 (초)
+
+    def estimate(self) -> Tuple[int, int]:
+        """현재 진행률 추정
+
+        Returns:
+            (현재값, 전체값) 튜플
+        """
+        if self.previous_count:
+            # 이전 스캔보다 파일이 늘었으면 전체값도 늘림
+            return self.files_found, max(self.previous_count, self.files_found)
+        return self.dirs_completed, max(self.dirs_discovered, 1)
+
+    def update(self, files_found: int, dirs_completed: int, dirs_discovered: int):
+        """스캐너 진행 상황 반영 (DirectoryScanner의 progress_callback)
+
+        Args:
+            files_found: 지금까지 찾은 파일 수
+            dirs_completed: 목록 조회가 끝난 폴더 수
+            dirs_discovered: 지금까지 발견한 폴더 수
+        """
+        self.files_found = files_found
+        self.dirs_completed = dirs_completed
+        self.dirs_discovered = dirs_discovered
+
+        # 업데이트 간격 제한 (너무 자주 업데이트하지 않도록)
+        current_time = time.time()
+        if current_time - self._last_update < self._update_interval:
+            return
+        self._last_update = current_time
+
+        if self.callback:
+            current, total = self.estimate()
+            self.callback(current, total, self.get_message())
+
+    def get_message(self) -> str:
+        """진행 상황 메시지"""
+        return (
+            f"{self.matched}개 파일 발견 "
+            f"(폴더 {self.dirs_completed}/{self.dirs_discovered})"
+        )
+
+    def save(self):
+        """이번 스캔의 파일 수 저장 (스캔이 끝까지 진행된 경우에만 호출)"""
+        if not self.counts_all_files:
+            return
+
+        counts = self._load_counts()
+        counts.pop(self.key, None)
+        counts[self.key] = self.files_found
+
+        # 오래된 소스 폴더부터 정리
+        while len(counts) > self.MAX_SOURCES:
+            counts.pop(next(iter(counts)))
+
+        try:
+            os.makedirs(os.path.dirname(self.counts_file) or ".", exist_ok=True)
+            with open(self.counts_file, "w", encoding="utf-8") as f:
+                json.dump(counts, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"스캔 파일 수 저장 중 오류: {str(e)}")
+
+    def _load_counts(self) -> Dict[str, int]:
+        """저장된 스캔 파일 수 로드"""
+        if os.path.exists(self.counts_file):
+            try:
+                with open(self.counts_file, "r", encoding="utf-8") as f:
+                    counts = json.load(f)
+                if isinstance(counts, dict):
+                    return counts
+            except Exception:
+                pass
+        return {}
@@ -22,15 +22,46 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
 # 모듈 임포트
+from src.core.compiled_rules import CompiledRuleSet
 from src.core.file_matcher import FileMatcher
+from src.core.file_scanner import DirectoryScanner, ScanRecord
+from src.core.rule_index import (
+    AhoCorasickIndex,
+    KeywordTrie,
+    RegexIndex,
+    HAS_AHOCORASICK,
+)
 from src.core.file_processor import FileProcessor
 from src.core.rule_manager import RuleManager
 from src.utils.config import ConfigManager
 from src.utils.logger import Logger
 from src.utils.validators import Validator
-from src.utils.performance import FileInfoCache, ProgressTracker, get_optimal_chunk_size, is_network_drive
+from src.utils.performance import (
+    BUFFER_POOL,
+    COPY_BACKENDS,
+    BufferPool,
+    FileInfoCache,
+    ProgressTracker,
+    ResultStream,
+    calculate_file_hash,
+    copy_file_data,
+    copy_file_multithread,
+    copy_file_with_progress_optimized,
+    copy_file_with_progress,
+    get_optimal_chunk_size,
+    is_network_drive,
+)
+from src.utils.scan_index import ScanIndex
+from src.utils.scan_progress import ScanProgressEstimator
+from src.utils.chunk_tuner import ChunkSizeTuner
+from src.utils.device_profile import (
+    DeviceProfile,
+    DeviceProfiler,
+    get_device_profile,
+)
 from src.utils.benchmark import PerformanceBenchmark
 from src.utils.file_monitor import FileSystemMonitor, AutoOrganizer
+from src.ui.file_list_model import FileListModel
 from src.ui.main_window import MainWindow
 from src.constants import *
 
@@ -102,6 +133,27 @@ class TestFileMatcher(unittest.TestCase):
         self.assertIn("doc1.txt", matched_names)
         self.assertIn("doc2.pdf", matched_names)
 
+    def test_find_matching_records(self):
+        """stat 정보를 포함한 검색 결과 테스트"""
+        filepath = os.path.join(self.temp_dir, "doc1.txt")
+        with open(filepath, "w") as f:
+            f.write("12345")
+        with open(os.path.join(self.temp_dir, "image.jpg"), "w") as f:
+            f.write("test")
+
+        rules = {"doc": {"dest": "/dest", "match_mode": "포함", "enabled": True}}
+        records = list(self.matcher.find_matching_records(self.temp_dir, rules))
+
+        self.assertEqual(len(records), 1)
+        record = records[0]
+        file_stat = os.stat(filepath)
+        self.assertEqual(record.path, filepath)
+        self.assertEqual(record[:4], (filepath, "/dest", "doc", "포함"))
+        self.assertEqual(record.size, 5)
+        self.assertEqual(record.mtime, file_stat.st_mtime)
+        if os.name != "nt":
+            self.assertEqual(record.inode, file_stat.st_ino)
+
     def test_is_system_file(self):
         """시스템 파일 판별 테스트"""
         # 일반 파일 생성
@@ -122,6 +174,487 @@ class TestFileMatcher(unittest.TestCase):
                 pass  # 심볼릭 링크 생성 실패 시 패스
 
 
+class TestDirectoryScanner(unittest.TestCase):
+    """DirectoryScanner 클래스 테스트"""
+
+    def setUp(self):
+        """테스트 환경 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.scanner = DirectoryScanner(max_workers=4)
+
+        # 여러 단계의 하위 폴더와 숨김 파일/폴더 생성
+        for depth in range(3):
+            for branch in range(3):
+                folder = os.path.join(
+                    self.temp_dir, *[f"d{branch}_{i}" for i in range(depth + 1)]
+                )
+                os.makedirs(folder, exist_ok=True)
+                for index in range(5):
+                    with open(os.path.join(folder, f"file{index}.txt"), "w") as f:
+                        f.write("test")
+        os.makedirs(os.path.join(self.temp_dir, ".hidden_dir"))
+        with open(os.path.join(self.temp_dir, ".hidden_dir", "inner.txt"), "w") as f:
+            f.write("test")
+        with open(os.path.join(self.temp_dir, ".hidden.txt"), "w") as f:
+            f.write("test")
+
+        if hasattr(os, "symlink"):
+            try:
+                os.symlink(
+                    os.path.join(self.temp_dir, "d0_0"),
+                    os.path.join(self.temp_dir, "linked_dir"),
+                )
+                os.symlink(
+                    os.path.join(self.temp_dir, "d0_0", "file0.txt"),
+                    os.path.join(self.temp_dir, "linked.txt"),
+                )
+            except OSError:
+                pass
+
+    def tearDown(self):
+        """테스트 후 정리"""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def _walk_reference(self):
+        """기존 os.walk + is_system_file 방식의 결과"""
+        result = set()
+        for root, dirs, files in os.walk(self.temp_dir):
+            for file in files:
+                file_path = os.path.join(root, file)
+                if not FileMatcher.is_system_file(file_path):
+                    result.add(file_path)
+        return result
+
+    def test_same_files_as_os_walk(self):
+        """os.walk 방식과 같은 파일을 찾는지 테스트"""
+        scanned = [entry.path for entry in self.scanner.scan(self.temp_dir)]
+
+        self.assertEqual(len(scanned), len(set(scanned)))
+        self.assertEqual(set(scanned), self._walk_reference())
+
+    def test_without_subfolders(self):
+        """현재 폴더만 검색 테스트"""
+        with open(os.path.join(self.temp_dir, "top.txt"), "w") as f:
+            f.write("test")
+
+        scanned = [entry.name for entry in self.scanner.scan(self.temp_dir, False)]
+
+        self.assertEqual(scanned, ["top.txt"])
+
+    def test_missing_folder(self):
+        """존재하지 않는 폴더 검색 테스트"""
+        missing = os.path.join(self.temp_dir, "missing")
+        self.assertEqual(list(self.scanner.scan(missing)), [])
+
+    def test_progress_counters(self):
+        """폴더/파일 진행 상황 카운터 테스트"""
+        reports = []
+        scanner = DirectoryScanner(
+            max_workers=4, progress_callback=lambda *args: reports.append(args)
+        )
+        scanned = list(scanner.scan(self.temp_dir))
+
+        # 모든 폴더(숨김 폴더 포함, 심볼릭 링크 제외)를 발견하고 완료
+        dir_count = 1 + sum(
+            1
+            for root, dirs, _ in os.walk(self.temp_dir)
+            for name in dirs
+            if not os.path.islink(os.path.join(root, name))
+        )
+        self.assertEqual(scanner.dirs_discovered, dir_count)
+        self.assertEqual(scanner.dirs_completed, dir_count)
+        self.assertEqual(scanner.files_found, len(scanned))
+        self.assertEqual(len(reports), dir_count)
+        self.assertEqual(reports[-1], (len(scanned), dir_count, dir_count))
+
+    def test_exclude_patterns(self):
+        """제외 패턴에 맞는 폴더는 조회하지 않는지 테스트"""
+        listed = []
+        scanner = DirectoryScanner(
+            max_workers=2, exclude_patterns=["d1_*", "d0_0/d0_1", ".hidden_dir"]
+        )
+        original = scanner.list_directory
+        scanner.list_directory = (
+            lambda path, *args: listed.append(path) or original(path, *args)
+        )
+
+        scanned = {entry.path for entry in scanner.scan(self.temp_dir)}
+        expected = {
+            path
+            for path in self._walk_reference()
+            if os.sep + "d1_" not in path
+            and os.path.join("d0_0", "d0_1") not in path
+            and ".hidden_dir" not in path
+        }
+
+        self.assertEqual(scanned, expected)
+        self.assertFalse(any("d1_0" in path for path in listed))
+        self.assertFalse(any("d0_1" in path for path in listed))
+
+    def test_max_depth(self):
+        """하위 폴더 검색 단계 제한 테스트"""
+        scanner = DirectoryScanner(max_workers=2, max_depth=1)
+        scanned = {entry.path for entry in scanner.scan(self.temp_dir)}
+
+        expected = {
+            path
+            for path in self._walk_reference()
+            if os.path.relpath(path, self.temp_dir).count(os.sep) <= 1
+        }
+        self.assertEqual(scanned, expected)
+
+        # 0은 제한 없음
+        scanner = DirectoryScanner(max_workers=2, max_depth=0)
+        scanned = {entry.path for entry in scanner.scan(self.temp_dir)}
+        self.assertEqual(scanned, self._walk_reference())
+
+    def test_prune_destinations(self):
+        """규칙 대상 폴더는 검색하지 않는지 테스트"""
+        dest = os.path.join(self.temp_dir, "d0_0")
+        rules = {"file0": {"dest": dest, "match_mode": "시작"}}
+        matcher = FileMatcher()
+
+        pruned = list(
+            matcher.find_matching_files_generator(
+                self.temp_dir, rules, prune_destinations=True
+            )
+        )
+        everything = list(matcher.find_matching_files_generator(self.temp_dir, rules))
+
+        self.assertTrue(pruned)
+        self.assertTrue(all(not m[0].startswith(dest + os.sep) for m in pruned))
+        self.assertTrue(any(m[0].startswith(dest + os.sep) for m in everything))
+
+    def test_filter_strategies_same_result(self):
+        """파일명 우선/메타데이터 우선 결과가 같은지 테스트"""
+        matcher = FileMatcher()
+        rules = {
+            "file1": {"dest": "/dest1", "match_mode": "시작"},
+            "hidden": {"dest": "/dest2", "match_mode": "포함"},
+            "linked": {"dest": "/dest3", "match_mode": "정확히"},
+        }
+
+        results = {
+            strategy: sorted(
+                matcher.find_matching_files_generator(
+                    self.temp_dir, rules, filter_strategy=strategy
+                )
+            )
+            for strategy in FileMatcher.FILTER_STRATEGIES
+        }
+
+        self.assertTrue(results[FileMatcher.NAME_FIRST])
+        self.assertEqual(
+            results[FileMatcher.NAME_FIRST], results[FileMatcher.METADATA_FIRST]
+        )
+
+        # 숨김 파일과 심볼릭 링크는 파일명이 매칭되어도 제외
+        names = {os.path.basename(m[0]) for m in results[FileMatcher.NAME_FIRST]}
+        self.assertNotIn(".hidden.txt", names)
+        self.assertNotIn("linked.txt", names)
+
+        with self.assertRaises(ValueError):
+            list(
+                matcher.find_matching_files_generator(
+                    self.temp_dir, rules, filter_strategy="unknown"
+                )
+            )
+
+    def test_name_first_matches_each_name_once(self):
+        """파일명 우선에서 파일마다 한 번만 매칭하는지 테스트"""
+        rules = CompiledRuleSet({"file1": {"dest": "/dest1", "match_mode": "시작"}})
+        calls = []
+        original = rules.first_match_index
+
+        def counting_first_match_index(name):
+            calls.append(name)
+            return original(name)
+
+        rules.first_match_index = counting_first_match_index
+        records = list(
+            FileMatcher().find_matching_records(
+                self.temp_dir, rules, filter_strategy=FileMatcher.NAME_FIRST
+            )
+        )
+
+        # 폴더가 아닌 항목(파일, 숨김 파일, 심볼릭 링크)마다 한 번
+        entries = sum(
+            len(files) + sum(os.path.islink(os.path.join(root, d)) for d in dirs)
+            for root, dirs, files in os.walk(self.temp_dir)
+        )
+        self.assertEqual(len(calls), entries)
+        self.assertEqual(len(records), 9)
+
+    def test_match_and_stat_in_scan_threads(self):
+        """매칭된 파일의 stat은 폴더 조회 스레드에서 하는지 테스트"""
+        threads = set()
+        original = ScanRecord.from_entry.__func__
+
+        def recording_from_entry(cls, entry, *args):
+            threads.add(threading.current_thread().name)
+            return original(cls, entry, *args)
+
+        rules = {"file1": {"dest": "/dest1", "match_mode": "시작"}}
+        with patch.object(ScanRecord, "from_entry", classmethod(recording_from_entry)):
+            records = list(
+                FileMatcher().find_matching_records(self.temp_dir, rules)
+            )
+
+        self.assertEqual(len(records), 9)
+        self.assertTrue(all(record.size == 4 for record in records))
+        self.assertTrue(threads)
+        self.assertTrue(all(name.startswith("DirectoryScanner") for name in threads))
+
+    def test_close_generator_early(self):
+        """제너레이터를 중간에 닫아도 정상 종료되는지 테스트"""
+        scan = self.scanner.scan(self.temp_dir)
+        next(scan)
+        scan.close()
+
+
+class TestCompiledRuleSet(unittest.TestCase):
+    """CompiledRuleSet 클래스 테스트"""
+
+    def setUp(self):
+        """테스트 환경 설정"""
+        self.rules = {
+            "report": {"dest": "/reports", "match_mode": "끝", "enabled": True},
+            "doc": {"dest": "/docs", "match_mode": "포함", "enabled": True},
+            r"^\d{4}_": {"dest": "/dated", "match_mode": "정규식", "enabled": True},
+            "invoice": {"dest": "/invoices", "match_mode": "정확히", "enabled": True},
+            "img": {"dest": "/images", "match_mode": "시작", "enabled": True},
+            "[broken": {"dest": "/broken", "match_mode": "정규식", "enabled": True},
+            "unknown": {"dest": "/unknown", "match_mode": "모름", "enabled": True},
+        }
+        self.compiled = CompiledRuleSet(self.rules)
+
+    def _loop_match(self, filename):
+        """기존 방식의 첫 매칭 규칙"""
+        for keyword, rule_data in self.rules.items():
+            if FileMatcher.match_file(filename, keyword, rule_data["match_mode"]):
+                return keyword
+        return None
+
+    def test_first_match_order(self):
+        """규칙 딕셔너리 순서대로 첫 매칭 규칙 반환 테스트"""
+        # "doc"(포함)도 매칭되지만 "report"(끝)가 먼저 정의됨
+        self.assertEqual(self.compiled.match("doc_report.pdf")[0], "report")
+        self.assertEqual(self.compiled.match("2025_doc.txt")[0], "doc")
+        self.assertEqual(
+            self.compiled.match("/some/dir/2025_plan.txt"),
+            (r"^\d{4}_", "/dated", "정규식"),
+        )
+        self.assertIsNone(self.compiled.match("unknown.txt"))
+
+    def test_exact_rules_lookup(self):
+        """정확히 규칙 조회와 다른 모드와의 우선순위 병합 테스트"""
+        rules = {
+            "Report": {"dest": "/first", "match_mode": "정확히", "enabled": True},
+            "port": {"dest": "/contains", "match_mode": "포함", "enabled": True},
+            "report": {"dest": "/second", "match_mode": "정확히", "enabled": True},
+            "memo": {"dest": "/memo", "match_mode": "정확히", "enabled": True},
+        }
+        compiled = CompiledRuleSet(rules)
+
+        # 대소문자만 다른 정확히 규칙은 먼저 정의된 규칙이 우선
+        self.assertEqual(compiled.match("REPORT.pdf")[1], "/first")
+        # 정확히 규칙보다 앞선 포함 규칙이 우선
+        self.assertEqual(compiled.match("airport.pdf")[1], "/contains")
+        self.assertEqual(compiled.match("Memo.txt")[1], "/memo")
+        self.assertIsNone(compiled.match("memo_2025.txt"))
+
+    def test_same_result_as_match_file(self):
+        """기존 규칙별 루프와 결과 일치 테스트"""
+        filenames = [
+            "doc_report.pdf",
+            "REPORT.PDF",
+            "Invoice.xlsx",
+            "invoice_2025.xlsx",
+            "IMG_0001.jpg",
+            "photo_img.jpg",
+            "2025_summary.txt",
+            "[broken.txt",
+            ".hidden_doc",
+            "plain.txt",
+            "no_extension",
+        ]
+        for filename in filenames:
+            matched = self.compiled.match(filename)
+            self.assertEqual(
+                matched[0] if matched else None, self._loop_match(filename), filename
+            )
+
+    def test_find_matching_files_uses_same_order(self):
+        """제너레이터가 컴파일된 규칙 집합을 받아도 동일하게 동작하는지 테스트"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            for filename in ["doc_report.pdf", "IMG_0001.jpg", "plain.txt"]:
+                with open(os.path.join(temp_dir, filename), "w") as f:
+                    f.write("test")
+
+            matcher = FileMatcher()
+            from_dict = sorted(
+                matcher.find_matching_files_generator(temp_dir, self.rules, False)
+            )
+            from_compiled = sorted(
+                matcher.find_matching_files_generator(temp_dir, self.compiled, False)
+            )
+            self.assertEqual(from_dict, from_compiled)
+            self.assertEqual([m[2] for m in from_dict], ["img", "report"])
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+class TestAhoCorasickIndex(unittest.TestCase):
+    """AhoCorasickIndex 클래스 테스트"""
+
+    def _backends(self):
+        """테스트할 구현 목록 (pyahocorasick은 설치된 경우만)"""
+        return [False, True] if HAS_AHOCORASICK else [False]
+
+    def _build(self, keywords, use_accelerated):
+        index = AhoCorasickIndex(use_accelerated=use_accelerated)
+        for priority, keyword in enumerate(keywords):
+            index.add(keyword, priority)
+        index.build()
+        return index
+
+    def test_find_all_overlapping(self):
+        """겹치는 키워드 모두 찾기 테스트"""
+        for accelerated in self._backends():
+            index = self._build(["he", "she", "his", "hers"], accelerated)
+            self.assertEqual(index.find_all("ushers"), [0, 1, 3])
+            self.assertEqual(index.find_all("xyz"), [])
+
+    def test_first_match_priority(self):
+        """우선순위가 가장 높은 키워드 반환 테스트"""
+        for accelerated in self._backends():
+            index = self._build(["report", "rep", "port"], accelerated)
+            self.assertEqual(index.first_match("my_report.pdf"), 0)
+            self.assertEqual(index.first_match("airport.png"), 2)
+            self.assertEqual(index.first_match("repo.txt"), 1)
+            self.assertEqual(index.first_match("none.txt"), -1)
+
+    def test_empty_keyword_matches_everything(self):
+        """빈 키워드는 기존 'in' 연산처럼 항상 매칭되는지 테스트"""
+        for accelerated in self._backends():
+            index = self._build(["abc", ""], accelerated)
+            self.assertEqual(index.first_match("xyz"), 1)
+            self.assertEqual(index.find_all("abc"), [0, 1])
+
+    def test_same_result_as_naive_search(self):
+        """단순 포함 검사와 결과 일치 테스트"""
+        import random
+
+        rng = random.Random(7)
+        alphabet = "ab가나"
+        keywords = [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+            for _ in range(60)
+        ]
+        texts = [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            for _ in range(300)
+        ]
+
+        for accelerated in self._backends():
+            index = self._build(keywords, accelerated)
+            for text in texts:
+                expected = [i for i, k in enumerate(keywords) if k in text]
+                # 중복 키워드는 가장 앞의 우선순위만 남음
+                expected = sorted(
+                    {keywords.index(keywords[i]) for i in expected}
+                )
+                self.assertEqual(index.find_all(text), expected, text)
+                self.assertEqual(
+                    index.first_match(text), expected[0] if expected else -1
+                )
+
+
+class TestKeywordTrie(unittest.TestCase):
+    """KeywordTrie 클래스 테스트"""
+
+    def test_prefix_matches(self):
+        """접두사 트라이 테스트"""
+        trie = KeywordTrie()
+        for priority, keyword in enumerate(["report_2025", "rep", "report", "img"]):
+            trie.add(keyword, priority)
+
+        self.assertEqual(trie.matches("report_2025_final"), [0, 1, 2])
+        self.assertEqual(trie.first_match("report_2024"), 1)
+        self.assertEqual(trie.first_match("img_001"), 3)
+        self.assertEqual(trie.first_match("2025_report"), -1)
+
+    def test_suffix_matches(self):
+        """접미사 트라이 테스트"""
+        trie = KeywordTrie(reverse=True)
+        for priority, keyword in enumerate(["final", "_final", "report"]):
+            trie.add(keyword, priority)
+
+        self.assertEqual(trie.matches("draft_final"), [0, 1])
+        self.assertEqual(trie.first_match("annual_report"), 2)
+        self.assertEqual(trie.first_match("final_draft"), -1)
+
+    def test_duplicate_keyword_keeps_first_priority(self):
+        """같은 키워드는 먼저 정의된 우선순위 유지 테스트"""
+        trie = KeywordTrie()
+        trie.add("doc", 3)
+        trie.add("doc", 5)
+
+        self.assertEqual(len(trie), 1)
+        self.assertEqual(trie.first_match("document"), 3)
+
+
+class TestRegexIndex(unittest.TestCase):
+    """RegexIndex 클래스 테스트"""
+
+    def _build(self, patterns, combine=True):
+        index = RegexIndex(combine=combine)
+        for priority, pattern in enumerate(patterns):
+            index.add(pattern, priority)
+        index.build()
+        return index
+
+    def test_combined_keeps_rule_priority(self):
+        """조합 패턴이 가장 왼쪽 매칭이 아닌 규칙 순서를 따르는지 테스트"""
+        # "final"이 더 오른쪽에서 매칭되지만 먼저 정의된 규칙
+        index = self._build([r"final", r"^\d{4}_", r"draft"])
+
+        self.assertEqual(index.first_match("2025_draft_final.txt"), 0)
+        self.assertEqual(index.first_match("2025_draft.txt"), 1)
+        self.assertEqual(index.first_match("DRAFT.txt"), 2)
+        self.assertEqual(index.first_match("memo.txt"), -1)
+        self.assertEqual(index.first_match("2025_draft_final.txt", limit=0), -1)
+
+    def test_patterns_that_cannot_be_combined(self):
+        """캡처 그룹/전역 플래그 패턴도 개별 검색으로 동작하는지 테스트"""
+        patterns = [r"(ab)\1", r"(?i)^memo", r"x+"]
+        for combine in (False, True):
+            index = self._build(patterns, combine)
+            self.assertEqual(index.first_match("ABAB.txt"), 0)
+            self.assertEqual(index.first_match("Memo_x.txt"), 1)
+            self.assertEqual(index.first_match("xx.txt"), 2)
+
+    def test_invalid_pattern_reported_once(self):
+        """잘못된 패턴은 한 번만 기록되고 매칭되지 않는지 테스트"""
+        index = self._build([r"[broken", r"ok"])
+
+        self.assertEqual(len(index.invalid), 1)
+        self.assertEqual(index.invalid[0][1], r"[broken")
+        self.assertEqual(index.first_match("[broken_ok.txt"), 1)
+
+        messages = []
+        rules = {
+            r"[broken": {"dest": "/a", "match_mode": "정규식", "enabled": True},
+        }
+        compiled = CompiledRuleSet(rules, log_callback=messages.append)
+        compiled.match("a.txt")
+        compiled.match("b.txt")
+        self.assertEqual(len(messages), 1)
+        self.assertEqual(compiled.invalid_rules[0][0], r"[broken")
+
+
 class TestFileProcessor(unittest.TestCase):
     """FileProcessor 클래스 테스트"""
 
@@ -327,6 +860,97 @@ class TestRuleManager(unittest.TestCase):
         for rule in self.rule_manager.rules.values():
             self.assertTrue(rule["enabled"])
 
+    def test_compiled_rules_cache(self):
+        """컴파일된 규칙 캐시 재사용 및 무효화 테스트"""
+        self.rule_manager.add_rule("report", "/dest1", "포함")
+
+        compiled = self.rule_manager.get_compiled_rules()
+        self.assertIs(compiled, self.rule_manager.get_compiled_rules())
+        self.assertEqual(compiled.match("report.txt")[0], "report")
+
+        # 규칙이 바뀌면 다시 컴파일
+        self.rule_manager.add_rule("image", "/dest2", "시작")
+        recompiled = self.rule_manager.get_compiled_rules()
+        self.assertIsNot(compiled, recompiled)
+        self.assertEqual(recompiled.match("image_01.png")[0], "image")
+
+        # 비활성화된 규칙은 제외
+        self.rule_manager.toggle_rule("report")
+        self.assertIsNone(self.rule_manager.get_compiled_rules().match("report.txt"))
+
+    def test_rule_change_during_compile(self):
+        """컴파일 중 다른 스레드에서 바뀐 규칙이 캐시에 남지 않는지 테스트"""
+        import src.core.rule_manager as rule_manager_module
+
+        self.rule_manager.add_rule("report", "/dest1", "포함")
+        changer = threading.Thread(
+            target=self.rule_manager.add_rule, args=("image", "/dest2", "시작")
+        )
+        original = rule_manager_module.CompiledRuleSet
+
+        def slow_compile(rules, log_callback=None):
+            # 컴파일하는 동안 규칙 변경
+            if not changer.is_alive() and changer.ident is None:
+                changer.start()
+                time.sleep(0.1)
+            return original(rules, log_callback)
+
+        with patch.object(rule_manager_module, "CompiledRuleSet", slow_compile):
+            stale = self.rule_manager.get_compiled_rules()
+            changer.join()
+            self.assertIsNone(stale.match("image_01.png"))
+
+            fresh = self.rule_manager.get_compiled_rules()
+            self.assertIsNot(stale, fresh)
+            self.assertEqual(fresh.match("image_01.png")[0], "image")
+
+    def test_rules_version_and_listeners(self):
+        """규칙 버전 증가 및 변경 알림 테스트"""
+        events = []
+        self.rule_manager.subscribe(events.append)
+
+        version = self.rule_manager.rules_version
+        self.rule_manager.add_rule("rule1", "/dest1", "포함")
+        self.rule_manager.toggle_rule("rule1")
+        self.rule_manager.toggle_all_rules()
+        self.rule_manager.set_all_rules_enabled(False)
+        self.rule_manager.reload_rules()
+
+        self.assertEqual(events, list(range(version + 1, version + 6)))
+        self.assertEqual(self.rule_manager.rules_version, version + 5)
+
+        # 없는 규칙 삭제는 변경이 아님
+        self.rule_manager.delete_rule("missing")
+        self.assertEqual(len(events), 5)
+
+        # 구독 해제 후에는 알림 없음
+        self.rule_manager.unsubscribe(events.append)
+        self.rule_manager.delete_rule("rule1")
+        self.assertEqual(len(events), 5)
+
+    def test_listener_error_does_not_break_save(self):
+        """구독자 오류가 규칙 저장을 막지 않는지 테스트"""
+        def broken_listener(version):
+            raise RuntimeError("boom")
+
+        events = []
+        self.rule_manager.subscribe(broken_listener)
+        self.rule_manager.subscribe(events.append)
+
+        self.assertTrue(self.rule_manager.add_rule("rule1", "/dest1", "포함"))
+        self.assertEqual(len(events), 1)
+
+    def test_active_rules_cache(self):
+        """활성 규칙 캐시가 변경 시에만 무효화되는지 테스트"""
+        self.rule_manager.add_rule("rule1", "/dest1", "포함")
+
+        active_rules = self.rule_manager.get_active_rules()
+        self.assertIs(active_rules, self.rule_manager.get_active_rules())
+
+        self.rule_manager.toggle_rule("rule1")
+        self.assertIsNot(active_rules, self.rule_manager.get_active_rules())
+        self.assertEqual(self.rule_manager.get_active_rules(), {})
+
 
 class TestConfigManager(unittest.TestCase):
     """ConfigManager 클래스 테스트"""
@@ -506,6 +1130,170 @@ class TestPerformanceUtils(unittest.TestCase):
         self.assertTrue(len(progress_values) > 0)
         self.assertLessEqual(progress_values[-1], 100)
 
+    def _make_random_file(self, size):
+        """임의 내용의 테스트 파일 생성"""
+        path = os.path.join(self.temp_dir, f"src_{size}.bin")
+        with open(path, "wb") as f:
+            f.write(os.urandom(size))
+        return path
+
+    def _assert_same_content(self, src, dst):
+        """두 파일 내용 비교"""
+        with open(src, "rb") as a, open(dst, "rb") as b:
+            self.assertEqual(a.read(), b.read())
+
+    def test_copy_file_data_backends(self):
+        """복사 방식별 파일 내용/청크 콜백 테스트"""
+        size = 3 * 1024 * 1024 + 123
+        src = self._make_random_file(size)
+
+        for backend in COPY_BACKENDS:
+            dst = os.path.join(self.temp_dir, f"dst_{backend}.bin")
+            progress = []
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                used = copy_file_data(
+                    fsrc, fdst, size, 1024 * 1024, progress.append, (backend,)
+                )
+
+            # 지원하지 않는 환경이면 버퍼 복사로 대체됨
+            self.assertIn(used, (backend, "buffered"), backend)
+            self._assert_same_content(src, dst)
+            self.assertEqual(progress[-1], size)
+            if used != "reflink":
+                self.assertEqual(len(progress), 4)
+
+    def test_copy_file_data_falls_back(self):
+        """커널 복사 경로가 지원되지 않으면 다음 방식으로 이어가는지 테스트"""
+        import errno
+
+        size = 2 * 1024 * 1024
+        src = self._make_random_file(size)
+        dst = os.path.join(self.temp_dir, "dst.bin")
+
+        def unsupported(*args):
+            raise OSError(errno.EXDEV, "cross-device")
+
+        with patch("src.utils.performance.os.copy_file_range", unsupported, create=True), \
+                patch("src.utils.performance.os.sendfile", unsupported, create=True):
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                used = copy_file_data(
+                    fsrc, fdst, size, 512 * 1024, None,
+                    ("copy_file_range", "sendfile", "buffered"),
+                )
+
+        self.assertEqual(used, "buffered")
+        self._assert_same_content(src, dst)
+
+        # 복사 중 발생한 다른 오류는 그대로 전달
+        def disk_full(*args):
+            raise OSError(errno.ENOSPC, "no space")
+
+        with patch("src.utils.performance.IS_LINUX", True), \
+                patch("src.utils.performance.os.copy_file_range", disk_full, create=True):
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                with self.assertRaises(OSError):
+                    copy_file_data(fsrc, fdst, size, 512 * 1024, None, ("copy_file_range",))
+
+    def test_copy_file_data_zero_at_start_falls_back(self):
+        """커널 복사가 처음부터 0을 돌려주면 다음 방식으로 복사하는지 테스트"""
+        size = 2 * 1024 * 1024 + 5
+        src = self._make_random_file(size)
+        dst = os.path.join(self.temp_dir, "dst.bin")
+
+        with patch("src.utils.performance.IS_LINUX", True), \
+                patch("src.utils.performance.os.copy_file_range", lambda *args: 0, create=True):
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                used = copy_file_data(
+                    fsrc, fdst, size, 512 * 1024, None, ("copy_file_range", "buffered")
+                )
+
+        self.assertEqual(used, "buffered")
+        self._assert_same_content(src, dst)
+
+    def test_copy_file_data_reads_to_eof(self):
+        """복사 중에 원본이 커져도 끝까지 복사하는지 테스트 (모든 방식)"""
+        for backend in ("copy_file_range", "sendfile", "buffered"):
+            size = 1024 * 1024
+            src = self._make_random_file(size)
+            dst = os.path.join(self.temp_dir, f"dst_{backend}.bin")
+            grown = []
+
+            def grow(copied):
+                # 첫 청크 복사 후 원본 뒤에 데이터 추가
+                if not grown:
+                    with open(src, "ab") as f:
+                        f.write(os.urandom(300 * 1024))
+                    grown.append(copied)
+
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                copy_file_data(fsrc, fdst, size, 256 * 1024, grow, (backend,))
+
+            self.assertEqual(os.path.getsize(dst), size + 300 * 1024, backend)
+            self._assert_same_content(src, dst)
+
+    def test_copy_file_with_progress(self):
+        """대용량 파일 복사 진행률 테스트 (1% 단위)"""
+        size = 12 * 1024 * 1024
+        src = self._make_random_file(size)
+        dst = os.path.join(self.temp_dir, "dst.bin")
+        percents = []
+
+        copy_file_with_progress(
+            src, dst, lambda copied, total, percent: percents.append(percent),
+            chunk_size=256 * 1024,
+        )
+
+        self._assert_same_content(src, dst)
+        self.assertEqual(percents, sorted(set(percents)))
+        self.assertEqual(percents[-1], 100)
+
+    def test_copy_file_multithread(self):
+        """멀티스레드 복사가 대상 파일에 바로 쓰고 진행률을 합산하는지 테스트"""
+        size = 5 * 1024 * 1024 + 321
+        src = self._make_random_file(size)
+        dst = os.path.join(self.temp_dir, "dst.bin")
+        progress = []
+        lock = threading.Lock()
+
+        def callback(copied, total, percent, detail=""):
+            with lock:
+                progress.append((copied, total, percent))
+
+        self.assertTrue(
+            copy_file_multithread(
+                src, dst, callback, num_threads=4, chunk_size=256 * 1024
+            )
+        )
+
+        self._assert_same_content(src, dst)
+        self.assertEqual(progress[-1], (size, size, 100))
+        percents = [percent for _, _, percent in progress]
+        self.assertEqual(percents, sorted(set(percents)))
+        # 임시 조각 파일을 만들지 않음
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ["dst.bin", os.path.basename(src)])
+
+        # 빈 파일
+        empty = os.path.join(self.temp_dir, "empty.bin")
+        open(empty, "wb").close()
+        self.assertTrue(copy_file_multithread(empty, dst))
+        self.assertEqual(os.path.getsize(dst), 0)
+
+    def test_copy_file_multithread_failure(self):
+        """쓰기 실패 시 부분 파일을 지우고 False 반환 테스트"""
+        import errno
+
+        src = self._make_random_file(2 * 1024 * 1024)
+        dst = os.path.join(self.temp_dir, "dst.bin")
+
+        def disk_full(*args):
+            raise OSError(errno.ENOSPC, "no space")
+
+        with patch("src.utils.performance.os.pwrite", disk_full):
+            self.assertFalse(
+                copy_file_multithread(src, dst, num_threads=2, chunk_size=256 * 1024)
+            )
+        self.assertFalse(os.path.exists(dst))
+
     def test_get_optimal_chunk_size(self):
         """최적 청크 크기 계산 테스트"""
         # 작은 파일
@@ -519,15 +1307,676 @@ class TestPerformanceUtils(unittest.TestCase):
 
     def test_is_network_drive(self):
         """네트워크 드라이브 확인 테스트"""
-        # UNC 경로
-        self.assertTrue(is_network_drive("\\\\server\\share"))
-        self.assertTrue(is_network_drive("//server/share"))
+        # UNC 경로 (Windows)
+        with patch("src.utils.device_profile.platform.system", return_value="Windows"):
+            self.assertTrue(is_network_drive("\\\\server\\share"))
+            self.assertTrue(is_network_drive("//server/share"))
         
         # 로컬 경로
         self.assertFalse(is_network_drive("/home/user"))
         self.assertFalse(is_network_drive("C:\\Users"))
 
 
+class TestBufferPool(unittest.TestCase):
+    """BufferPool 클래스 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_size_class(self):
+        """크기 등급 계산 테스트"""
+        self.assertEqual(BufferPool.size_class(8192), 64 * 1024)
+        self.assertEqual(BufferPool.size_class(300 * 1024), 512 * 1024)
+        self.assertEqual(BufferPool.size_class(1024 * 1024), 1024 * 1024)
+        self.assertEqual(BufferPool.size_class(10 * 1024 * 1024 + 1), 11 * 1024 * 1024)
+
+    def test_reuse_and_limits(self):
+        """반납한 버퍼 재사용과 보관 한도 테스트"""
+        pool = BufferPool(max_idle_bytes=256 * 1024, max_per_class=2)
+
+        with pool.buffer(100 * 1024) as view:
+            self.assertEqual(len(view), 100 * 1024)
+            first = view.obj
+        self.assertEqual(pool.idle_bytes, 128 * 1024)
+
+        # 같은 등급은 같은 버퍼를 다시 빌려줌
+        with pool.buffer(120 * 1024) as view:
+            self.assertIs(view.obj, first)
+            self.assertEqual(pool.idle_bytes, 0)
+
+        # 동시에 빌리면 서로 다른 버퍼
+        buffers = [pool.acquire(100 * 1024) for _ in range(3)]
+        self.assertEqual(len({id(b) for b in buffers}), 3)
+        for buffer in buffers:
+            pool.release(buffer)
+        self.assertEqual(pool.idle_bytes, 256 * 1024)
+
+        pool.clear()
+        self.assertEqual(pool.idle_bytes, 0)
+
+    def test_loops_use_pool(self):
+        """복사/해시 루프가 풀 버퍼로 같은 결과를 내는지 테스트"""
+        import hashlib
+
+        data = os.urandom(3 * 1024 * 1024 + 17)
+        src = os.path.join(self.temp_dir, "src.bin")
+        with open(src, "wb") as f:
+            f.write(data)
+
+        BUFFER_POOL.clear()
+        self.assertEqual(
+            calculate_file_hash(src, "sha256", chunk_size=256 * 1024),
+            hashlib.sha256(data).hexdigest(),
+        )
+        self.assertEqual(BUFFER_POOL.idle_bytes, 256 * 1024)
+
+        dst = os.path.join(self.temp_dir, "dst.bin")
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            copy_file_data(fsrc, fdst, len(data), 256 * 1024, None, ("buffered",))
+        with open(dst, "rb") as f:
+            self.assertEqual(f.read(), data)
+
+        parallel = os.path.join(self.temp_dir, "parallel.bin")
+        self.assertTrue(
+            copy_file_multithread(src, parallel, num_threads=2, chunk_size=256 * 1024)
+        )
+        with open(parallel, "rb") as f:
+            self.assertEqual(f.read(), data)
+
+        # 빌린 버퍼는 모두 반납됨 (스레드끼리 재사용할 수 있어서 개수는 1~3개)
+        self.assertIn(BUFFER_POOL.idle_bytes, [n * 256 * 1024 for n in (1, 2, 3)])
+
+    def test_multithread_buffers_fit_pool(self):
+        """멀티스레드 복사의 스레드별 버퍼가 풀 보관 한도 안에 드는지 테스트"""
+        import src.utils.performance as performance
+
+        data = os.urandom(8 * 1024 * 1024)
+        src = os.path.join(self.temp_dir, "src.bin")
+        with open(src, "wb") as f:
+            f.write(data)
+
+        dst = os.path.join(self.temp_dir, "dst.bin")
+        pool_limit = patch.object(BUFFER_POOL, "max_idle_bytes", 4 * 1024 * 1024)
+        with pool_limit, patch.object(
+            BUFFER_POOL, "buffer", wraps=BUFFER_POOL.buffer
+        ) as buffer:
+            self.assertTrue(
+                copy_file_multithread(
+                    src, dst, num_threads=4, chunk_size=100 * 1024 * 1024
+                )
+            )
+        self.assertEqual(buffer.call_count, 4)
+        for call in buffer.call_args_list:
+            self.assertEqual(call[0][0], 1024 * 1024)
+        with open(dst, "rb") as f:
+            self.assertEqual(f.read(), data)
+
+        # 큰 파일의 멀티스레드 복사는 파일 크기별 청크 대신 고정 청크 사용
+        local = DeviceProfile("/", "ext4", "/dev/sda1", False, False)
+        with patch.object(
+            performance, "get_device_profile", return_value=local
+        ), patch.object(
+            performance.os.path, "getsize", return_value=20 * 1024 * 1024 * 1024
+        ), patch.object(
+            performance, "copy_file_multithread", return_value=True
+        ) as multithread:
+            success, error = copy_file_with_progress_optimized(
+                src, dst, use_multithread=True
+            )
+        self.assertTrue(success, error)
+        self.assertEqual(
+            multithread.call_args[1]["chunk_size"],
+            ADVANCED_SETTINGS["chunk_sizes"]["medium"],
+        )
+
+
+class TestResultStream(unittest.TestCase):
+    """ResultStream 클래스 테스트"""
+
+    def test_put_and_drain_in_order(self):
+        """넣은 순서대로 꺼내고 끝나면 done 테스트"""
+        stream = ResultStream(maxsize=100, min_chunk=5, max_chunk=20)
+        for i in range(30):
+            self.assertTrue(stream.put(i))
+
+        received = []
+        self.assertFalse(stream.done)
+        while stream.drain(received.extend, time_budget=1.0):
+            pass
+
+        self.assertEqual(received, list(range(30)))
+        self.assertFalse(stream.done)  # 아직 close 전
+
+        stream.close()
+        self.assertTrue(stream.done)
+
+    def test_put_blocks_until_stopped(self):
+        """큐가 가득 차면 대기하고 중단 시 False 반환 테스트"""
+        stream = ResultStream(maxsize=2)
+        self.assertTrue(stream.put(1))
+        self.assertTrue(stream.put(2))
+
+        stop = threading.Event()
+        threading.Timer(0.2, stop.set).start()
+
+        start = time.time()
+        self.assertFalse(stream.put(3, stop.is_set))
+        self.assertGreaterEqual(time.time() - start, 0.15)
+
+    def test_producer_waits_for_consumer(self):
+        """소비자가 꺼내면 대기 중인 생산자가 계속 진행 테스트"""
+        stream = ResultStream(maxsize=10, min_chunk=5)
+
+        def produce():
+            for i in range(100):
+                stream.put(i)
+            stream.close()
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+
+        received = []
+        deadline = time.time() + 5
+        while not stream.done and time.time() < deadline:
+            stream.drain(received.extend, time_budget=0.01)
+            time.sleep(0.001)
+        producer.join(timeout=1)
+
+        self.assertEqual(received, list(range(100)))
+
+    def test_chunk_size_adapts(self):
+        """처리 시간에 따른 묶음 크기 조절 테스트"""
+        stream = ResultStream(maxsize=10000, min_chunk=10, max_chunk=80)
+        for i in range(1000):
+            stream.put(i)
+
+        # 빠른 처리 -> 최대 크기까지 증가
+        stream.drain(lambda items: None, time_budget=1.0)
+        self.assertEqual(stream.chunk_size, 80)
+
+        for i in range(1000):
+            stream.put(i)
+
+        # 느린 처리 -> 줄어들고 시간 예산이 지나면 중단
+        chunks = []
+
+        def slow_handler(items):
+            chunks.append(len(items))
+            time.sleep(0.02)
+
+        processed = stream.drain(slow_handler, time_budget=0.05)
+        self.assertLess(processed, 1000)
+        self.assertLess(stream.chunk_size, 80)
+        self.assertEqual(processed, sum(chunks))
+
+
+class TestChunkSizeTuner(unittest.TestCase):
+    """ChunkSizeTuner 클래스 테스트"""
+
+    MB = 1024 * 1024
+
+    def setUp(self):
+        """테스트 환경 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.tuning_file = os.path.join(self.temp_dir, "chunk_sizes.json")
+        self.tuner = ChunkSizeTuner(self.tuning_file)
+
+    def tearDown(self):
+        """테스트 후 정리"""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def _run(self, session, throughput, chunks=30):
+        """청크 크기별 처리량 함수로 복사 과정을 흉내냄"""
+        for _ in range(chunks):
+            size = session.chunk_size
+            session.record(size, size / throughput(size))
+
+    def test_increases_until_throughput_stops_improving(self):
+        """처리량이 좋아지는 동안 청크를 키우는지 테스트"""
+        session = self.tuner.start(os.path.join(self.temp_dir, "a.bin"), self.MB)
+
+        # 4MB까지는 청크가 클수록 빠르고 그 뒤로는 느려지는 장치
+        def throughput(size):
+            return min(size, 4 * self.MB) * 100 - max(0, size - 4 * self.MB) * 30
+
+        self._run(session, throughput)
+
+        self.assertTrue(session.done)
+        self.assertEqual(session.best_chunk, 4 * self.MB)
+        self.assertEqual(session.chunk_size, 4 * self.MB)
+
+    def test_decreases_when_throughput_drops(self):
+        """처리량이 크게 떨어지면 청크를 절반으로 줄이는지 테스트"""
+        session = self.tuner.start(os.path.join(self.temp_dir, "a.bin"), 8 * self.MB)
+
+        session.record(8 * self.MB, 0.1)  # 첫 청크는 측정에서 제외
+        session.record(8 * self.MB, 0.1)
+        self.assertEqual(session.chunk_size, 12 * self.MB)
+        session.record(12 * self.MB, 1.0)  # 처리량 급락
+        self.assertEqual(session.chunk_size, 6 * self.MB)
+
+    def test_persisted_per_mount_point(self):
+        """마운트 지점별 저장 및 다음 실행에서 사용 테스트"""
+        path = os.path.join(self.temp_dir, "not_yet", "a.bin")
+        mount_point = get_device_profile(path).mount_point
+
+        session = self.tuner.start(path, self.MB)
+        self.assertEqual(session.mount_point, mount_point)
+        session.finish()  # 측정 전이면 저장하지 않음
+        self.assertIsNone(self.tuner.get(path))
+
+        session.record(self.MB, 0.01)
+        session.record(self.MB, 0.01)
+        session.finish()
+
+        reloaded = ChunkSizeTuner(self.tuning_file)
+        self.assertEqual(reloaded.get(path), self.MB)
+        self.assertEqual(reloaded.start(path, 32 * self.MB).chunk_size, self.MB)
+
+        # 범위를 벗어난 시작 값은 제한
+        reloaded.clear()
+        self.assertEqual(reloaded.start(path, 1).chunk_size, reloaded.min_chunk)
+        self.assertFalse(os.path.exists(self.tuning_file))
+
+    def test_optimized_copy_tunes_chunk_size(self):
+        """최적화 복사가 청크 크기를 조절하고 저장하는지 테스트"""
+        data = os.urandom(12 * self.MB)
+        src = os.path.join(self.temp_dir, "src.bin")
+        dst = os.path.join(self.temp_dir, "dst.bin")
+        with open(src, "wb") as f:
+            f.write(data)
+
+        success, error = copy_file_with_progress_optimized(
+            src, dst, adaptive_chunk=False, tuner=self.tuner
+        )
+        self.assertTrue(success, error)
+        self.assertIsNone(self.tuner.get(dst))
+
+        os.remove(dst)
+        success, error = copy_file_with_progress_optimized(src, dst, tuner=self.tuner)
+        self.assertTrue(success, error)
+        with open(dst, "rb") as f:
+            self.assertEqual(f.read(), data)
+        self.assertIsNotNone(self.tuner.get(dst))
+
+    def test_small_file_uses_default_chunk(self):
+        """조절하지 않는 작은 파일은 크기별 기본 청크를 쓰고 버퍼도 파일 크기로 제한"""
+        import src.utils.performance as performance
+
+        src = os.path.join(self.temp_dir, "small.bin")
+        dst = os.path.join(self.temp_dir, "small_copy.bin")
+        with open(src, "wb") as f:
+            f.write(os.urandom(self.MB))
+
+        # 장치에 큰 청크 크기가 저장되어 있어도
+        self.tuner.store(get_device_profile(dst).mount_point, 64 * self.MB, 1e9)
+
+        with patch.object(
+            performance,
+            "copy_file_single_thread",
+            wraps=performance.copy_file_single_thread,
+        ) as single:
+            success, error = copy_file_with_progress_optimized(
+                src, dst, tuner=self.tuner
+            )
+        self.assertTrue(success, error)
+        self.assertEqual(single.call_args[0][2], get_optimal_chunk_size(self.MB))
+        self.assertIsNone(single.call_args[0][4])
+
+        # 청크 크기를 크게 넘겨도 버퍼는 파일 크기 등급까지만
+        BUFFER_POOL.clear()
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            copy_file_data(fsrc, fdst, self.MB, 64 * self.MB, None, ("buffered",))
+        self.assertEqual(BUFFER_POOL.idle_bytes, self.MB)
+
+
+class TestDeviceProfiler(unittest.TestCase):
+    """DeviceProfiler 클래스 테스트 (가짜 mountinfo / sysfs 사용)"""
+
+    MOUNTINFO = (
+        "22 1 8:1 / / rw,relatime shared:1 - ext4 /dev/sda1 rw\n"
+        "30 22 8:17 / /mnt/usb\\040disk rw,relatime - ext4 /dev/sdb1 rw\n"
+        "31 22 0:50 / /mnt/nas rw,relatime - nfs4 nas:/export rw\n"
+        "32 22 0:51 / /mnt/share rw,relatime - cifs //server/share rw\n"
+        "33 22 0:52 / /mnt/remote rw - fuse.sshfs user@host:/data rw\n"
+        "34 22 0:53 / /mnt/other rw - fuse.myfs user@host:/data rw\n"
+        "35 22 0:54 / /mnt/local rw - fuse.encfs encfs rw\n"
+        "37 22 0:55 / /mnt/pool rw - fuse.mergerfs disk1:disk2 rw\n"
+        "38 22 0:56 / /mnt/export rw - fuse.myfs nas:/export rw\n"
+        "36 31 259:0 / /mnt/nas/fast rw - xfs /dev/nvme0n1 rw\n"
+    )
+
+    def setUp(self):
+        """테스트 환경 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.mountinfo = os.path.join(self.temp_dir, "mountinfo")
+        with open(self.mountinfo, "w") as f:
+            f.write(self.MOUNTINFO)
+
+        # sda (회전식, 파티션 sda1), sdb (회전식), nvme0n1 (SSD)
+        block = os.path.join(self.temp_dir, "block")
+        devices = os.path.join(self.temp_dir, "devices")
+        for disk, rotational, parts in (
+            ("sda", "1", {"8:1": "sda1"}),
+            ("sdb", "1", {"8:17": "sdb1"}),
+            ("nvme0n1", "0", {}),
+        ):
+            os.makedirs(os.path.join(devices, disk, "queue"))
+            with open(os.path.join(devices, disk, "queue", "rotational"), "w") as f:
+                f.write(rotational + "\n")
+            for dev_id, part in parts.items():
+                os.makedirs(os.path.join(devices, disk, part))
+                os.makedirs(block, exist_ok=True)
+                os.symlink(os.path.join(devices, disk, part), os.path.join(block, dev_id))
+        os.symlink(os.path.join(devices, "nvme0n1"), os.path.join(block, "259:0"))
+
+        self.profiler = DeviceProfiler(self.mountinfo, block)
+
+    def tearDown(self):
+        """테스트 후 정리"""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_network_mounts(self):
+        """NFS/CIFS/원격 FUSE 마운트 판별 테스트"""
+        self.assertTrue(self.profiler.profile("/mnt/nas/movie.mkv").is_network)
+        self.assertTrue(self.profiler.profile("/mnt/share/a/b.txt").is_network)
+        self.assertTrue(self.profiler.profile("/mnt/remote/x").is_network)
+        self.assertTrue(self.profiler.profile("/mnt/other/x").is_network)
+        self.assertTrue(self.profiler.profile("/mnt/export/x").is_network)
+        self.assertFalse(self.profiler.profile("/mnt/local/x").is_network)
+        # mergerfs 같은 로컬 합치기 마운트 (disk1:disk2)
+        self.assertFalse(self.profiler.profile("/mnt/pool/x").is_network)
+        self.assertFalse(self.profiler.profile("/home/user").is_network)
+        with patch("src.utils.device_profile.platform.system", return_value="Windows"):
+            self.assertTrue(
+                self.profiler.profile("\\\\server\\share\\a.txt").is_network
+            )
+
+    def test_unc_mount_point_per_share(self):
+        """UNC 경로는 \\\\server\\share 단위로 마운트 지점을 구분하는지 테스트"""
+        with patch("src.utils.device_profile.platform.system", return_value="Windows"):
+            nas = self.profiler.profile("\\\\nas\\media\\a.mkv")
+            wan = self.profiler.profile("\\\\remote\\backup\\b.zip")
+            same = self.profiler.profile("//NAS/Media/sub/c.mkv")
+
+        self.assertEqual(nas.mount_point, "\\\\nas\\media")
+        self.assertNotEqual(nas.mount_point, wan.mount_point)
+        self.assertEqual(same.mount_point, nas.mount_point)
+
+    def test_double_slash_is_local_on_posix(self):
+        """POSIX에서 //로 시작하는 경로는 UNC가 아닌 일반 경로로 판별 테스트"""
+        with patch("src.utils.device_profile.platform.system", return_value="Linux"):
+            profile = self.profiler.profile("//home/user")
+        self.assertEqual(profile.mount_point, "/")
+        self.assertFalse(profile.is_network)
+
+    def test_longest_mount_and_rotational(self):
+        """가장 긴 마운트 지점 선택과 회전식 디스크 판별 테스트"""
+        root = self.profiler.profile("/home/user/a.txt")
+        self.assertEqual(root, DeviceProfile("/", "ext4", "/dev/sda1", False, True))
+
+        usb = self.profiler.profile("/mnt/usb disk/photos")
+        self.assertEqual(usb.mount_point, "/mnt/usb disk")
+        self.assertTrue(usb.rotational)
+
+        # 네트워크 마운트 아래의 로컬 SSD
+        fast = self.profiler.profile("/mnt/nas/fast/video")
+        self.assertEqual(fast.fs_type, "xfs")
+        self.assertFalse(fast.is_network)
+        self.assertFalse(fast.rotational)
+
+        # 경계가 맞지 않는 접두사는 다른 마운트
+        self.assertEqual(self.profiler.profile("/mnt/nasty").mount_point, "/")
+
+    def test_policies(self):
+        """장치별 스캔 스레드 수 / 멀티스레드 복사 / 검증 방식 테스트"""
+        nas = self.profiler.profile("/mnt/nas/a")
+        hdd = self.profiler.profile("/home/a")
+        ssd = self.profiler.profile("/mnt/nas/fast/a")
+
+        # 설정값은 상한 (네트워크라도 늘리지 않음)
+        self.assertEqual(nas.scan_workers(8), 8)
+        self.assertEqual(nas.scan_workers(2), 2)
+        self.assertEqual(hdd.scan_workers(1), 1)
+        self.assertEqual(hdd.scan_workers(8), 2)
+        self.assertEqual(ssd.scan_workers(8), 8)
+
+        self.assertFalse(nas.allows_multithread_copy)
+        self.assertFalse(hdd.allows_multithread_copy)
+        self.assertTrue(ssd.allows_multithread_copy)
+
+        self.assertTrue(nas.needs_full_verify)
+        self.assertFalse(ssd.needs_full_verify)
+
+    def test_cache(self):
+        """마운트 목록 캐시와 clear 테스트"""
+        self.assertEqual(self.profiler.profile("/mnt/nas/a").fs_type, "nfs4")
+
+        with open(self.mountinfo, "w") as f:
+            f.write("22 1 8:1 / / rw - ext4 /dev/sda1 rw\n")
+        self.assertEqual(self.profiler.profile("/mnt/nas/a").fs_type, "nfs4")
+
+        self.profiler.clear()
+        self.assertEqual(self.profiler.profile("/mnt/nas/a").fs_type, "ext4")
+
+
+class TestScanProgressEstimator(unittest.TestCase):
+    """ScanProgressEstimator 클래스 테스트"""
+
+    def setUp(self):
+        """테스트 환경 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.counts_file = os.path.join(self.temp_dir, "scan_counts.json")
+        self.source = os.path.join(self.temp_dir, "source")
+
+    def tearDown(self):
+        """테스트 후 정리"""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_first_scan_uses_directories(self):
+        """첫 스캔은 폴더 진행 비율 사용 테스트"""
+        progress = ScanProgressEstimator(self.source, counts_file=self.counts_file)
+        self.assertIsNone(progress.previous_count)
+
+        progress.update(files_found=50, dirs_completed=3, dirs_discovered=10)
+        self.assertEqual(progress.estimate(), (3, 10))
+
+    def test_partial_counts_not_used(self):
+        """전체 파일 수가 아닌 스캔(파일명 우선)은 이전 파일 수를 쓰거나 저장하지 않음"""
+        progress = ScanProgressEstimator(self.source, counts_file=self.counts_file)
+        progress.update(files_found=200, dirs_completed=10, dirs_discovered=10)
+        progress.save()
+
+        progress = ScanProgressEstimator(
+            self.source, counts_file=self.counts_file, counts_all_files=False
+        )
+        self.assertIsNone(progress.previous_count)
+        progress.update(files_found=5, dirs_completed=3, dirs_discovered=10)
+        self.assertEqual(progress.estimate(), (3, 10))
+        progress.save()
+
+        progress = ScanProgressEstimator(self.source, counts_file=self.counts_file)
+        self.assertEqual(progress.previous_count, 200)
+
+    def test_previous_count_used_after_save(self):
+        """이전 스캔 파일 수 사용 테스트"""
+        progress = ScanProgressEstimator(self.source, counts_file=self.counts_file)
+        progress.update(files_found=200, dirs_completed=10, dirs_discovered=10)
+        progress.save()
+
+        progress = ScanProgressEstimator(self.source, counts_file=self.counts_file)
+        self.assertEqual(progress.previous_count, 200)
+
+        progress.update(files_found=50, dirs_completed=1, dirs_discovered=10)
+        self.assertEqual(progress.estimate(), (50, 200))
+
+        # 이전보다 파일이 늘어난 경우
+        progress.update(files_found=250, dirs_completed=9, dirs_discovered=10)
+        self.assertEqual(progress.estimate(), (250, 250))
+
+        # 하위 폴더 옵션이 다르면 별도로 저장
+        progress = ScanProgressEstimator(
+            self.source, include_subfolders=False, counts_file=self.counts_file
+        )
+        self.assertIsNone(progress.previous_count)
+
+    def test_callback_throttled(self):
+        """진행률 콜백 업데이트 간격 제한 테스트"""
+        calls = []
+        progress = ScanProgressEstimator(
+            self.source,
+            callback=lambda *args: calls.append(args),
+            counts_file=self.counts_file,
+        )
+        for index in range(100):
+            progress.update(index, index, 100)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0][:2], (0, 100))
+
+
+class TestScanIndex(unittest.TestCase):
+    """ScanIndex 증분 스캔 테스트"""
+
+    def setUp(self):
+        """테스트 환경 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.source = os.path.join(self.temp_dir, "source")
+        for folder in ["a", os.path.join("a", "b"), "c"]:
+            os.makedirs(os.path.join(self.source, folder))
+            for name in ["report.txt", "image.png", "memo.txt"]:
+                with open(os.path.join(self.source, folder, name), "w") as f:
+                    f.write(folder)
+
+        # 방금 바뀐 폴더는 색인을 믿지 않으므로 수정시간을 1분 전으로
+        old = time.time() - 60
+        for folder in ["", "a", os.path.join("a", "b"), "c"]:
+            os.utime(os.path.join(self.source, folder), (old, old))
+
+        self.matcher = FileMatcher()
+        self.rules = {"report": {"dest": "/dest", "match_mode": "포함"}}
+        self.scan_index = ScanIndex(os.path.join(self.temp_dir, "index.sqlite3"))
+
+    def tearDown(self):
+        """테스트 후 정리"""
+        self.scan_index.close()
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def _scan(self, rules=None, use_index=True):
+        """스캔 후 (레코드 집합, 목록 조회한 폴더 수) 반환"""
+        listed = []
+        original = DirectoryScanner.list_directory
+
+        def counting_list_directory(scanner, path, *args):
+            listed.append(path)
+            return original(scanner, path, *args)
+
+        with patch.object(DirectoryScanner, "list_directory", counting_list_directory):
+            records = set(
+                self.matcher.find_matching_records(
+                    self.source,
+                    rules or self.rules,
+                    scan_index=self.scan_index if use_index else None,
+                )
+            )
+        return records, len(listed)
+
+    def _touch_dir(self, path):
+        """폴더 수정시간을 확실히 바꾸기"""
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    def test_same_result_as_full_scan(self):
+        """색인 사용 결과가 전체 스캔과 같은지 테스트"""
+        full, _ = self._scan(use_index=False)
+        first, first_listed = self._scan()
+        second, second_listed = self._scan()
+
+        self.assertEqual(len(full), 3)
+        self.assertEqual(first, full)
+        self.assertEqual(second, full)
+        self.assertEqual(first_listed, 4)
+        # 바뀌지 않은 폴더는 다시 조회하지 않음
+        self.assertEqual(second_listed, 0)
+
+    def test_changed_directory_rescanned(self):
+        """파일이 추가된 폴더만 다시 조회하는지 테스트"""
+        self._scan()
+
+        folder = os.path.join(self.source, "c")
+        with open(os.path.join(folder, "report_new.txt"), "w") as f:
+            f.write("new")
+        self._touch_dir(folder)
+
+        records, listed = self._scan()
+        self.assertEqual(listed, 1)
+        self.assertIn(
+            os.path.join(folder, "report_new.txt"), {r.path for r in records}
+        )
+        self.assertEqual(records, self._scan(use_index=False)[0])
+
+    def test_racy_directory_rescanned(self):
+        """조회 직전에 바뀐 폴더는 수정시간이 같아도 다시 조회하는지 테스트"""
+        folder = os.path.join(self.source, "c")
+        now = time.time()
+        os.utime(folder, (now, now))
+        self._scan()
+
+        # 같은 시간 단위 안에 파일이 추가되어 수정시간이 그대로인 경우
+        st = os.stat(folder)
+        with open(os.path.join(folder, "report_new.txt"), "w") as f:
+            f.write("new")
+        os.utime(folder, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        records, listed = self._scan()
+        self.assertEqual(listed, 1)
+        self.assertIn(
+            os.path.join(folder, "report_new.txt"), {r.path for r in records}
+        )
+
+        # 시간 단위가 지난 뒤의 조회는 다시 믿음
+        old = now - 60
+        os.utime(folder, (old, old))
+        self._scan()
+        self.assertEqual(self._scan()[1], 0)
+
+    def test_rules_change_without_listing(self):
+        """규칙이 바뀌면 목록 조회 없이 다시 매칭하는지 테스트"""
+        self._scan()
+
+        rules = {"memo": {"dest": "/memo", "match_mode": "시작"}}
+        records, listed = self._scan(rules)
+
+        self.assertEqual(listed, 0)
+        self.assertEqual(records, self._scan(rules, use_index=False)[0])
+        self.assertTrue(all(r.size > 0 for r in records))
+
+        # 원래 규칙으로 돌아와도 같은 결과
+        self.assertEqual(self._scan()[0], self._scan(use_index=False)[0])
+
+    def test_removed_directory_forgotten(self):
+        """삭제된 폴더의 색인 정리 테스트"""
+        self._scan()
+
+        shutil.rmtree(os.path.join(self.source, "a"))
+        records, _ = self._scan()
+
+        self.assertEqual(len(records), 1)
+        self.assertIsNone(self.scan_index.lookup(os.path.join(self.source, "a")))
+        self.assertIsNone(
+            self.scan_index.lookup(os.path.join(self.source, "a", "b"))
+        )
+
+
 class TestFileMonitor(unittest.TestCase):
     """파일 모니터링 테스트"""
 
@@ -645,32 +2094,45 @@ class TestAutoOrganizer(unittest.TestCase):
             "대상 폴더에 파일이 없습니다"
         )
 
+    def test_process_file_uses_rule_order(self):
+        """자동 정리가 규칙 순서대로 첫 매칭 규칙을 사용하는지 테스트"""
+        other_dest = os.path.join(self.temp_dir, "other")
+        os.makedirs(other_dest)
+        self.rule_manager.add_rule("report", self.dest_dir, "포함")
+        self.rule_manager.add_rule(r"^report_\d+", other_dest, "정규식")
+
+        test_file = os.path.join(self.source_dir, "report_2025.txt")
+        with open(test_file, "w") as f:
+            f.write("test content")
+
+        self.auto_organizer._process_file(test_file)
+
+        self.assertFalse(os.path.exists(test_file))
+        self.assertTrue(os.path.exists(os.path.join(self.dest_dir, "report_2025.txt")))
+
     def test_match_file_methods(self):
-        """파일 매칭 메서드 테스트"""
-        # 포함
-        self.assertTrue(
-            self.auto_organizer._match_file("test_document.txt", "doc", "포함")
-        )
-        
-        # 정확히
-        self.assertTrue(
-            self.auto_organizer._match_file("report.txt", "report", "정확히")
-        )
-        
-        # 시작
-        self.assertTrue(
-            self.auto_organizer._match_file("report_2025.txt", "report", "시작")
-        )
-        
-        # 끝
-        self.assertTrue(
-            self.auto_organizer._match_file("annual_report.txt", "report", "끝")
-        )
-        
-        # 정규식
-        self.assertTrue(
-            self.auto_organizer._match_file("2025_01_report.txt", r"^\d{4}_", "정규식")
-        )
+        """매칭 방식별 자동 정리 테스트 (규칙 변경 후 다시 컴파일된 규칙 사용)"""
+        cases = [
+            ("test_document.txt", "doc", "포함"),
+            ("report.txt", "report", "정확히"),
+            ("report_2025.txt", "report", "시작"),
+            ("annual_report.txt", "report", "끝"),
+            ("2025_01_report.txt", r"^\d{4}_", "정규식"),
+        ]
+        for filename, keyword, match_mode in cases:
+            with self.subTest(match_mode=match_mode):
+                dest = os.path.join(self.dest_dir, match_mode)
+                os.makedirs(dest)
+                self.rule_manager.add_rule(keyword, dest, match_mode)
+
+                test_file = os.path.join(self.source_dir, filename)
+                with open(test_file, "w") as f:
+                    f.write("test content")
+                self.auto_organizer._process_file(test_file)
+
+                self.assertFalse(os.path.exists(test_file))
+                self.assertTrue(os.path.exists(os.path.join(dest, filename)))
+                self.rule_manager.delete_rule(keyword)
 
 
 class TestBenchmark(unittest.TestCase):
@@ -713,6 +2175,34 @@ class TestBenchmark(unittest.TestCase):
         self.assertIn("file_count", result)
         self.assertEqual(result["file_count"], 3)
 
+    def test_benchmark_rule_matching(self):
+        """규칙 매칭 벤치마크 테스트"""
+        result = self.benchmark.benchmark_rule_matching(rule_count=50, file_count=500)
+
+        self.assertTrue(result["consistent"])
+        self.assertGreater(result["matched_count"], 0)
+        self.assertIn("speedup", result)
+
+    def test_benchmark_regex_matching(self):
+        """정규식 매칭 벤치마크 테스트"""
+        result = self.benchmark.benchmark_regex_matching(
+            pattern_count=20, file_count=200
+        )
+
+        self.assertTrue(result["consistent"])
+        self.assertIn("combined_time", result)
+
+    def test_benchmark_scan_strategies(self):
+        """파일 필터링 순서 벤치마크 테스트"""
+        result = self.benchmark.benchmark_scan_strategies(
+            file_count=300, match_ratio=0.1, dir_count=5, repeat=1
+        )
+
+        self.assertTrue(result["consistent"])
+        self.assertGreater(result["matched_count"], 0)
+        self.assertIn("name_first_time", result)
+        self.assertIn("metadata_first_time", result)
+
     def test_benchmark_stop(self):
         """벤치마크 중지 테스트"""
         self.benchmark.stop_benchmark()
@@ -923,6 +2413,318 @@ class TestIntegration(unittest.TestCase):
         self.assertEqual(len(moved_files), file_count)
 
 
+class TestFileListModel(unittest.TestCase):
+    """FileListModel 클래스 테스트 (가상 파일 목록 모델)"""
+
+    def setUp(self):
+        """테스트 환경 설정"""
+        self.model = FileListModel()
+        self.folder = os.path.join("data", "docs")
+        self.model.extend(
+            [
+                ScanRecord(
+                    os.path.join(self.folder, f"file_{i}.txt"),
+                    os.path.join("dest", "Docs"),
+                    "file",
+                    "포함",
+                    i * 1024,
+                    1700000000.0 + i,
+                    100 + i,
+                )
+                for i in range(10)
+            ]
+        )
+
+    def test_extend_checks_rows(self):
+        """추가한 행은 체크된 상태로 모두 표시 테스트"""
+        self.assertEqual(len(self.model), 10)
+        self.assertEqual(self.model.view_count, 10)
+        self.assertEqual(self.model.checked_count, 10)
+        self.assertEqual(self.model.row_at(3), 3)
+        self.assertEqual(self.model.get(3)["filename"], "file_3.txt")
+
+    def test_columns_and_shared_values(self):
+        """열 저장과 폴더/규칙 공유 테스트"""
+        self.assertEqual(self.model.dirs, [self.folder])
+        self.assertEqual(len(self.model.rules), 1)
+        self.assertEqual(list(self.model.sizes[:3]), [0, 1024, 2048])
+        self.assertEqual(self.model.path(2), os.path.join(self.folder, "file_2.txt"))
+
+        file_info = self.model.get(2)
+        self.assertEqual(file_info["size"], "2.0 KB")
+        self.assertEqual(file_info["size_bytes"], 2048)
+        self.assertEqual(file_info["mtime"], 1700000002.0)
+        self.assertEqual(file_info["inode"], 102)
+        self.assertEqual(file_info["rule"], "file (포함)")
+        self.assertEqual(file_info["destination"], "Docs")
+        self.assertEqual(file_info["dest_folder"], os.path.join("dest", "Docs"))
+
+        values = self.model.display_values(2)
+        self.assertEqual(values[0], "file_2.txt")
+        self.assertEqual(values[1:], (
+            file_info["size"],
+            file_info["modified"],
+            file_info["rule"],
+            file_info["destination"],
+        ))
+
+    def test_destination_label_once_per_rule(self):
+        """대상 표시 문자열은 규칙마다 한 번만 계산 테스트"""
+        calls = []
+
+        def label(dest):
+            calls.append(dest)
+            return "삭제"
+
+        model = FileListModel()
+        records = [
+            ScanRecord(f"a{i}.txt", "dest", "a", "시작", 0, 0, 0) for i in range(5)
+        ]
+        model.extend(records, label)
+        model.extend(records, label)
+
+        self.assertEqual(calls, ["dest"])
+        self.assertEqual(model.get(7)["destination"], "삭제")
+
+    def test_toggle_and_counts(self):
+        """체크 토글과 선택 개수 테스트"""
+        self.assertFalse(self.model.toggle(2))
+        self.assertFalse(self.model.is_checked(2))
+        self.model.set_checked(5, False)
+        self.model.set_checked(5, False)  # 같은 값은 개수에 영향 없음
+
+        self.assertEqual(self.model.checked_count, 8)
+        self.assertEqual(self.model.visible_checked_count(), 8)
+        self.assertEqual(
+            self.model.visible_checked_rows(), [0, 1, 3, 4, 6, 7, 8, 9]
+        )
+
+        self.assertTrue(self.model.toggle(2))
+        self.assertEqual(self.model.checked_count, 9)
+
+    def test_view(self):
+        """필터 결과(표시 목록) 테스트"""
+        self.model.set_checked(4, False)
+        self.model.set_view([2, 4, 8])
+
+        self.assertEqual(self.model.view_count, 3)
+        self.assertEqual(self.model.row_at(2), 8)
+        self.assertEqual(self.model.visible_checked_rows(), [2, 8])
+        self.assertEqual(self.model.visible_checked_count(), 2)
+
+        # 표시 중인 행의 체크 변경은 개수에 바로 반영, 숨겨진 행은 무시
+        self.model.set_checked(8, False)
+        self.model.set_checked(5, False)
+        self.assertEqual(self.model.visible_checked_count(), 1)
+        self.assertEqual(self.model.checked_count, 7)
+        self.model.toggle(8)
+        self.assertEqual(self.model.visible_checked_rows(), [2, 8])
+
+        # 필터 중 추가된 행은 표시 목록 끝에 붙음
+        self.model.extend(
+            [ScanRecord(os.path.join("other", "new.txt"), "", "new", "시작", 1, 1.0, 1)]
+        )
+        self.assertEqual(self.model.view_count, 4)
+        self.assertEqual(self.model.row_at(3), 10)
+        self.assertEqual(self.model.visible_checked_count(), 3)
+        self.assertEqual(self.model.visible_checked_rows(), [2, 8, 10])
+
+        self.model.set_view(None)
+        self.assertEqual(self.model.view_count, 11)
+
+    def test_filter_rows_matches_brute_force(self):
+        """색인 필터 결과가 모든 행을 직접 확인한 결과와 같은지 테스트"""
+        import random
+
+        rng = random.Random(7)
+        mb = FileListModel.MB
+        exts = [".txt", ".JPG", ".pdf", ""]
+        model = FileListModel()
+        model.extend(
+            [
+                ScanRecord(
+                    f"dir{i % 3}/Report_{i}{exts[i % 4]}",
+                    "dest",
+                    f"kw{i % 5}",
+                    "포함",
+                    rng.choice([0, mb - 1, mb, 10 * mb, 10 * mb + 1, 200 * mb]),
+                    rng.uniform(0, 2000),
+                    i,
+                )
+                for i in range(500)
+            ]
+        )
+
+        conditions = [
+            {"text": "REPORT_1"},
+            {"text": "report_49"},  # 드문 매칭 (이어붙인 문자열 검색)
+            {"ext": ".jpg"},
+            {"ext": ".none"},
+            {"keyword": "kw2"},
+            {"size_range": FileListModel.SIZE_RANGES["< 1MB"]},
+            {"size_range": FileListModel.SIZE_RANGES["1-10MB"]},
+            {"size_range": FileListModel.SIZE_RANGES["> 100MB"]},
+            {"mtime_range": (500.0, 1500.0)},
+            {"mtime_range": (1900.0, None)},
+            {
+                "text": "_2",
+                "ext": ".txt",
+                "keyword": "kw3",
+                "size_range": FileListModel.SIZE_RANGES["10-100MB"],
+                "mtime_range": (100.0, 1800.0),
+            },
+        ]
+
+        def expected(
+            row, text="", ext=None, size_range=None, mtime_range=None, keyword=None
+        ):
+            name = model.names[row]
+            if text and text.lower() not in name.lower():
+                return False
+            if ext is not None and os.path.splitext(name)[1].lower() != ext:
+                return False
+            if keyword is not None and model.rule(row)[0] != keyword:
+                return False
+            for value, value_range in (
+                (model.sizes[row], size_range),
+                (model.mtimes[row], mtime_range),
+            ):
+                if value_range:
+                    low, high = value_range
+                    if low is not None and value < low:
+                        return False
+                    if high is not None and value >= high:
+                        return False
+            return True
+
+        for condition in conditions:
+            self.assertEqual(
+                model.filter_rows(**condition),
+                [row for row in range(len(model)) if expected(row, **condition)],
+                condition,
+            )
+
+        # 조건이 없으면 전체 표시
+        self.assertIsNone(model.filter_rows())
+
+        # 행이 추가되면 색인도 갱신
+        model.extend([ScanRecord("new.jpg", "dest", "kw0", "포함", 1, 1.0, 1)])
+        self.assertIn(500, model.filter_rows(ext=".jpg"))
+        self.assertIn(500, model.filter_rows(size_range=(None, 2)))
+
+    def test_text_filter_reuses_previous_result(self):
+        """검색어가 이어지면 직전 결과 안에서만 찾는지 테스트"""
+        model = FileListModel()
+        names = ["Alpha.txt", "alphabet.TXT", "beta.txt", "ALPS.jpg", "gamma"]
+        model.extend(
+            [ScanRecord(name, "dest", "kw", "포함", 1, 1.0, 1) for name in names]
+        )
+
+        self.assertEqual(model.filter_rows(text="alp"), [0, 1, 3])
+
+        # 직전 결과 밖의 행은 다시 확인하지 않음
+        with patch.object(
+            model, "_filter_text", wraps=model._filter_text
+        ) as filter_text:
+            self.assertEqual(model.filter_rows(text="ALPHA"), [0, 1])
+            self.assertEqual(filter_text.call_args[0][0], [0, 1, 3])
+
+        # 조건이 바뀌거나 검색어가 이어지지 않으면 처음부터 검색
+        self.assertEqual(model.filter_rows(text="alpha", ext=".txt"), [0, 1])
+        self.assertEqual(model.filter_rows(text="a"), [0, 1, 2, 3, 4])
+        self.assertEqual(model.filter_rows(text="ta.t"), [2])
+
+        # 행이 추가되면 직전 결과를 쓰지 않음
+        model.extend([ScanRecord("alphaville", "dest", "kw", "포함", 1, 1.0, 1)])
+        self.assertEqual(model.filter_rows(text="alpha"), [0, 1, 5])
+
+        # 검색어가 행 경계를 넘어 매칭되지 않음
+        self.assertEqual(model.filter_rows(text="txtalphabet"), [])
+        self.assertEqual(model.filter_rows(text="gamma\0"), [])
+
+    def test_lower_names_share_lowercase_strings(self):
+        """이미 소문자인 파일명은 문자열을 공유하는지 테스트"""
+        self.model.extend(
+            [ScanRecord("a/MixedCase.txt", "dest", "kw", "포함", 1, 1.0, 1)]
+        )
+        self.model.filter_rows(text="file")
+
+        self.assertIs(self.model.lower_names[0], self.model.names[0])
+        self.assertEqual(self.model.lower_names[-1], "mixedcase.txt")
+
+    def test_size_and_date_ranges(self):
+        """크기/날짜 필터 범위 테스트"""
+        from datetime import datetime
+
+        mb = FileListModel.MB
+        low, high = FileListModel.SIZE_RANGES["1-10MB"]
+        self.assertTrue(low <= mb < high)
+        self.assertTrue(low <= 10 * mb < high)
+        self.assertFalse(10 * mb + 1 < high)
+
+        now = datetime(2024, 12, 18, 15, 30)  # 수요일
+        start, end = FileListModel.date_range("오늘", now)
+        self.assertEqual(start, datetime(2024, 12, 18).timestamp())
+        self.assertEqual(end, datetime(2024, 12, 19).timestamp())
+
+        start, end = FileListModel.date_range("이번 주", now)
+        self.assertEqual(start, datetime(2024, 12, 16, 15, 30).timestamp())
+        self.assertIsNone(end)
+
+        start, end = FileListModel.date_range("이번 달", now)
+        self.assertEqual(end, datetime(2025, 1, 1).timestamp())
+
+        start, end = FileListModel.date_range("올해", now)
+        self.assertEqual(start, datetime(2024, 1, 1).timestamp())
+
+        self.assertIsNone(FileListModel.date_range("모든 날짜", now))
+
+    def test_filter_options(self):
+        """확장자/키워드 목록 테스트"""
+        self.model.extend(
+            [ScanRecord("a/photo.JPG", "dest", "photo", "시작", 1, 1.0, 1)]
+        )
+        self.assertEqual(self.model.extensions(), [".jpg", ".txt"])
+        self.assertEqual(self.model.keywords(), ["file", "photo"])
+
+    def test_set_visible_checked(self):
+        """표시 중인 행 전체 선택/해제 테스트"""
+        # 필터가 없으면 전체
+        self.model.set_visible_checked(False)
+        self.assertEqual(self.model.checked_count, 0)
+        self.assertEqual(self.model.visible_checked_rows(), [])
+        self.model.set_visible_checked(True)
+        self.assertEqual(self.model.checked_count, 10)
+
+        # 필터 중에는 표시 중인 행만 바뀜
+        self.model.set_checked(3, False)
+        self.model.set_view([1, 3, 5])
+        self.model.set_visible_checked(False)
+        self.assertEqual(self.model.visible_checked_count(), 0)
+        self.assertEqual(self.model.checked_count, 7)
+        self.assertTrue(self.model.is_checked(0))
+
+        self.model.set_visible_checked(True)
+        self.assertEqual(self.model.visible_checked_rows(), [1, 3, 5])
+        self.assertEqual(self.model.checked_count, 10)
+
+        # 이후 개별 변경도 개수에 반영
+        self.model.toggle(5)
+        self.assertEqual(self.model.visible_checked_count(), 2)
+        self.model.set_view(None)
+        self.assertEqual(self.model.visible_checked_count(), 9)
+
+    def test_clear(self):
+        """모든 행 삭제 테스트"""
+        self.model.set_view([1])
+        self.model.clear()
+
+        self.assertEqual(len(self.model), 0)
+        self.assertEqual(self.model.view_count, 0)
+        self.assertEqual(self.model.checked_count, 0)
+        self.assertEqual(self.model.visible_checked_rows(), [])
+
+
 class TestUI(unittest.TestCase):
     """UI 컴포넌트 테스트 (기본적인 테스트만)"""
 
@@ -1020,15 +2822,27 @@ def run_all_tests():
     # 각 테스트 클래스 추가
     test_classes = [
         TestFileMatcher,
+        TestDirectoryScanner,
+        TestCompiledRuleSet,
+        TestAhoCorasickIndex,
+        TestKeywordTrie,
+        TestRegexIndex,
         TestFileProcessor,
         TestRuleManager,
         TestConfigManager,
         TestValidator,
         TestPerformanceUtils,
+        TestBufferPool,
+        TestResultStream,
+        TestScanProgressEstimator,
+        TestChunkSizeTuner,
+        TestDeviceProfiler,
+        TestScanIndex,
         TestFileMonitor,
         TestAutoOrganizer,
         TestBenchmark,
         TestIntegration,
+        TestFileListModel,
         TestUI,
     ]
 